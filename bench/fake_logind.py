@@ -0,0 +1,193 @@
+"""
+A logind stand-in on a private D-Bus bus, for exercising SessionState.
+
+Serves `org.freedesktop.login1` with just enough of the Manager and Session
+interfaces: `GetSessionByPID` and `GetSession`, the session's `LockedHint`
+and `IdleHint` properties (with PropertiesChanged), `SetLockedHint` and
+`SetIdleHint` to flip them, and the manager's `PrepareForSleep` signal
+through an extra `org.hyprgtk4.FakeControl.PrepareForSleep` method.
+
+    python -m bench.fake_logind --check
+    python -m bench.fake_logind --address "$ADDRESS"
+
+`--check` runs SessionState against the stand-in in this process and
+verifies that locking, idling and sleeping suspend it and that it resumes.
+SessionState only makes asynchronous calls, so sharing the main loop is fine.
+"""
+import argparse
+import signal
+import sys
+from typing import Optional
+
+import gi
+gi.require_version('Gio', '2.0')
+from gi.repository import Gio, GLib
+
+from bench.fake_mpris import connect, start_private_bus
+
+LOGIND_NAME = "org.freedesktop.login1"
+LOGIND_PATH = "/org/freedesktop/login1"
+SESSION_PATH = "/org/freedesktop/login1/session/fake"
+MANAGER_IFACE = "org.freedesktop.login1.Manager"
+SESSION_IFACE = "org.freedesktop.login1.Session"
+CONTROL_IFACE = "org.hyprgtk4.FakeControl"
+
+LOGIND_NODE = Gio.DBusNodeInfo.new_for_xml(f"""
+<node>
+    <interface name="{MANAGER_IFACE}">
+        <method name="GetSessionByPID">
+            <arg direction="in" type="u" name="pid"/>
+            <arg direction="out" type="o" name="session"/>
+        </method>
+        <method name="GetSession">
+            <arg direction="in" type="s" name="id"/>
+            <arg direction="out" type="o" name="session"/>
+        </method>
+        <signal name="PrepareForSleep">
+            <arg type="b" name="start"/>
+        </signal>
+    </interface>
+    <interface name="{CONTROL_IFACE}">
+        <method name="PrepareForSleep">
+            <arg direction="in" type="b" name="start"/>
+        </method>
+    </interface>
+</node>
+""")
+SESSION_NODE = Gio.DBusNodeInfo.new_for_xml(f"""
+<node>
+    <interface name="{SESSION_IFACE}">
+        <method name="SetLockedHint">
+            <arg direction="in" type="b" name="locked"/>
+        </method>
+        <method name="SetIdleHint">
+            <arg direction="in" type="b" name="idle"/>
+        </method>
+        <property name="LockedHint" type="b" access="read"/>
+        <property name="IdleHint" type="b" access="read"/>
+    </interface>
+</node>
+""")
+
+
+class FakeLogind:
+    """One session whose lock and idle hints can be set over D-Bus or directly."""
+
+    def __init__(self, conn: Gio.DBusConnection):
+        self._conn = conn
+        self.hints = {"LockedHint": False, "IdleHint": False}
+
+        for interface in LOGIND_NODE.interfaces:
+            conn.register_object(LOGIND_PATH, interface, self._on_call)
+        conn.register_object(SESSION_PATH, SESSION_NODE.interfaces[0], self._on_call, self._on_get_property)
+        Gio.bus_own_name_on_connection(conn, LOGIND_NAME, Gio.BusNameOwnerFlags.NONE, None, None)
+
+    # --- Actions ---
+
+    def set_hint(self, name: str, value: bool):
+        if self.hints[name] != value:
+            self.hints[name] = value
+            self._conn.emit_signal(
+                None, SESSION_PATH, "org.freedesktop.DBus.Properties", "PropertiesChanged",
+                GLib.Variant("(sa{sv}as)", (SESSION_IFACE, {name: GLib.Variant("b", value)}, [])),
+            )
+
+    def prepare_for_sleep(self, start: bool):
+        self._conn.emit_signal(None, LOGIND_PATH, MANAGER_IFACE, "PrepareForSleep", GLib.Variant("(b)", (start,)))
+
+    # --- D-Bus ---
+
+    def _on_get_property(self, conn, sender, path, interface, name, user_data=None):
+        return GLib.Variant("b", self.hints[name])
+
+    def _on_call(self, conn, sender, path, interface, method, params, invocation, user_data=None):
+        args = params.unpack()
+        result = None
+
+        match method:
+            case "GetSessionByPID" | "GetSession":
+                result = GLib.Variant("(o)", (SESSION_PATH,))
+            case "SetLockedHint":
+                self.set_hint("LockedHint", args[0])
+            case "SetIdleHint":
+                self.set_hint("IdleHint", args[0])
+            case "PrepareForSleep":
+                self.prepare_for_sleep(args[0])
+
+        invocation.return_value(result)
+
+
+def check(conn: Gio.DBusConnection, logind: FakeLogind) -> bool:
+    """Drive SessionState through lock, idle and sleep and check what it emits."""
+    from service.session import SessionState
+
+    session = SessionState(connection=conn)
+    emitted = []
+    session.connect("suspend", lambda _session: emitted.append("suspend"))
+    session.connect("resume", lambda _session: emitted.append("resume"))
+
+    steps = [
+        (lambda: logind.set_hint("LockedHint", True), ["suspend"]),
+        (lambda: logind.set_hint("IdleHint", True), []),  # already suspended
+        (lambda: logind.set_hint("LockedHint", False), []),  # still idle
+        (lambda: logind.set_hint("IdleHint", False), ["resume"]),
+        (lambda: logind.prepare_for_sleep(True), ["suspend"]),
+        (lambda: logind.prepare_for_sleep(False), ["resume"]),
+    ]
+    loop = GLib.MainLoop()
+    failures = []
+
+    def run(index):
+        if index > 0:
+            expected = steps[index - 1][1]
+            if emitted != expected:
+                failures.append(f"step {index}: expected {expected}, got {emitted}")
+        if index == len(steps):
+            loop.quit()
+            return False
+        emitted.clear()
+        steps[index][0]()
+        GLib.timeout_add(100, run, index + 1)
+        return False
+
+    # Give SessionState time to resolve its session and read the initial hints
+    GLib.timeout_add(200, run, 0)
+    loop.run()
+    session.cleanup()
+
+    for failure in failures:
+        print(failure)
+    print("ok" if not failures else "failed")
+    return not failures
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Serve a logind stand-in")
+    parser.add_argument("--address", help="bus address (default: start a private dbus-daemon)")
+    parser.add_argument("--check", action="store_true", help="check SessionState against it and exit")
+    args = parser.parse_args(argv)
+
+    daemon = None
+    address = args.address
+    if address is None:
+        daemon, address = start_private_bus()
+        print(f"DBUS_SYSTEM_BUS_ADDRESS={address}", flush=True)
+
+    conn = connect(address)
+    logind = FakeLogind(conn)
+    try:
+        if args.check:
+            sys.exit(0 if check(conn, logind) else 1)
+
+        loop = GLib.MainLoop()
+        GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGINT, loop.quit)
+        GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGTERM, loop.quit)
+        print("ready", flush=True)
+        loop.run()
+    finally:
+        if daemon is not None:
+            daemon.terminate()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,274 @@
+"""
+Scripted fake MPRIS players on a private D-Bus session bus.
+
+Run as a separate process (the bar makes synchronous D-Bus calls, so the
+players must not share its main loop):
+
+    python -m bench.fake_mpris --address "$ADDRESS" --players 3 --track-interval 5000
+
+Each player has its own bus connection, owns `org.mpris.MediaPlayer2.fake<N>`
+on it, serves art from local PNG files and can change tracks, seek and
+toggle play/pause on a schedule. The
+extra `org.hyprgtk4.FakeControl` interface lets a benchmark drive track
+changes and read how many D-Bus calls each player received.
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+from collections import Counter
+from typing import Optional
+
+import gi
+gi.require_version('GdkPixbuf', '2.0')
+from gi.repository import Gio, GLib, GdkPixbuf
+
+MPRIS_PATH = "/org/mpris/MediaPlayer2"
+MPRIS_NAME_PREFIX = "org.mpris.MediaPlayer2.fake"
+MPRIS_IFACE = "org.mpris.MediaPlayer2"
+PLAYER_IFACE = "org.mpris.MediaPlayer2.Player"
+CONTROL_IFACE = "org.hyprgtk4.FakeControl"
+
+DBUS_ASSETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dbus_assets")
+with open(os.path.join(DBUS_ASSETS, "org.mpris.MediaPlayer2.xml")) as f:
+    MPRIS_NODE = Gio.DBusNodeInfo.new_for_xml(f.read())
+CONTROL_NODE = Gio.DBusNodeInfo.new_for_xml(f"""
+<node>
+    <interface name="{CONTROL_IFACE}">
+        <method name="NextTrack"/>
+        <method name="SetPlaying">
+            <arg direction="in" type="b" name="playing"/>
+        </method>
+        <method name="Stats">
+            <arg direction="out" type="a{{su}}" name="calls"/>
+        </method>
+        <method name="ResetStats"/>
+    </interface>
+</node>
+""")
+
+
+def start_private_bus() -> tuple[subprocess.Popen, str]:
+    """Start a private dbus-daemon and return (process, address)."""
+    process = subprocess.Popen(
+        ["dbus-daemon", "--session", "--nofork", "--nopidfile", "--print-address=1"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    address = process.stdout.readline().strip()
+    if not address:
+        process.kill()
+        raise RuntimeError("dbus-daemon did not report an address")
+    return process, address
+
+
+def connect(address: str) -> Gio.DBusConnection:
+    """Open a message bus connection to `address`."""
+    return Gio.DBusConnection.new_for_address_sync(
+        address,
+        Gio.DBusConnectionFlags.AUTHENTICATION_CLIENT | Gio.DBusConnectionFlags.MESSAGE_BUS_CONNECTION,
+        None,
+        None,
+    )
+
+
+def make_art(directory: str, count: int) -> list[str]:
+    """Write `count` solid-colour 512x512 PNGs and return their paths."""
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"art-{i}.png")
+        if not os.path.exists(path):
+            pixbuf = GdkPixbuf.Pixbuf.new(GdkPixbuf.Colorspace.RGB, False, 8, 512, 512)
+            pixbuf.fill(((i * 0x3b) & 0xff) << 24 | ((i * 0x95) & 0xff) << 16 | ((i * 0x17) & 0xff) << 8 | 0xff)
+            pixbuf.savev(path, "png", [], [])
+        paths.append(path)
+    return paths
+
+
+class FakePlayer:
+    """A scripted org.mpris.MediaPlayer2 player."""
+
+    def __init__(self, conn: Gio.DBusConnection, index: int, art: list[str],
+                 track_length: int = 180 * 1000000):
+        self._conn = conn
+        self.index = index
+        self.name = f"{MPRIS_NAME_PREFIX}{index}"
+        self._art = art
+        self._track_length = track_length
+        self._track = 0
+        self._playing = True
+        self._anchor_position = 0
+        self._anchor_time = GLib.get_monotonic_time()
+        self.calls: Counter = Counter()
+
+        for interface in MPRIS_NODE.interfaces:
+            conn.register_object(MPRIS_PATH, interface, self._on_call)
+        conn.register_object(MPRIS_PATH, CONTROL_NODE.interfaces[0], self._on_call)
+        Gio.bus_own_name_on_connection(conn, self.name, Gio.BusNameOwnerFlags.NONE, None, None)
+
+    # --- State ---
+
+    @property
+    def position(self) -> int:
+        if not self._playing:
+            return self._anchor_position
+        elapsed = GLib.get_monotonic_time() - self._anchor_time
+        return min(self._anchor_position + elapsed, self._track_length)
+
+    def _set_position(self, position: int):
+        self._anchor_position = max(0, min(position, self._track_length))
+        self._anchor_time = GLib.get_monotonic_time()
+
+    def metadata(self) -> dict:
+        art = self._art[self._track % len(self._art)] if self._art else ""
+        return {
+            "mpris:trackid": GLib.Variant("o", f"/org/hyprgtk4/fake/track/{self._track}"),
+            "mpris:length": GLib.Variant("x", self._track_length),
+            "mpris:artUrl": GLib.Variant("s", f"file://{art}" if art else ""),
+            "xesam:title": GLib.Variant("s", f"Track {self._track}"),
+            "xesam:artist": GLib.Variant("as", [f"Fake Artist {self.index}"]),
+            "xesam:album": GLib.Variant("s", f"Fake Album {self._track // 10}"),
+        }
+
+    def properties(self, interface: str) -> dict:
+        if interface == MPRIS_IFACE:
+            return {
+                "CanQuit": GLib.Variant("b", False),
+                "CanRaise": GLib.Variant("b", False),
+                "HasTrackList": GLib.Variant("b", False),
+                "Identity": GLib.Variant("s", f"Fake Player {self.index}"),
+                "DesktopEntry": GLib.Variant("s", ""),
+                "SupportedUriSchemes": GLib.Variant("as", []),
+                "SupportedMimeTypes": GLib.Variant("as", []),
+            }
+        return {
+            "PlaybackStatus": GLib.Variant("s", "Playing" if self._playing else "Paused"),
+            "LoopStatus": GLib.Variant("s", "None"),
+            "Rate": GLib.Variant("d", 1.0),
+            "Shuffle": GLib.Variant("b", False),
+            "Metadata": GLib.Variant("a{sv}", self.metadata()),
+            "Volume": GLib.Variant("d", 1.0),
+            "Position": GLib.Variant("x", self.position),
+            "MinimumRate": GLib.Variant("d", 1.0),
+            "MaximumRate": GLib.Variant("d", 1.0),
+            "CanGoNext": GLib.Variant("b", True),
+            "CanGoPrevious": GLib.Variant("b", True),
+            "CanPlay": GLib.Variant("b", True),
+            "CanPause": GLib.Variant("b", True),
+            "CanSeek": GLib.Variant("b", True),
+            "CanControl": GLib.Variant("b", True),
+        }
+
+    def _emit_changed(self, *names: str):
+        props = self.properties(PLAYER_IFACE)
+        self._conn.emit_signal(
+            None, MPRIS_PATH, "org.freedesktop.DBus.Properties", "PropertiesChanged",
+            GLib.Variant("(sa{sv}as)", (PLAYER_IFACE, {name: props[name] for name in names}, [])),
+        )
+
+    # --- Actions ---
+
+    def next_track(self, step: int = 1):
+        self._track = max(0, self._track + step)
+        self._set_position(0)
+        self._emit_changed("Metadata", "Position")
+
+    def set_playing(self, playing: bool):
+        if playing != self._playing:
+            self._set_position(self.position)
+            self._playing = playing
+            self._emit_changed("PlaybackStatus")
+
+    def seek(self, position: int):
+        self._set_position(position)
+        self._conn.emit_signal(None, MPRIS_PATH, PLAYER_IFACE, "Seeked", GLib.Variant("(x)", (self.position,)))
+
+    def start_schedule(self, track_ms: int = 0, seek_ms: int = 0, toggle_ms: int = 0):
+        """Change tracks, seek and toggle play/pause every N milliseconds (0 disables)."""
+        if track_ms:
+            GLib.timeout_add(track_ms, lambda: (self.next_track(), True)[1])
+        if seek_ms:
+            GLib.timeout_add(seek_ms, lambda: (self.seek((self.position + 15000000) % self._track_length), True)[1])
+        if toggle_ms:
+            GLib.timeout_add(toggle_ms, lambda: (self.set_playing(not self._playing), True)[1])
+
+    # --- D-Bus ---
+
+    def _on_call(self, conn, sender, path, interface, method, params, invocation, user_data=None):
+        self.calls[f"{interface}.{method}"] += 1
+        args = params.unpack()
+        result = None
+
+        match method:
+            case "Get":
+                result = GLib.Variant("(v)", (self.properties(args[0])[args[1]],))
+            case "GetAll":
+                result = GLib.Variant("(a{sv})", (self.properties(args[0]),))
+            case "Set":
+                pass
+            case "Play":
+                self.set_playing(True)
+            case "Pause" | "Stop":
+                self.set_playing(False)
+            case "PlayPause":
+                self.set_playing(not self._playing)
+            case "Next":
+                self.next_track(1)
+            case "Previous":
+                self.next_track(-1)
+            case "Seek":
+                self.seek(self.position + args[0])
+            case "SetPosition":
+                self.seek(args[1])
+            case "NextTrack":
+                self.next_track(1)
+            case "SetPlaying":
+                self.set_playing(args[0])
+            case "Stats":
+                result = GLib.Variant("(a{su})", (dict(self.calls),))
+            case "ResetStats":
+                self.calls.clear()
+
+        invocation.return_value(result)
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Serve scripted fake MPRIS players")
+    parser.add_argument("--address", help="bus address (default: start a private dbus-daemon)")
+    parser.add_argument("--players", type=int, default=1)
+    parser.add_argument("--art-dir", default=os.path.join(tempfile.gettempdir(), "hyprgtk4-fake-art"))
+    parser.add_argument("--art-count", type=int, default=16)
+    parser.add_argument("--track-interval", type=int, default=0, help="ms between track changes")
+    parser.add_argument("--seek-interval", type=int, default=0, help="ms between seeks")
+    parser.add_argument("--toggle-interval", type=int, default=0, help="ms between play/pause toggles")
+    args = parser.parse_args(argv)
+
+    daemon = None
+    address = args.address
+    if address is None:
+        daemon, address = start_private_bus()
+        print(f"DBUS_SESSION_BUS_ADDRESS={address}", flush=True)
+
+    os.makedirs(args.art_dir, exist_ok=True)
+    art = make_art(args.art_dir, args.art_count)
+
+    # One connection per player: each registers its own object at MPRIS_PATH
+    players = [FakePlayer(connect(address), i, art) for i in range(args.players)]
+    for player in players:
+        player.start_schedule(args.track_interval, args.seek_interval, args.toggle_interval)
+
+    loop = GLib.MainLoop()
+    GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGINT, loop.quit)
+    GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGTERM, loop.quit)
+    print("ready", flush=True)
+    try:
+        loop.run()
+    finally:
+        if daemon is not None:
+            daemon.terminate()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,232 @@
+"""
+Regression benchmark for the music page against scripted MPRIS players.
+
+Starts a private dbus-daemon, spawns `bench.fake_mpris` in a child process
+and drives a real `MusicPlayer` through N track changes:
+
+    python -m bench.mpris_bench --players 3 --tracks 1000 --idle-seconds 60
+
+Reported as JSON:
+
+- main-loop busy time per track change (mean, p50, p95, max, in ms)
+- D-Bus calls per minute received by the players while idle
+- GLib timers and idle sources alive before and after the run
+- RSS and Python heap growth across the track changes
+
+With `--check`, it instead asserts that every track change causes exactly
+one `MusicPlayer.update_ui` call and exits non-zero otherwise:
+
+    python -m bench.mpris_bench --check --tracks 50
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Optional
+
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gio, GLib, Gtk
+
+from bench.fake_mpris import CONTROL_IFACE, MPRIS_NAME_PREFIX, MPRIS_PATH, start_private_bus
+from service.metrics import SourceTracker
+
+PAGE_SIZE = resource.getpagesize()
+
+
+def rss_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * PAGE_SIZE
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def iterate_until_idle(context: GLib.MainContext, settle_ms: float = 20) -> float:
+    """
+    Run `context` until it has been idle for `settle_ms` and return the time
+    spent dispatching, in milliseconds.
+    """
+    busy = 0.0
+    quiet_since = time.monotonic()
+    while (time.monotonic() - quiet_since) * 1000 < settle_ms:
+        start = time.monotonic()
+        if context.iteration(False):
+            busy += time.monotonic() - start
+            quiet_since = time.monotonic()
+        else:
+            time.sleep(0.001)
+    return busy * 1000
+
+
+class Bench:
+    def __init__(self, args):
+        self.args = args
+        self.context = GLib.MainContext.default()
+        self.tracker = SourceTracker()
+        self.ui_updates = 0
+
+    def wait_for(self, predicate, timeout: float = 10) -> bool:
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if time.monotonic() > deadline:
+                return False
+            self.context.iteration(False) or time.sleep(0.005)
+        return True
+
+    def control(self, player: int, method: str, params=None, reply_type=None):
+        return self.conn.call_sync(
+            f"{MPRIS_NAME_PREFIX}{player}", MPRIS_PATH, CONTROL_IFACE, method,
+            params, reply_type, Gio.DBusCallFlags.NONE, -1, None,
+        )
+
+    def dbus_calls(self) -> int:
+        total = 0
+        for i in range(self.args.players):
+            stats = self.control(i, "Stats", None, GLib.VariantType("(a{su})")).unpack()[0]
+            total += sum(count for name, count in stats.items() if not name.startswith(CONTROL_IFACE))
+        return total
+
+    def reset_dbus_calls(self):
+        for i in range(self.args.players):
+            self.control(i, "ResetStats")
+
+    def start_music(self):
+        """Show a MusicPlayer counting its `update_ui` calls and wait for every player"""
+        from modules.music import MusicPlayer
+
+        self.conn = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+
+        music = MusicPlayer()
+        original_update_ui = music.update_ui
+
+        def counting_update_ui(*args, **kwargs):
+            self.ui_updates += 1
+            return original_update_ui(*args, **kwargs)
+        music.update_ui = counting_update_ui
+
+        window = Gtk.Window()
+        window.set_child(music)
+        window.present()
+
+        if not self.wait_for(lambda: len(music.players) >= self.args.players):
+            raise RuntimeError(f"only {len(music.players)} of {self.args.players} players appeared")
+        iterate_until_idle(self.context, 200)
+        return window, music
+
+    @staticmethod
+    def active_index(music) -> int:
+        return int(music.active_player_name.removeprefix("fake")) if music.active_player_name else 0
+
+    def check(self) -> dict:
+        """Count `update_ui` calls per track change; every change should cause exactly one"""
+        window, music = self.start_music()
+        active = self.active_index(music)
+        per_change = []
+        for _ in range(self.args.tracks):
+            before = self.ui_updates
+            self.control(active, "NextTrack")
+            iterate_until_idle(self.context, self.args.settle_ms)
+            per_change.append(self.ui_updates - before)
+        window.destroy()
+        return {
+            "tracks": self.args.tracks,
+            "ui_updates": sum(per_change),
+            "failed_changes": [(i, n) for i, n in enumerate(per_change) if n != 1],
+        }
+
+    def run(self) -> dict:
+        self.tracker.install()
+        window, music = self.start_music()
+
+        report = {"players": self.args.players, "tracks": self.args.tracks}
+        report["timers_before"] = self.tracker.counts()
+
+        # Idle: the page is visible and playing, nothing changes
+        self.reset_dbus_calls()
+        idle_start = time.monotonic()
+        while time.monotonic() - idle_start < self.args.idle_seconds:
+            self.context.iteration(False) or time.sleep(0.01)
+        report["idle_dbus_calls_per_minute"] = self.dbus_calls() * 60 / self.args.idle_seconds
+
+        # Track changes on the active player
+        active = self.active_index(music)
+        tracemalloc.start()
+        heap_before, _ = tracemalloc.get_traced_memory()
+        rss_before = rss_bytes()
+        self.reset_dbus_calls()
+        ui_before = self.ui_updates
+        busy = []
+        for _ in range(self.args.tracks):
+            self.control(active, "NextTrack")
+            busy.append(iterate_until_idle(self.context, self.args.settle_ms))
+        heap_after, heap_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        report["track_change_ms"] = {
+            "mean": sum(busy) / len(busy),
+            "p50": percentile(busy, 0.5),
+            "p95": percentile(busy, 0.95),
+            "max": max(busy),
+        }
+        report["ui_updates_per_track_change"] = (self.ui_updates - ui_before) / self.args.tracks
+        report["dbus_calls_per_track_change"] = self.dbus_calls() / self.args.tracks
+        report["timers_after"] = self.tracker.counts()
+        report["rss_growth_bytes"] = rss_bytes() - rss_before
+        report["heap_growth_bytes"] = heap_after - heap_before
+        report["heap_peak_bytes"] = heap_peak
+
+        window.destroy()
+        self.tracker.uninstall()
+        return report
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark the music page against fake MPRIS players")
+    parser.add_argument("--players", type=int, default=3)
+    parser.add_argument("--tracks", type=int, default=1000)
+    parser.add_argument("--idle-seconds", type=float, default=60)
+    parser.add_argument("--settle-ms", type=float, default=20, help="quiet time that ends a track change")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    parser.add_argument("--check", action="store_true",
+                        help="assert one UI update per track change instead of benchmarking")
+    args = parser.parse_args(argv)
+
+    daemon, address = start_private_bus()
+    os.environ["DBUS_SESSION_BUS_ADDRESS"] = address
+    players = subprocess.Popen(
+        [sys.executable, "-m", "bench.fake_mpris", "--address", address, "--players", str(args.players)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        if players.stdout.readline().strip() != "ready":
+            raise RuntimeError("fake players failed to start")
+        Gtk.init()
+        bench = Bench(args)
+        report = bench.check() if args.check else bench.run()
+    finally:
+        players.terminate()
+        players.wait()
+        daemon.terminate()
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    if args.check:
+        print("ok" if not report["failed_changes"] else "failed")
+        sys.exit(1 if report["failed_changes"] else 0)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,26 +1,138 @@
+"""
+Send commands to the running bar over its control socket.
+
+    python control.py open dashboard
+    python control.py toggle applauncher
+    python control.py -b 'volume +5' 'open osd'    # batch, one write
+    echo 'open music' | python control.py -        # commands from stdin
+    python control.py dashboard                    # same as 'open dashboard'
+    python control.py state active-window          # JSON snapshot
+    python control.py subscribe volume media       # JSON line per change
+    python control.py power reduced                # pin a power profile ('auto' to undo)
+    python control.py metrics hyprland.            # counters, gauges, histograms
+    python control.py selfmonitor start            # sample CPU, threads, RSS, GC
+    python control.py watchdog start 16            # record main-loop stalls
+
+Only the standard library is imported, so this starts fast. Keybinds that
+need the lowest latency can skip Python entirely with control.sh.
+"""
+import os
+import socket
 import sys
-import gi
-from gi.repository import Gio, GLib
-
-if len(sys.argv) != 2:
-    print("Usage: python control.py <widget_name>")
-    sys.exit(1)
-
-widget_name = sys.argv[1]
-
-bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-bus.call_sync(
-    'com.example.gtk4.bar',           # Bus name
-    '/com/example/gtk4/bar',          # Object path
-    'org.gtk.Actions',                # Interface
-    'Activate',                       # Method
-    GLib.Variant('(sava{sv})', (
-        'open_notch',                 # Action name
-        [GLib.Variant('s', widget_name)],  # Parameter
-        {}                            # Platform data
-    )),
-    None,
-    Gio.DBusCallFlags.NONE,
-    -1,
-    None
-)
\ No newline at end of file
+
+XDG_RUNTIME_DIR = os.getenv("XDG_RUNTIME_DIR") or "/tmp"
+CONTROL_SOCKET = f"{XDG_RUNTIME_DIR}/hyprgtk4/control.sock"
+CONTROL_COMMANDS = f"{CONTROL_SOCKET}.commands"  # command names, written by the bar
+
+
+def connect(commands: list[str], timeout=2) -> socket.socket:
+    """Connect and send `commands` in one write."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    sock.connect(CONTROL_SOCKET)
+    sock.sendall("".join(f"{command}\n" for command in commands).encode())
+    sock.shutdown(socket.SHUT_WR)
+    return sock
+
+
+def send(commands: list[str]) -> list[str]:
+    """Send `commands` in one write and return one reply per command."""
+    with connect(commands) as sock:
+        data = b""
+        while chunk := sock.recv(4096):
+            data += chunk
+    return data.decode().splitlines()
+
+
+def stream(commands: list[str]):
+    """Send `commands` and yield lines until the bar closes the connection."""
+    with connect(commands, timeout=None) as sock, sock.makefile() as lines:
+        yield from (line.rstrip("\n") for line in lines)
+
+
+def server_commands() -> set[str]:
+    """Command names the running bar accepts; empty if it is not running."""
+    try:
+        with open(CONTROL_COMMANDS) as f:
+            return {line.strip() for line in f if line.strip()}
+    except OSError:
+        pass
+    # Bars that don't write the list: ask for the help reply
+    try:
+        replies = send(["help"])
+    except OSError:
+        return set()
+    if not replies or not replies[0].startswith("ok "):
+        return set()
+    return {usage.split()[0] for usage in replies[0].removeprefix("ok ").split(" | ") if usage}
+
+
+def send_dbus(widget_name: str):
+    """Fallback for bars without the control socket: the open_notch action."""
+    from gi.repository import Gio, GLib
+
+    bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+    bus.call_sync(
+        'com.example.gtk4.bar',           # Bus name
+        '/com/example/gtk4/bar',          # Object path
+        'org.gtk.Actions',                # Interface
+        'Activate',                       # Method
+        GLib.Variant('(sava{sv})', (
+            'open_notch',                 # Action name
+            [GLib.Variant('s', widget_name)],  # Parameter
+            {}                            # Platform data
+        )),
+        None,
+        Gio.DBusCallFlags.NONE,
+        -1,
+        None
+    )
+
+
+def parse_args(argv: list[str]) -> list[str]:
+    if not argv:
+        print(__doc__.strip())
+        sys.exit(1)
+    if argv == ["-"]:
+        return [line.strip() for line in sys.stdin if line.strip()]
+    if argv[0] in ("-b", "--batch"):
+        return [command for command in argv[1:] if command.strip()]
+    if len(argv) == 1 and " " not in argv[0] and argv[0] not in server_commands():
+        return [f"open {argv[0]}"]
+    return [" ".join(argv)]
+
+
+def main(argv: list[str]) -> int:
+    commands = parse_args(argv)
+    try:
+        if any(command.split()[:1] == ["subscribe"] for command in commands):
+            for line in stream(commands):
+                if line != "ok":
+                    print(line, flush=True)
+            return 0
+        replies = send(commands)
+    except KeyboardInterrupt:
+        return 0
+    except (FileNotFoundError, ConnectionRefusedError):
+        if len(commands) == 1 and commands[0].startswith("open "):
+            send_dbus(commands[0].split(maxsplit=1)[1])
+            return 0
+        print(f"Bar is not running (no socket at {CONTROL_SOCKET})", file=sys.stderr)
+        return 1
+    except OSError as e:
+        # Timeouts and other socket errors from a bar that is running
+        print(f"Control socket error: {e}", file=sys.stderr)
+        return 1
+
+    status = 0
+    for reply in replies:
+        if reply.startswith("error"):
+            print(reply, file=sys.stderr)
+            status = 1
+        elif reply != "ok":
+            print(reply.removeprefix("ok "))
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
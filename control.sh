@@ -0,0 +1,5 @@
+#!/bin/sh
+# Send commands to the bar's control socket without starting Python.
+#   control.sh open dashboard
+#   control.sh 'volume +5; open osd'
+printf '%s\n' "$*" | socat - "UNIX-CONNECT:${XDG_RUNTIME_DIR:-/tmp}/hyprgtk4/control.sock"
@@ -1,10 +1,19 @@
+from service.profiler import StartupProfiler
+profiler = StartupProfiler.get_default()
+
+import os
+from service.metrics import metrics, TRACK_SOURCES_ENV
+# Before anything adds GLib sources, so the timer gauges count them all
+if os.getenv(TRACK_SOURCES_ENV, "0") not in ("", "0"):
+    metrics.track_sources()
+
 from ctypes import CDLL
 import gi
-import os
 import logging
 # Load GTK4 Layer Shell
 try:
-    CDLL('libgtk4-layer-shell.so')
+    with profiler.span("CDLL libgtk4-layer-shell.so", "import"):
+        CDLL('libgtk4-layer-shell.so')
 except OSError:
     print("Error: Could not load libgtk4-layer-shell.so. Please ensure gtk4-layer-shell is installed.")
     exit(1)
@@ -14,20 +23,44 @@ gi.require_version('Gtk4LayerShell', '1.0')
 gi.require_version('GLib', '2.0')
 gi.require_version('Gio', '2.0')
 
-from gi.repository import Gtk, GLib, Gdk, Gio
+from gi.repository import Gtk, GLib, Gio
 from gi.repository import Gtk4LayerShell as LayerShell
 import datetime
 from modules.notch import Notch
 from modules.bar import Bar
+from service.stylesheet import StyleSheetManager
+from service.control import ControlServer, ControlError
+from service.hyprland import HyprlandService
+from service.state import StateHub, to_json
+from service.watchdog import Watchdog
+from service.selfmonitor import SelfMonitor
+from service.fullscreen import FullscreenMonitor
+from service.power import PowerProfile
+from service.battery import BatteryService
+from service.eventbus import bus
+from service.lazy import format_import_report, import_report, lazy_import
+from service.session import SessionState
+from service.clock import WallClock
+
+# Needs the optional Playerctl typelib; only loaded with the music page
+mpris_module = lazy_import("service.mpris")
 
 class MyApp(Gtk.Application):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.notch = None  # To store the Notch instance
         self.notch_window = None  
-        self.css_monitors = []  # To store CSS file monitors
+        self.stylesheets = None
+        self.bar = None
+        self.control_server = None
+        self.fullscreen_monitor = None
+        self.suspended = False
 
     def do_activate(self):
+        watchdog_threshold = Watchdog.threshold_from_environment()
+        if watchdog_threshold is not None:
+            Watchdog.get_default().start(watchdog_threshold)
+
         # Create notch window (overlay)
         self.notch_window = Gtk.Window(application=self, name="notch")
         self.notch_window.set_resizable(False)
@@ -53,7 +86,8 @@ class MyApp(Gtk.Application):
         center_box.set_halign(Gtk.Align.CENTER)
 
         # Add notch to center box
-        self.notch = Notch(notch_window=self.notch_window)
+        with profiler.span("Notch", "widget"):
+            self.notch = Notch(notch_window=self.notch_window)
         center_box.append(self.notch)
 
         # Set the box as notch window's child
@@ -64,38 +98,52 @@ class MyApp(Gtk.Application):
         self.notch_window.set_size_request(-1, bar_height)
 
         # Create workspace bar
-        bar = Bar(self)
-
-        # Load CSS
-        css_provider = load_css()
-
-        # Monitor CSS files for changes
-        if css_provider:
-            css_files = [
-                'main.css',
-                'styles/notch.css',
-                'styles/notification.css',
-                'styles/workspace.css',
-                'styles/systray.css',
-                'styles/audio.css'
-            ]
-            os.makedirs('styles', exist_ok=True)
-            windows = [self.notch_window, bar]
-            
-            for css_file_path in css_files:
-                css_file = Gio.File.new_for_path(css_file_path)
-                monitor = css_file.monitor_file(Gio.FileMonitorFlags.NONE, None)
-                monitor.connect("changed", lambda m, f, of, evt: reload_css(css_provider, windows, 'main.css'))
-                self.css_monitors.append(monitor)  # Store monitors to prevent garbage collection
+        with profiler.span("Bar", "widget"):
+            bar = Bar(self)
+        self.bar = bar
+
+        # Load CSS, one provider per stylesheet, and reload each file when it changes
+        self.stylesheets = StyleSheetManager('main.css', extra=['styles/audio.css'])
+        with profiler.span("StyleSheetManager.load", "style"):
+            loaded = self.stylesheets.load()
+        if loaded:
+            print("CSS loaded from main.css")
+            self.stylesheets.watch([self.notch_window, bar])
 
         # Define the 'open_notch' action with a string parameter
         action = Gio.SimpleAction.new("open_notch", GLib.VariantType.new("s"))
         action.connect("activate", self.on_open_notch)
         self.add_action(action)
 
+        # Control socket for keybinds (see control.py)
+        self.control_server = ControlServer()
+        self.control_server.register("open", self.on_control_open, "open <page>")
+        self.control_server.register("toggle", self.on_control_toggle, "toggle <page>")
+        self.control_server.register("close", self.on_control_close, "close")
+        self.control_server.register("volume", self.on_control_volume, "volume [N|+N|-N]")
+        self.control_server.register("brightness", self.on_control_brightness, "brightness [N|+N|-N]")
+        self.control_server.register("power", self.on_control_power, "power [auto|full|reduced]")
+        self.control_server.register("session", self.on_control_session, "session")
+        self.control_server.register("metrics", self.on_control_metrics, "metrics [prefix]")
+        self.control_server.register("imports", self.on_control_imports, "imports [text]")
+        self.control_server.register("selfmonitor", self.on_control_selfmonitor, "selfmonitor [start|stop|history]")
+        self.control_server.register("watchdog", self.on_control_watchdog, "watchdog [start [ms]|stop|reset]")
+        self._init_state_queries()
+        try:
+            self.control_server.start()
+        except OSError as e:
+            print(f"Could not start control socket: {e}")
+
+        self._init_fullscreen_suspension()
+        self._init_session_state()
+        self._init_event_bus()
+        metrics.start_snapshots()
+        SelfMonitor.get_default().freeze_after_startup()
+
         # Show windows
         bar.present()
         self.notch_window.present()
+        profiler.finish_on_first_frame(self.notch_window)
 
     def on_open_notch(self, action, parameter):
         """Handler for the 'open_notch' action."""
@@ -103,34 +151,196 @@ class MyApp(Gtk.Application):
             widget_name = parameter.get_string()
             self.notch.open_notch(widget_name)
 
-def load_css():
-    css_provider = Gtk.CssProvider()
-    try:
-        css_provider.load_from_path('main.css')
-        print("CSS loaded from main.css")
-    except GLib.Error as e:
-        print(f"Error loading CSS: {e}")
-        return None
-    Gtk.StyleContext.add_provider_for_display(
-        Gdk.Display.get_default(),
-        css_provider,
-        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-    )
-    return css_provider
-
-def reload_css(css_provider, windows, css_path):
-    if not css_provider:
-        return
-    try:
-        css_provider.load_from_path(css_path)
-        print(f"CSS reloaded from {css_path}")
-        display = Gdk.Display.get_default()
-        Gtk.StyleContext.remove_provider_for_display(display, css_provider)
-        Gtk.StyleContext.add_provider_for_display(
-            display, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+    def _init_fullscreen_suspension(self):
+        """Suspend the bar while a fullscreen window covers its monitor"""
+        if os.getenv("HYPRGTK4_FULLSCREEN_SUSPEND", "1") == "0":
+            return
+        hyprland = HyprlandService.get_default()
+        if not hyprland.is_available():
+            return
+        self.fullscreen_monitor = FullscreenMonitor(self.bar.monitor_connector, hyprland)
+        # The compositor picks the bar's output; monitor_connector is only a first guess
+        self.fullscreen_monitor.follow_window(self.bar)
+        self.fullscreen_monitor.connect(
+            "notify::fullscreen", lambda monitor, _pspec: self.set_suspended(monitor.fullscreen)
+        )
+        if self.fullscreen_monitor.fullscreen:
+            GLib.idle_add(lambda: (self.set_suspended(True), False)[1])
+
+    def set_suspended(self, suspended):
+        """
+        Hide the bar and notch and hold back Hyprland syncs while suspended.
+        Hidden widgets stop their own clocks and animations (WallClock and
+        ProgressClock follow mapping). Leaving suspension runs each pending
+        sync once before the windows are shown again.
+        """
+        if suspended == self.suspended:
+            return
+        self.suspended = suspended
+        hyprland = HyprlandService.get_default()
+        if suspended:
+            hyprland.defer_syncs(True)
+            self.bar.set_visible(False)
+        else:
+            hyprland.defer_syncs(False)
+            self.bar.set_visible(True)
+        self.notch.set_suspended(suspended)
+        print(f"Bar {'suspended for' if suspended else 'resumed after'} fullscreen")
+
+    def _init_event_bus(self):
+        """Dispatch cross-thread events at most once per animation frame"""
+        power = PowerProfile.get_default()
+        power.connect("notify::profile", lambda power, _pspec: setattr(bus, "frame_interval", power.frame_interval))
+        bus.frame_interval = power.frame_interval
+
+    def _init_session_state(self):
+        """Stop background work while the session is locked or idle"""
+        session = SessionState.get_default()
+        session.connect("suspend", lambda _session: self.set_session_suspended(True))
+        session.connect("resume", lambda _session: self.set_session_suspended(False))
+
+    def set_session_suspended(self, suspended):
+        """
+        Pause clocks, progress ticks, Hyprland syncs, fullscreen tracking and
+        metrics snapshots while nobody is looking. Resuming refreshes each once.
+        """
+        hyprland = HyprlandService.get_default()
+        if self.fullscreen_monitor:
+            self.fullscreen_monitor.set_paused(suspended)
+        if suspended:
+            WallClock.get_default().set_paused(True)
+            if mpris_module.loaded:
+                mpris_module.ProgressClock.get_default().set_paused(True)
+            hyprland.defer_syncs(True)
+            metrics.stop_snapshots()
+        else:
+            hyprland.defer_syncs(False)
+            WallClock.get_default().set_paused(False)
+            if mpris_module.loaded:
+                mpris_module.ProgressClock.get_default().set_paused(False)
+            metrics.start_snapshots()
+        print(f"Session {'locked or idle, pausing' if suspended else 'active, resuming'} background work")
+
+    def _init_state_queries(self):
+        """Publish what the bar knows for scripts, see StateHub"""
+        state = StateHub.get_default()
+        hyprland = HyprlandService.get_default()
+        if hyprland.is_available():
+            state.watch_hyprland(hyprland)
+        if self.bar.audio_service:
+            state.watch_audio(self.bar.audio_service)
+        if self.bar.backlight_service:
+            state.watch_backlight(self.bar.backlight_service)
+        state.watch_power(PowerProfile.get_default())
+
+        self.control_server.register(
+            "state", lambda *topics: to_json(state.get(*topics)), "state [topic...]"
         )
-    except GLib.Error as e:
-        print(f"Error reloading CSS: {e}")
+        self.control_server.register_stream(
+            "subscribe",
+            lambda write, *topics: state.subscribe(
+                lambda topic, value: write(to_json({"topic": topic, "value": value}) + "\n"), list(topics)
+            ),
+            "subscribe [topic...]",
+        )
+
+    def do_shutdown(self):
+        metrics.stop_snapshots()
+        metrics.write_snapshot()
+        Watchdog.get_default().stop()
+        # Persist the samples taken since the last periodic save
+        BatteryService.get_default().cleanup()
+        if self.control_server:
+            self.control_server.stop()
+        Gtk.Application.do_shutdown(self)
+
+    # --- Control socket commands ---
+
+    def _check_page(self, page):
+        if page not in self.notch.widget_configs:
+            raise ControlError(f"unknown page '{page}', expected one of: {', '.join(self.notch.widget_configs)}")
+
+    def on_control_open(self, page):
+        self._check_page(page)
+        self.notch.open_notch(page)
+
+    def on_control_toggle(self, page):
+        self._check_page(page)
+        if self.notch.stack.get_visible_child_name() == page:
+            self.notch.collapse_notch()
+        else:
+            self.notch.open_notch(page)
+
+    def on_control_close(self):
+        self.notch.collapse_notch()
+
+    def on_control_volume(self, value=None):
+        audio_service = self.bar.audio_service if self.bar else None
+        if not audio_service or not audio_service.speaker:
+            raise ControlError("volume control not available")
+        speaker = audio_service.speaker
+        if value is not None:
+            speaker.volume = adjust(value, speaker.volume, 0.0, 100.0)
+            if speaker.muted and speaker.volume > 0:
+                speaker.muted = False
+        return f"{speaker.volume:.0f}"
+
+    def on_control_brightness(self, value=None):
+        backlight = self.bar.backlight_service if self.bar else None
+        if not backlight or not backlight.available:
+            raise ControlError("brightness control not available")
+        level = backlight.get_level() * 100
+        if value is not None:
+            level = adjust(value, level, 0.0, 100.0)
+            backlight.ramp_to_level(level / 100)
+        return f"{level:.0f}"
+
+    def on_control_power(self, profile=None):
+        power = PowerProfile.get_default()
+        if profile is not None:
+            power.set_override(None if profile == "auto" else profile)
+        return to_json(power.status())
+
+    def on_control_session(self):
+        return to_json(SessionState.get_default().status())
+
+    def on_control_metrics(self, prefix=""):
+        return to_json(metrics.snapshot(prefix))
+
+    def on_control_imports(self, style=None):
+        if style == "text":
+            # One reply line per command, so the aligned lines go out as a JSON list
+            return to_json(format_import_report().splitlines())
+        if style is not None:
+            raise ControlError(f"unknown format '{style}', expected text")
+        return to_json(import_report(errors=True))
+
+    def on_control_selfmonitor(self, action=None):
+        monitor = SelfMonitor.get_default()
+        if action in ("start", "stop"):
+            monitor.set_held_by_control(action == "start")
+        elif action not in (None, "history"):
+            raise ControlError(f"unknown action '{action}', expected start, stop or history")
+        return to_json(monitor.report(history=action == "history"))
+
+    def on_control_watchdog(self, action=None, threshold=None):
+        watchdog = Watchdog.get_default()
+        if action == "start":
+            watchdog.start(float(threshold) if threshold is not None else None)
+        elif action == "stop":
+            watchdog.stop()
+        elif action == "reset":
+            watchdog.reset()
+        elif action is not None:
+            raise ControlError(f"unknown action '{action}', expected start, stop or reset")
+        return to_json(watchdog.report())
+
+def adjust(value, current, minimum, maximum):
+    """Apply an absolute ('50') or relative ('+5', '-5') value to `current`"""
+    amount = float(value)
+    if value.startswith(("+", "-")):
+        amount += current
+    return max(minimum, min(maximum, amount))
 
 # Run the application
 app = MyApp(application_id='com.example.gtk4.bar')
@@ -2,9 +2,10 @@ import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, GLib
 from service.audio import Audio, AudioStream, CvcImportError
+from widgets.visibility import VisibilityGated
 from . import icons
 
-class AudioStack(Gtk.Box):
+class AudioStack(VisibilityGated, Gtk.Box):
     """Main Audio management widget."""
 
     def __init__(self, **kwargs):
@@ -19,12 +20,13 @@ class AudioStack(Gtk.Box):
         self.output_rows = {}
         self.input_rows = {}
         self.app_rows = {}
+        self.gate_updates("audio")
 
         try:
             self.audio_service = Audio()
             self._create_ui()
-            self.audio_service.connect('changed', self._update_all_ui)
-            GLib.idle_add(self._update_all_ui)
+            self.audio_service.connect('changed', self._on_audio_changed)
+            GLib.idle_add(self._on_audio_changed)
         except CvcImportError:
             self._create_error_ui()
 
@@ -64,6 +66,9 @@ class AudioStack(Gtk.Box):
         self.apps_box, self.apps_list_box = self._create_titled_list("Applications")
         content_box.append(self.apps_box)
 
+    def _on_audio_changed(self, *args):
+        return self.defer_update("all", self._update_all_ui)
+
     def _update_all_ui(self, *args):
         self._update_default_controls()
         self._update_device_lists()
@@ -235,13 +240,14 @@ class AudioDeviceRow(Gtk.ListBoxRow):
         elif stream_type == "microphones":
             self.audio_service._control.set_default_source(self.stream.stream)
 
-class ApplicationStreamRow(Gtk.ListBoxRow):
+class ApplicationStreamRow(VisibilityGated, Gtk.ListBoxRow):
     def __init__(self, stream: AudioStream):
         super().__init__()
         self.stream = stream
+        self.gate_updates("audio-app-rows")
         self._create_ui()
         self.update()
-        self.changed_handler = self.stream.connect("changed", lambda s: self.update())
+        self.changed_handler = self.stream.connect("changed", lambda s: self.defer_update("update", self.update))
 
     def _create_ui(self):
         main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
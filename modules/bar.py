@@ -14,9 +14,15 @@ from gi.repository import Gtk, GLib, Gdk
 from gi.repository import Gtk4LayerShell as LayerShell
 from widgets.corner import Corner
 from modules.workspace import WorkspaceBar
-from modules.systray import SysTray, setup_css
-from service.audio import Audio  # Import the Audio service
 from service.backlight import BacklightService  # Import the Backlight service
+from service.lazy import lazy_import
+from service.profiler import StartupProfiler
+
+# Optional subsystems, loaded on first use (see service.lazy)
+audio = lazy_import("service.audio")
+systray = lazy_import("modules.systray")
+
+profiler = StartupProfiler.get_default()
 
 class Bar(Gtk.ApplicationWindow):
     """A LayerShell window that contains the workspace bar with colored backgrounds and scroll logging."""
@@ -52,11 +58,13 @@ class Bar(Gtk.ApplicationWindow):
         display = Gdk.Display.get_default()
         monitors = display.get_monitors() if display else []
         monitor = monitors[0] if len(monitors) > 0 else None
+        self.monitor_connector = monitor.get_connector() if monitor else None
         screen_width = monitor.get_geometry().width if monitor else -1
         self.set_size_request(screen_width, bar_height)
         
         # Initialize services
-        self._init_services()
+        with profiler.span("Bar._init_services", "service"):
+            self._init_services()
         
         # Create main horizontal box
         main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
@@ -77,7 +85,8 @@ class Bar(Gtk.ApplicationWindow):
         left_box.add_controller(left_scroll_controller)
         
         # Add workspace bar
-        workspace_bar = WorkspaceBar()
+        with profiler.span("WorkspaceBar", "widget"):
+            workspace_bar = WorkspaceBar()
         workspace_bar.set_size_request(-1, bar_height)
         workspace_bar.set_valign(Gtk.Align.CENTER)
         left_box.append(workspace_bar)
@@ -113,10 +122,14 @@ class Bar(Gtk.ApplicationWindow):
         right_box.append(self.right_corner)
         
         # Add system tray
-        systray = SysTray()
-        systray.set_size_request(-1, bar_height)
-        systray.set_valign(Gtk.Align.CENTER)
-        right_box.append(systray)
+        try:
+            with profiler.span("SysTray", "widget"):
+                tray = systray.SysTray()
+            tray.set_size_request(-1, bar_height)
+            tray.set_valign(Gtk.Align.CENTER)
+            right_box.append(tray)
+        except ImportError as e:
+            print(f"System tray unavailable: {e}")
         
         # Add boxes to main box
         main_box.append(left_box)
@@ -129,14 +142,17 @@ class Bar(Gtk.ApplicationWindow):
         """Initialize backlight and audio services"""
         # Initialize Backlight Service
         try:
-            self.backlight_service = BacklightService.get_default()
+            with profiler.span("BacklightService", "service"):
+                self.backlight_service = BacklightService.get_default()
+            self.backlight_service.set_frame_widget(self)
         except Exception as e:
             print(f"Failed to initialize backlight service: {e}")
             self.backlight_service = None
         
         # Initialize Audio Service
         try:
-            self.audio_service = Audio()
+            with profiler.span("Audio", "service"):
+                self.audio_service = audio.Audio()
         except Exception as e:
             print(f"Failed to initialize audio service: {e}")
             self.audio_service = None
@@ -147,25 +163,12 @@ class Bar(Gtk.ApplicationWindow):
             print("Brightness control not available")
             return
         
-        # Determine scroll direction and calculate brightness change
-        direction = "up" if dy < 0 else "down"
-        delta = abs(dy)
-        
-        # Calculate brightness step (5% per scroll step)
-        max_brightness = self.backlight_service.max_brightness
-        current_brightness = self.backlight_service.brightness
-        step = max(1, int(max_brightness * 0.05))  # 5% step, minimum 1
-        
-        if direction == "up":
-            new_brightness = min(max_brightness, current_brightness + step)
-        else:
-            new_brightness = max(0, current_brightness - step)
-        
-        # Set the new brightness
-        self.backlight_service.set_brightness(new_brightness)
+        if dy == 0:
+            return
         
-        # Calculate percentage for logging
-        percentage = int((new_brightness / max_brightness) * 100) if max_brightness > 0 else 0
+        # Step along the perceptual curve and ramp to the new level
+        steps = -1 if dy > 0 else 1
+        self.backlight_service.step_brightness(steps)
     
     def on_volume_scroll(self, controller, dx, dy):
         """Handle scroll events for volume control on right box."""
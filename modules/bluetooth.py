@@ -1,9 +1,11 @@
 import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, GLib, Gio
-from service.bluetooth import BluetoothService, BluetoothDevice
+from service.bluetooth import BluetoothService, BluetoothDevice, DEVICE_CHANGED
+from service.eventbus import bus
+from widgets.visibility import VisibilityGated
 
-class BluetoothStack(Gtk.Box):
+class BluetoothStack(VisibilityGated, Gtk.Box):
     """Main Bluetooth management window."""
     
     def __init__(self, notch, **kwargs):
@@ -14,12 +16,14 @@ class BluetoothStack(Gtk.Box):
         )
         
         self.bt_service = BluetoothService()
+        self.gate_updates("bluetooth")
         
         self._create_ui()
         
         self.bt_service.connect('device-added', self._on_device_added)
         self.bt_service.connect('device-removed', self._on_device_removed)
         self.bt_service.connect('property-changed', self._on_service_property_changed)
+        bus.subscribe(DEVICE_CHANGED, self._on_devices_changed)
         
         self._populate_devices()
         self._update_adapter_status()
@@ -209,16 +213,27 @@ class BluetoothStack(Gtk.Box):
                 self.devices_list_box.append(self.no_devices_list_row)
     
     def _on_device_added(self, service, device):
-        GLib.idle_add(self._add_device_row, device)
+        # Keyed by object path, so a device that comes and goes while hidden costs nothing
+        GLib.idle_add(self.defer_update, device.gdevice.get_object_path(), self._add_device_row, device)
     
     def _on_device_removed(self, service, object_path):
+        GLib.idle_add(self.defer_update, object_path, self._remove_device_path, object_path)
+    
+    def _remove_device_path(self, object_path):
         for address, row in list(self.device_rows.items()):
             if row.device.gdevice.get_object_path() == object_path:
-                GLib.idle_add(self._remove_device_row, address)
+                self._remove_device_row(address)
                 break
     
+    def _on_devices_changed(self, devices):
+        # One batch per frame, however many properties each device changed
+        for device in devices:
+            row = self.device_rows.get(device.address)
+            if row is not None and row.device is device:
+                row.defer_update("ui", row._update_ui)
+    
     def _on_service_property_changed(self, service, prop_name):
-        GLib.idle_add(self._update_adapter_status)
+        GLib.idle_add(self.defer_update, "adapter", self._update_adapter_status)
     
     def _on_power_toggled(self, switch, param):
         if switch.get_active() != self.bt_service.powered:
@@ -233,7 +248,7 @@ class BluetoothStack(Gtk.Box):
         self.toast_label.set_visible(True)
         GLib.timeout_add_seconds(2, lambda: self.toast_label.set_visible(False))
 
-class DeviceRow(Gtk.ListBoxRow):
+class DeviceRow(VisibilityGated, Gtk.ListBoxRow):
     """A row representing a Bluetooth device."""
     
     def __init__(self, device: BluetoothDevice, bt_service: BluetoothService):
@@ -241,6 +256,7 @@ class DeviceRow(Gtk.ListBoxRow):
         
         self.device = device
         self.bt_service = bt_service
+        self.gate_updates("bluetooth-device-rows")
         
         main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         main_box.set_margin_start(12)
@@ -273,11 +289,6 @@ class DeviceRow(Gtk.ListBoxRow):
         self.connect_button.connect("clicked", self._on_connect_clicked)
         main_box.append(self.connect_button)
 
-        self.device.connect("property-changed", self._on_device_property_changed)
-
-    def _on_device_property_changed(self, device, prop_name):
-        GLib.idle_add(self._update_ui)
-
     def _update_ui(self):
         self.icon.set_from_icon_name(self._get_device_icon())
         self.name_label.set_label(self.device.name or "Unknown Device")
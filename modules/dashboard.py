@@ -1,10 +1,21 @@
+import os
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk, GLib, Gdk, Gio
-import datetime
-from modules.bluetooth import BluetoothStack
-from modules.network import NetworkStack
-from modules.audio import AudioStack
+from gi.repository import Gtk, Gdk, Gio
+from service.clock import WallClock, SECOND, MINUTE
+from service.power import PowerProfile
+from service.lazy import lazy_import
+from service.selfmonitor import SelfMonitor
+from service.battery import BatteryService, STATUS_CHARGING, STATUS_DISCHARGING
+from widgets.sparkline import Sparkline
+from widgets.visibility import VisibilityGated
+
+DEBUG_OVERLAY_ENV = "HYPRGTK4_DEBUG_OVERLAY"
+
+# Each stack's service typelib (GnomeBluetooth, NM, Cvc) is optional
+bluetooth_module = lazy_import("modules.bluetooth")
+network_module = lazy_import("modules.network")
+audio_module = lazy_import("modules.audio")
 class Dashboard(Gtk.Box):
     def __init__(self, notch, **kwargs):
         super().__init__(
@@ -16,14 +27,17 @@ class Dashboard(Gtk.Box):
         
         # Create a time button instead of back button
         self.time_button = Gtk.Button(name="time-button")
-        self.update_time()  # Set initial time
         
         # Connect the click handler
         self.time_button.connect("clicked", self.on_back_button_clicked)
         self.append(self.time_button)
         
-        # Set up a timer to update the time every second
-        GLib.timeout_add_seconds(1, self.update_time)
+        # Update the time every second while the button is shown, every
+        # minute in the reduced power profile
+        self.clock_subscription = None
+        self.power = PowerProfile.get_default()
+        self.power.connect("notify::profile", self.subscribe_clock)
+        self.subscribe_clock()
         
         # Create expanded content box
         expanded_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10, name="expanded-content")
@@ -33,13 +47,17 @@ class Dashboard(Gtk.Box):
         calendar = Gtk.Calendar(name="calendar")
         right_side.append(calendar)
 
+        battery = BatteryService.get_default()
+        if battery.available:
+            right_side.append(BatteryGraph(battery))
+
         # Create a stack for network and bluetooth
         self.info_stack = Gtk.Stack()
         self.info_stack.set_transition_type(Gtk.StackTransitionType.SLIDE_LEFT_RIGHT)
         
-        self.bluetooth_stack = BluetoothStack(self.notch)
-        self.network_stack = NetworkStack(self.notch)
-        self.audio_stack = AudioStack()
+        self.bluetooth_stack = self._create_stack("Bluetooth", lambda: bluetooth_module.BluetoothStack(self.notch))
+        self.network_stack = self._create_stack("Network", lambda: network_module.NetworkStack(self.notch))
+        self.audio_stack = self._create_stack("Audio", lambda: audio_module.AudioStack())
         
         self.info_stack.add_named(self.network_stack, "network")
         self.info_stack.add_named(self.bluetooth_stack, "bluetooth")
@@ -59,17 +77,104 @@ class Dashboard(Gtk.Box):
         # Add expanded box to dashboard
         self.append(expanded_box)
 
+        if os.getenv(DEBUG_OVERLAY_ENV, "0") not in ("", "0"):
+            self.append(DebugOverlay())
+
     def shuffle_stack(self, button):
         self.current_stack_page = (self.current_stack_page + 1) % len(self.stack_pages)
         page_name = self.stack_pages[self.current_stack_page]
         self.info_stack.set_visible_child_name(page_name)
 
-    def update_time(self):
+    def _create_stack(self, title, factory):
+        """Build a stack page, or an error page if its library is missing"""
+        try:
+            return factory()
+        except ImportError as e:
+            print(f"{title} page unavailable: {e}")
+            return Gtk.Label(label=f"{title} is unavailable.\nA required library is not installed.",
+                             halign=Gtk.Align.CENTER, valign=Gtk.Align.CENTER, vexpand=True)
+
+    def subscribe_clock(self, *args):
+        """(Re)subscribe the time button at the power profile's resolution"""
+        clock = WallClock.get_default()
+        if self.clock_subscription is not None:
+            clock.unsubscribe(self.clock_subscription)
+        granularity = SECOND if self.power.clock_seconds else MINUTE
+        self.clock_subscription = clock.subscribe(self.update_time, granularity, widget=self.time_button)
+
+    def update_time(self, now):
         """Update the time display on the button"""
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
-        self.time_button.set_label(current_time)
-        return True  # Return True to keep the timer running
+        time_format = "%H:%M:%S" if self.power.clock_seconds else "%H:%M"
+        self.time_button.set_label(now.strftime(time_format))
 
     def on_back_button_clicked(self, button):
         # Remove CSS classes from stack and dashboard, then show not active event box.
-        self.notch.collapse_notch()
\ No newline at end of file
+        self.notch.collapse_notch()
+
+
+class BatteryGraph(VisibilityGated, Gtk.Box):
+    """Charge level, time estimate and a sparkline of the battery's recent energy"""
+
+    SAMPLES = 120  # newest history samples plotted
+
+    def __init__(self, battery):
+        super().__init__(name="battery-graph", orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        self.gate_updates("battery_graph")
+        self.battery = battery
+        self.label = Gtk.Label(name="battery-graph-label", xalign=0)
+        self.sparkline = Sparkline(name="battery-sparkline", hexpand=True)
+        self.append(self.label)
+        self.append(self.sparkline)
+
+        battery.connect("sample-added", lambda _battery: self.defer_update("sample", self.update_sparkline))
+        battery.connect("notify", lambda *_args: self.defer_update("label", self.update_label))
+        self.update_sparkline()
+        self.update_label()
+
+    def update_sparkline(self):
+        self.sparkline.set_values(self.battery.history.values('energy', self.SAMPLES))
+
+    def update_label(self):
+        battery = self.battery
+        text = f"{battery.percentage:.0f}%"
+        if battery.status == STATUS_DISCHARGING and battery.time_to_empty > 0:
+            text += f"  {self._format_duration(battery.time_to_empty)} left"
+        elif battery.status == STATUS_CHARGING and battery.time_to_full > 0:
+            text += f"  {self._format_duration(battery.time_to_full)} to full"
+        self.label.set_label(text)
+
+    @staticmethod
+    def _format_duration(seconds):
+        hours, remainder = divmod(seconds, 3600)
+        return f"{hours}:{remainder // 60:02d}"
+
+
+class DebugOverlay(Gtk.Label):
+    """The bar's own CPU, memory and GC use, sampled only while shown"""
+
+    def __init__(self):
+        super().__init__(name="debug-overlay", xalign=0)
+        self.monitor = SelfMonitor.get_default()
+        self._handler = None
+        self.connect("map", self.on_map)
+        self.connect("unmap", self.on_unmap)
+
+    def on_map(self, _widget):
+        self._handler = self.monitor.connect("sampled", self.update)
+        self.monitor.hold()
+        self.update(self.monitor)
+
+    def on_unmap(self, _widget):
+        self.monitor.release()
+        if self._handler is not None:
+            self.monitor.disconnect(self._handler)
+            self._handler = None
+
+    def update(self, monitor):
+        busiest = sorted(monitor.threads.items(), key=lambda item: item[1].last, reverse=True)[:3]
+        pauses = monitor.gc_pauses.values()
+        self.set_label(
+            f"CPU {monitor.cpu_percent.last:.1f}%  RSS {monitor.rss_mb.last:.0f} MB  "
+            f"GC max {max(pauses, default=0):.1f} ms\n"
+            + "  ".join(f"{monitor.thread_names[tid]} {buffer.last:.1f}%" for tid, buffer in busiest)
+        )
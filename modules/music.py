@@ -1,15 +1,23 @@
-from gi.repository import Gtk, GLib, GdkPixbuf, Pango
-import urllib.request
-import os
-import tempfile
-from service.mpris import MprisPlayerManager, MprisPlayer
+from gi.repository import Gtk, Gdk, GLib, Pango
+from service.mpris import MprisPlayerManager, MprisPlayer, ProgressClock
+from service.artcache import AlbumArtCache
+from service.state import StateHub
 from widgets.progressbar import CustomProgressBar
+from widgets.visibility import VisibilityGated
 import modules.icons as icons
 import hashlib
-class MusicPlayer(Gtk.Box):
+class MusicPlayer(VisibilityGated, Gtk.Box):
+    # MprisPlayer property names that affect each part of the UI
+    TRACK_PROPS = frozenset(("metadata", "title", "artist"))
+    ART_PROPS = frozenset(("metadata", "arturl"))
+    PROGRESS_PROPS = frozenset(("metadata", "length", "seeked"))
+    CONTROL_PROPS = frozenset(("can-go-previous", "can-go-next", "can-pause"))
+    
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
         self.set_name("music-player")
+        self.gate_updates("music")
+        self._pending_dirty = set()  # properties changed while hidden
         
         self.manager = MprisPlayerManager()
         self.manager.connect("player-appeared", self.on_player_appeared)
@@ -29,6 +37,25 @@ class MusicPlayer(Gtk.Box):
         self.can_go_next = False
         self.can_pause = False
         
+        self.art_cache = AlbumArtCache.get_default()
+        self._displayed_art_url = None
+        self._requested_art_url = None
+        self._art_cancellable = None
+        
+        # Colours picked from the current art, exposed as --art-* CSS variables
+        self.palette = None
+        self._palette_provider = Gtk.CssProvider()
+        Gtk.StyleContext.add_provider_for_display(
+            Gdk.Display.get_default(),
+            self._palette_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1
+        )
+        
+        # One shared clock drives progress, and only while we're on screen
+        self.progress_clock = ProgressClock.get_default()
+        self.connect("map", lambda *_: self.progress_clock.set_visible(True))
+        self.connect("unmap", lambda *_: self.progress_clock.set_visible(False))
+        
         self.switcher_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         self.switcher_box.set_size_request(32, -1)
         self.switcher_box.set_valign(Gtk.Align.CENTER)
@@ -210,6 +237,8 @@ class MusicPlayer(Gtk.Box):
                 else:
                     self.active_player = None
                     self.active_player_name = None
+                    self.progress_clock.set_player(None)
+                    StateHub.get_default().watch_media(None)
                     self.stack.set_visible_child_name("placeholder")
                     self.switcher_box.hide()
 
@@ -240,8 +269,10 @@ class MusicPlayer(Gtk.Box):
     def set_active_player(self, player_name):
         self.active_player_name = player_name
         self.active_player = self.players[player_name]['mpris_player']
+        self.progress_clock.set_player(self.active_player)
+        StateHub.get_default().watch_media(self.active_player)
         self.update_player_data()
-        self.update_ui()
+        self.refresh(None)
         for p_name, p_data in self.players.items():
             label = p_data['label']
             icon = p_data['active_icon'] if p_name == self.active_player_name else p_data['inactive_icon']
@@ -264,7 +295,7 @@ class MusicPlayer(Gtk.Box):
             self.artist_name = self.active_player.artist or "Unknown Artist"
             self.track_image = self.active_player.arturl
             self.track_length = self.active_player.length or 0
-            self.current_position = self.active_player.position or 0
+            self.current_position = self.active_player.estimated_position
             self.playback_status = self.active_player.playback_status
             self.can_go_previous = self.active_player.can_go_previous
             self.can_go_next = self.active_player.can_go_next
@@ -283,51 +314,73 @@ class MusicPlayer(Gtk.Box):
             progress_bar_width = 380 - (time_label_width * 2) - 10
         self.progress_bar.set_size_request(progress_bar_width, 5)
 
-    def update_ui(self):
-        self.track_title_label.set_label(self.track_title)
-        self.artist_name_label.set_label(self.artist_name)
-        
-        if self.playback_status == "playing":
-            self.play_pause_label.set_markup(icons.pause)
-        else:
-            self.play_pause_label.set_markup(icons.play)
-        
-        if self.can_go_previous:
-            self.previous_box.get_style_context().remove_class("disabled")
-        else:
-            self.previous_box.get_style_context().add_class("disabled")
-        
-        if self.can_go_next:
-            self.next_box.get_style_context().remove_class("disabled")
-        else:
-            self.next_box.get_style_context().add_class("disabled")
-        
-        if self.can_pause:
-            self.play_pause_box.get_style_context().remove_class("disabled")
-        else:
-            self.play_pause_box.get_style_context().add_class("disabled")
-        
-        if self.track_image:
-            self.update_album_art(self.album_art_image, self.track_image)
+    def refresh(self, dirty):
+        """`update_ui(dirty)` now if shown, otherwise once when next shown"""
+        if dirty is None or self._pending_dirty is None:
+            self._pending_dirty = None
         else:
-            self.album_art_image.clear()
-        
-        show_hours = self.track_length >= 3600 * 1000000
-        self.adjust_progress_bar_width(show_hours)
-        
-        self.current_time_label.set_label(self.format_time(self.current_position, show_hours))
-        self.total_time_label.set_label(self.format_time(self.track_length, show_hours))
-        
-        if self.track_length > 0:
-            progress = self.current_position / self.track_length
-            self.progress_bar.set_fraction(progress)
-        else:
-            self.progress_bar.set_fraction(0)
+            self._pending_dirty |= dirty
+        self.defer_update("ui", self._apply_pending_dirty)
 
-    def on_player_changed(self, mpris_player, player_name):
+    def _apply_pending_dirty(self):
+        dirty, self._pending_dirty = self._pending_dirty, set()
+        self.update_ui(dirty)
+
+    def update_ui(self, dirty=None):
+        """Refresh the widgets affected by `dirty` property names, or all of them."""
+        if dirty is None or dirty & self.TRACK_PROPS:
+            self.track_title_label.set_label(self.track_title)
+            self.artist_name_label.set_label(self.artist_name)
+        
+        if dirty is None or "playback-status" in dirty:
+            if self.playback_status == "playing":
+                self.play_pause_label.set_markup(icons.pause)
+            else:
+                self.play_pause_label.set_markup(icons.play)
+        
+        if dirty is None or dirty & self.CONTROL_PROPS:
+            if self.can_go_previous:
+                self.previous_box.get_style_context().remove_class("disabled")
+            else:
+                self.previous_box.get_style_context().add_class("disabled")
+            
+            if self.can_go_next:
+                self.next_box.get_style_context().remove_class("disabled")
+            else:
+                self.next_box.get_style_context().add_class("disabled")
+            
+            if self.can_pause:
+                self.play_pause_box.get_style_context().remove_class("disabled")
+            else:
+                self.play_pause_box.get_style_context().add_class("disabled")
+        
+        if dirty is None or dirty & self.ART_PROPS:
+            if self.track_image:
+                if self.track_image != self._displayed_art_url:
+                    self.update_album_art(self.album_art_image, self.track_image)
+            else:
+                self._cancel_album_art()
+                self._displayed_art_url = None
+                self.album_art_image.clear()
+                self.apply_palette(None)
+        
+        if dirty is None or dirty & self.PROGRESS_PROPS:
+            show_hours = self.track_length >= 3600 * 1000000
+            self.adjust_progress_bar_width(show_hours)
+            
+            self.current_time_label.set_label(self.format_time(self.current_position, show_hours))
+            self.total_time_label.set_label(self.format_time(self.track_length, show_hours))
+            
+            if self.track_length > 0:
+                progress = self.current_position / self.track_length
+                self.progress_bar.set_fraction(progress)
+            else:
+                self.progress_bar.set_fraction(0)
+
+    def on_player_changed(self, mpris_player, dirty, player_name):
         if player_name == self.active_player_name:
             self.update_player_data()
-            self.update_ui()
+            self.refresh(dirty)
 
     def on_progress_updated(self, mpris_player, pos_usec, len_usec, player_name):
         if player_name == self.active_player_name:
@@ -335,12 +388,15 @@ class MusicPlayer(Gtk.Box):
                 return
             self.current_position = pos_usec
             self.track_length = len_usec
-            show_hours = self.track_length >= 3600 * 1000000
-            self.adjust_progress_bar_width(show_hours)
-            self.current_time_label.set_label(self.format_time(self.current_position, show_hours))
-            self.total_time_label.set_label(self.format_time(self.track_length, show_hours))
-            if self.track_length > 0:
-                self.progress_bar.set_fraction(self.current_position / self.track_length)
+            self.defer_update("progress", self._update_progress)
+
+    def _update_progress(self):
+        show_hours = self.track_length >= 3600 * 1000000
+        self.adjust_progress_bar_width(show_hours)
+        self.current_time_label.set_label(self.format_time(self.current_position, show_hours))
+        self.total_time_label.set_label(self.format_time(self.track_length, show_hours))
+        if self.track_length > 0:
+            self.progress_bar.set_fraction(self.current_position / self.track_length)
 
     def on_previous_clicked(self, gesture, n_press, x, y):
         if self.active_player and self.can_go_previous:
@@ -355,32 +411,42 @@ class MusicPlayer(Gtk.Box):
             self.active_player.next()
 
     def update_album_art(self, image_widget, url):
-        def load_art():
-            try:
-                with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as temp_file:
-                    urllib.request.urlretrieve(url, temp_file.name)
-                    def set_image():
-                        try:
-                            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                                temp_file.name, 60, 60, True
-                            )
-                            image_widget.set_from_pixbuf(pixbuf)
-                        except Exception as e:
-                            print(f"Error setting album art: {e}")
-                            image_widget.clear()
-                        finally:
-                            try:
-                                os.unlink(temp_file.name)
-                            except:
-                                pass
-                        return False
-                    GLib.idle_add(set_image)
-            except Exception as e:
-                print(f"Error loading album art: {e}")
-                GLib.idle_add(lambda: image_widget.clear())
-        
-        import threading
-        threading.Thread(target=load_art, daemon=True).start()
+        if self._art_cancellable is not None and self._requested_art_url == url:
+            return
+        # Drop a load for the previous track that hasn't finished yet
+        self._cancel_album_art()
+        self._requested_art_url = url
+        
+        def set_image(texture):
+            self._art_cancellable = None
+            self._requested_art_url = None
+            if texture is not None:
+                # Only now, so art that failed to load is requested again on the next update
+                self._displayed_art_url = url
+                image_widget.set_from_paintable(texture)
+            else:
+                self._displayed_art_url = None
+                image_widget.clear()
+            self.apply_palette(self.art_cache.palette(url, 60))
+        
+        self._art_cancellable = self.art_cache.request(url, 60, set_image)
+
+    def apply_palette(self, palette):
+        """Expose `palette` as --art-* CSS variables on the music player."""
+        if palette == self.palette:
+            return
+        self.palette = palette
+        if palette:
+            variables = " ".join(f"--art-{role}: {color};" for role, color in palette.items())
+            self._palette_provider.load_from_string(f"#music-player {{ {variables} }}")
+        else:
+            self._palette_provider.load_from_string("")
+
+    def _cancel_album_art(self):
+        if self._art_cancellable is not None:
+            self._art_cancellable.cancel()
+            self._art_cancellable = None
+        self._requested_art_url = None
 
     def format_time(self, microseconds, show_hours=False):
         if not microseconds or microseconds < 0:
@@ -2,8 +2,9 @@ import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, GLib, Gio
 from service.network import NetworkManager, AccessPoint
+from widgets.visibility import VisibilityGated
 
-class NetworkStack(Gtk.Box):
+class NetworkStack(VisibilityGated, Gtk.Box):
     """Main Network management widget."""
 
     def __init__(self, notch, **kwargs):
@@ -12,6 +13,7 @@ class NetworkStack(Gtk.Box):
             spacing=8,
             orientation=Gtk.Orientation.VERTICAL
         )
+        self.gate_updates("network")  # the AP list is only rebuilt while shown
         self._create_ui()
         self.network_manager = NetworkManager()
         self.ethernet_signal_connected = False
@@ -31,21 +33,26 @@ class NetworkStack(Gtk.Box):
         if self.network_manager.wifi_manager:
             # Note: In a more complex app, you'd manage signal handler IDs
             # to prevent connecting multiple times. For now, we rely on GObject's behavior.
-            self.network_manager.wifi_manager.signals.connect('wifi-changed', self._update_wifi_ui)
-            self.network_manager.wifi_manager.signals.connect('wifi-enabled-changed', self._update_wifi_ui)
+            self.network_manager.wifi_manager.signals.connect('wifi-changed', self._on_wifi_changed)
+            self.network_manager.wifi_manager.signals.connect('wifi-enabled-changed', self._on_wifi_changed)
             self.wifi_switch.set_sensitive(True)
         else:
             self.wifi_switch.set_sensitive(False)
 
         # Setup Ethernet signals if the manager is available and not already connected
         if self.network_manager.ethernet_manager and not self.ethernet_signal_connected:
-            self.network_manager.ethernet_manager.signals.connect('ethernet-changed', self._update_ethernet_ui)
+            self.network_manager.ethernet_manager.signals.connect('ethernet-changed', self._on_ethernet_changed)
             self.ethernet_signal_connected = True
 
         # Perform a full UI update
-        GLib.idle_add(self._update_ethernet_ui)
-        GLib.idle_add(self._update_wifi_ui)
+        GLib.idle_add(self._on_ethernet_changed)
+        GLib.idle_add(self._on_wifi_changed)
 
+    def _on_wifi_changed(self, *args):
+        return self.defer_update("wifi", self._update_wifi_ui)
+
+    def _on_ethernet_changed(self, *args):
+        return self.defer_update("ethernet", self._update_ethernet_ui, *args)
 
     def _create_ui(self):
         """Create the user interface."""
@@ -9,14 +9,36 @@ gi.require_version('GLib', '2.0')
 
 from gi.repository import Gtk, GLib, Gdk, Gio
 from gi.repository import Gtk4LayerShell as LayerShell
-import datetime
+import time
+from loguru import logger
 from widgets.corner import Corner
-from modules.dashboard import Dashboard
-from modules.music import MusicPlayer
+from service.clock import WallClock, MINUTE
+from service.profiler import StartupProfiler
+from service.lazy import lazy_import
+from service.power import PowerProfile
 from modules.notifications import NotificationCenter
 from modules.osd import Osd
-from modules.applauncher import ApplicationLauncherBox
+
+# Lazy pages, imported with their services when first built
+dashboard_module = lazy_import("modules.dashboard")
+music_module = lazy_import("modules.music")
+applauncher_module = lazy_import("modules.applauncher")
+
+PREWARM_SLICE_MS = 8  # build budget per idle slice when prewarming pages
+
+profiler = StartupProfiler.get_default()
+
 class Notch(Gtk.Overlay):
+    """
+    The notch and its pages.
+
+    Pages that only matter once opened (dashboard, music, app launcher) are
+    registered as factories with `register_page` and built on first
+    `open_notch(name)`, or in idle time after the first frame, lowest
+    priority value first and within PREWARM_SLICE_MS per idle slice. The OSD
+    and notification center are built eagerly since they react to events
+    while closed.
+    """
     def __init__(self,  notch_window=None, **kwargs):
         super().__init__(name="notch-overlay")
         self.set_halign(Gtk.Align.CENTER)
@@ -28,6 +50,11 @@ class Notch(Gtk.Overlay):
         
         self.normal_height = 30
         self.previous_widget = 'active-event-box'
+        self._init_start = time.perf_counter()
+        self._page_factories = {}  # name -> (priority, factory), for pages not built yet
+        self.suspended = False
+        self._prewarm_id = None
+        self._first_frame_done = False
         
         # Widget configurations for easier management
         self.widget_configs = {
@@ -43,21 +70,108 @@ class Notch(Gtk.Overlay):
         self._init_controllers()
         self._init_corners()
         self._start_timers()
+        self._init_lazy_pages()
+        self.power = PowerProfile.get_default()
+        self.power.connect("notify::profile", self._on_power_profile_changed)
+        self._on_power_profile_changed(self.power)
 
     def _init_widgets(self):
-        """Initialize all widgets"""
-        self.dashboard = Dashboard(notch=self)
-        self.osd = Osd(notch=self)
-        self.music_player = MusicPlayer()
-        self.applauncher = ApplicationLauncherBox(notch=self)
-        self.notification_center = NotificationCenter(self)
+        """Initialize the widgets that must exist before the notch is shown"""
+        with profiler.span("Osd", "widget"):
+            self.osd = Osd(notch=self)
+        with profiler.span("NotificationCenter", "widget"):
+            self.notification_center = NotificationCenter(self)
         
         # Update widget configs
-        self.widget_configs['dashboard']['widget'] = self.dashboard
-        self.widget_configs['music']['widget'] = self.music_player
         self.widget_configs['osd']['widget'] = self.osd
-        self.widget_configs['applauncher']['widget'] = self.applauncher
         self.widget_configs['notification']['widget'] = self.notification_center.notification_view
+
+    def _init_lazy_pages(self):
+        """Register the pages built on demand, in prewarm order"""
+        self.register_page('music', lambda: music_module.MusicPlayer(), priority=0)
+        self.register_page('dashboard', lambda: dashboard_module.Dashboard(notch=self), priority=1)
+        self.register_page('applauncher', lambda: applauncher_module.ApplicationLauncherBox(notch=self), priority=2)
+        self.add_tick_callback(self._on_first_frame)
+
+    def register_page(self, name, factory, priority=0):
+        """Register `factory()` to build the stack page `name` when first needed"""
+        self._page_factories[name] = (priority, factory)
+
+    def page(self, name):
+        """Return the stack page `name`, building it if it is still a factory"""
+        if name in self._page_factories:
+            self._build_page(name)
+        return self.stack.get_child_by_name(name)
+
+    @property
+    def dashboard(self):
+        return self.page('dashboard')
+
+    @property
+    def music_player(self):
+        return self.page('music')
+
+    @property
+    def applauncher(self):
+        return self.page('applauncher')
+
+    def _build_page(self, name):
+        _priority, factory = self._page_factories.pop(name)
+        start = time.perf_counter()
+        with profiler.span(f"Notch page {name}", "widget"):
+            try:
+                widget = factory()
+            except ImportError as e:
+                # A missing optional library only takes this page down
+                logger.warning(f"[Notch] Page '{name}' unavailable: {e}")
+                widget = self._unavailable_page(name)
+        self.stack.add_named(widget, name)
+        self._add_key_controller(widget)
+        if name in self.widget_configs:
+            self.widget_configs[name]['widget'] = widget
+        logger.info(f"[Notch] Built page '{name}' in {(time.perf_counter() - start) * 1000:.1f} ms")
+        return widget
+
+    def _unavailable_page(self, name):
+        label = Gtk.Label(label=f"{name.capitalize()} is unavailable.\nA required library is not installed.",
+                          halign=Gtk.Align.CENTER, valign=Gtk.Align.CENTER, vexpand=True)
+        page = Gtk.Box(name=f"{name}-unavailable", orientation=Gtk.Orientation.VERTICAL)
+        page.append(label)
+        return page
+
+    def _on_first_frame(self, widget, frame_clock):
+        logger.info(f"[Notch] First frame after {(time.perf_counter() - self._init_start) * 1000:.1f} ms")
+        self._first_frame_done = True
+        self._schedule_prewarm()
+        return GLib.SOURCE_REMOVE
+
+    def _schedule_prewarm(self):
+        """Build pending pages in idle time, unless the power profile is reduced"""
+        if self._page_factories and self._prewarm_id is None and self.power.prewarm:
+            self._prewarm_id = GLib.idle_add(self._prewarm_pages, priority=GLib.PRIORITY_LOW)
+
+    def _on_power_profile_changed(self, power, _pspec=None):
+        """Follow the power profile's transitions and idle prewarming"""
+        self.active_event_box.set_transition_duration(power.transition_duration(100))
+        self.stack.set_transition_duration(power.transition_duration(400))
+        if not power.prewarm and self._prewarm_id is not None:
+            GLib.source_remove(self._prewarm_id)
+            self._prewarm_id = None
+        elif self._first_frame_done:
+            self._schedule_prewarm()
+
+    def _prewarm_pages(self):
+        """Build pending pages in priority order until the slice budget is spent"""
+        deadline = time.perf_counter() + PREWARM_SLICE_MS / 1000
+        while self._page_factories:
+            name = min(self._page_factories, key=lambda n: self._page_factories[n][0])
+            self._build_page(name)
+            if time.perf_counter() >= deadline:
+                break
+        if self._page_factories:
+            return True
+        self._prewarm_id = None
+        return False
         
     def _init_stack(self):
         """Initialize the main stack and active event box"""
@@ -74,7 +188,7 @@ class Notch(Gtk.Overlay):
         
         # Time label
         self.time_label = Gtk.Label()
-        self._update_time()
+        WallClock.get_default().subscribe(self._update_time, MINUTE, widget=self.time_label)
         self.active_event_box.add_named(self.time_label, 'time-date')
         
         # Main stack setup
@@ -89,12 +203,9 @@ class Notch(Gtk.Overlay):
         self.stack.set_vhomogeneous(False)
         self.stack.set_interpolate_size(True)  # Don't forget this!
 
-        # Add all widgets to stack
-        self.stack.add_named(self.dashboard, 'dashboard')
+        # Add eager widgets to stack, lazy pages are added when built
         self.stack.add_named(self.osd, 'osd')
         self.stack.add_named(self.active_event_box, 'active-event-box')
-        self.stack.add_named(self.music_player, 'music')
-        self.stack.add_named(self.applauncher, 'applauncher')
         
         # Notification page
         self.notification_page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, name="notification-page")
@@ -125,15 +236,17 @@ class Notch(Gtk.Overlay):
         
         # Key controllers
         widgets_for_key_control = [
-            self, self.dashboard, self.notification_page, 
-            self.active_event_box, self.stack, self.music_player, self.osd, self.applauncher
+            self, self.notification_page, self.active_event_box, self.stack, self.osd
         ]
         
         for widget in widgets_for_key_control:
-            key_controller = Gtk.EventControllerKey.new()
-            key_controller.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
-            key_controller.connect("key-pressed", self.on_key_pressed)
-            widget.add_controller(key_controller)
+            self._add_key_controller(widget)
+
+    def _add_key_controller(self, widget):
+        key_controller = Gtk.EventControllerKey.new()
+        key_controller.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+        key_controller.connect("key-pressed", self.on_key_pressed)
+        widget.add_controller(key_controller)
 
     def _init_corners(self):
         """Initialize corner widgets"""
@@ -151,7 +264,6 @@ class Notch(Gtk.Overlay):
 
     def _start_timers(self):
         """Start periodic timers"""
-        GLib.timeout_add_seconds(1, self._update_time)
         GLib.timeout_add(100, self.ensure_keyboard_focus)
 
     def ensure_keyboard_focus(self):
@@ -159,13 +271,11 @@ class Notch(Gtk.Overlay):
         self.grab_focus()
         return False
 
-    def _update_time(self):
+    def _update_time(self, now):
         """Update time display"""
-        now = datetime.datetime.now()
         time_str = now.strftime("%I:%M %p")
         date_str = now.strftime(" · %A %d/%m")
         self.time_label.set_markup(f'<span size="11000" foreground="white"><b>{time_str}</b>{date_str}</span>')
-        return True
 
     def _apply_widget_styling(self, widget_name, is_opening=True):
         """Apply or remove CSS styling for widgets with GLib.idle_add for smooth transitions"""
@@ -195,11 +305,29 @@ class Notch(Gtk.Overlay):
         GLib.idle_add(apply_stack_class)
         GLib.idle_add(apply_widget_class)
 
+    def set_suspended(self, suspended):
+        """
+        Hide the notch while a fullscreen window covers it. Pages opened by
+        the user still show it; the OSD and notifications don't.
+        """
+        self.suspended = suspended
+        if not self.notch_window:
+            return
+        if suspended and self.stack.get_visible_child_name() in ('active-event-box', 'osd', 'notification'):
+            self.collapse_notch()
+        else:
+            self.notch_window.set_visible(True)
+
     def open_notch(self, widget_name):
         """Open a specific notch widget"""
         current = self.stack.get_visible_child_name()
         if current == widget_name:
             return
+        if self.suspended and self.notch_window:
+            if widget_name in ('osd', 'notification'):
+                return
+            self.notch_window.set_visible(True)
+        self.page(widget_name)
             
         # Handle keyboard mode for applauncher
         if widget_name == 'applauncher' and self.notch_window:
@@ -304,8 +432,14 @@ class Notch(Gtk.Overlay):
             self.stack.set_visible_child_name('active-event-box')
             self.active_event_box.grab_focus()
         
+        self._hide_while_suspended()
         return False
 
+    def _hide_while_suspended(self):
+        """Hide the collapsed notch while a fullscreen window covers it"""
+        if self.suspended and self.notch_window and self.stack.get_visible_child_name() == 'active-event-box':
+            self.notch_window.set_visible(False)
+
     def on_key_pressed(self, controller, keyval, keycode, state):
         """Handle key press events"""
         if keyval in [Gdk.KEY_Escape, 65307]:
@@ -328,6 +462,7 @@ class Notch(Gtk.Overlay):
                 elif hasattr(self.active_event_box, 'grab_focus'):
                     self.active_event_box.grab_focus()
             
+            self._hide_while_suspended()
             return True
                 
         return False
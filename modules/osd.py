@@ -4,10 +4,13 @@ from gi.repository import Gtk, Gdk, GLib
 from datetime import datetime
 import os
 from widgets.progressbar import CustomProgressBar
-from service.audio import Audio # Import the Audio service
 from service.backlight import BacklightService # Import the Backlight service
+from service.lazy import lazy_import
+from widgets.visibility import VisibilityGated
 
-class Osd(Gtk.Box):
+audio = lazy_import("service.audio")  # Cvc is optional, loaded with the service
+
+class Osd(VisibilityGated, Gtk.Box):
     def __init__(self, notch=None, stack=None, **kwargs):
         super().__init__(
             name="osd",
@@ -25,6 +28,7 @@ class Osd(Gtk.Box):
         self.previous_volume = 0  # Will be updated after service initialization
         self.set_halign(Gtk.Align.CENTER)
         self.set_valign(Gtk.Align.CENTER)
+        self.gate_updates("osd")  # labels and bars only redraw while the OSD page is shown
         self.ran_once = False  # Track if the widget has been displayed once
         # Main vertical box
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
@@ -103,7 +107,7 @@ class Osd(Gtk.Box):
 
         # Initialize Audio Service
         try:
-            self.audio_service = Audio()
+            self.audio_service = audio.Audio()
             
             # Initial update for volume display (without triggering notch)
             self._update_volume_display_from_service(is_initial=True)
@@ -253,13 +257,13 @@ class Osd(Gtk.Box):
             if max_brightness > 0:
                 current_brightness_fraction = current_brightness / max_brightness
         
-        self._update_brightness_display_from_service()
+        self.defer_update("brightness", self._update_brightness_display_from_service)
         # Open notch and schedule collapse when brightness changes (only after initialization)
         self._open_notch_and_schedule_collapse(current_brightness=current_brightness_fraction)
 
     def _on_backlight_availability_changed(self, backlight_service, pspec):
         """Handle backlight availability changes."""
-        self._update_brightness_display_from_service()
+        self.defer_update("brightness", self._update_brightness_display_from_service)
 
     def _update_volume_display_from_service(self, is_initial=False):
         if self.audio_service and self.audio_service.speaker:
@@ -290,14 +294,14 @@ class Osd(Gtk.Box):
             volume_percentage = self.audio_service.speaker.volume
             current_volume_fraction = volume_percentage / 100.0
         
-        self._update_volume_display_from_service()
+        self.defer_update("volume", self._update_volume_display_from_service)
         # Open notch and schedule collapse when volume changes (only after initialization)
         self._open_notch_and_schedule_collapse(current_volume=current_volume_fraction)
 
     def _on_audio_service_state_changed(self, audio_service_instance):
         # This signal is for general changes in the audio service.
         # It's a good place to ensure the speaker is picked up if it wasn't ready initially.
-        self._update_volume_display_from_service()
+        self.defer_update("volume", self._update_volume_display_from_service)
 
     def update_brightness_label(self, fraction, error=False):
         if error:
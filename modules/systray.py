@@ -10,9 +10,10 @@ except OSError:
 
 gi.require_version('Gtk', '4.0')
 gi.require_version('Gtk4LayerShell', '1.0')
-gi.require_version('AstalTray', '0.1')
 from gi.repository import Gtk, GLib, Gdk, GObject, Gio
-from gi.repository import AstalTray as Tray
+from service.lazy import require_typelib
+
+Tray = require_typelib('AstalTray', '0.1')
 
 # Define SYNC constant
 SYNC = GObject.BindingFlags.SYNC_CREATE
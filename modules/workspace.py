@@ -4,6 +4,7 @@ from gi.repository import Gtk, Gdk, GLib
 import math
 
 from service.hyprland import HyprlandService
+from service.power import PowerProfile
 
 class WorkspaceIndicator(Gtk.Box):
     """
@@ -319,7 +320,7 @@ class WorkspaceIndicator(Gtk.Box):
         # Handle workspace change animation
         if self.previous_workspace != active_id:
             self.previous_workspace = active_id
-            if self.is_initialized:
+            if self.is_initialized and self.get_mapped():
                 GLib.idle_add(self.start_animation_sequence, active_id)
             else:
                 # If not initialized yet, just position directly
@@ -365,7 +366,9 @@ class WorkspaceIndicator(Gtk.Box):
                 
                 self.animation_phase = self.PHASE_MOVE_GRADIENT_AND_ADJUST_MARGINS
                 self.phase_start_times = [0, self.phase_durations[0]]
-                self.animation_source_id = GLib.idle_add(self.multi_phase_animation_step)
+                self.animation_source_id = GLib.timeout_add(
+                    PowerProfile.get_default().frame_interval, self.multi_phase_animation_step
+                )
             else:
                 GLib.idle_add(self.start_animation_sequence, active_id)
                 return False
@@ -0,0 +1,313 @@
+import base64
+import hashlib
+import os
+import threading
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import gi
+gi.require_version('Gdk', '4.0')
+gi.require_version('GdkPixbuf', '2.0')
+from gi.repository import Gdk, GdkPixbuf, Gio, GLib
+
+from .constants import CACHE_DIR
+from .palette import PaletteCache
+from .eventbus import Topic, bus
+
+# Constants
+ART_CACHE_DIR = os.path.join(CACHE_DIR, "art")
+MEMORY_CACHE_SIZE = 32  # decoded textures kept in memory
+DOWNLOAD_TIMEOUT = 10  # seconds
+MAX_WORKERS = 2  # threads fetching and decoding art
+DISK_CACHE_BYTES = 64 * 1024 * 1024  # images kept on disk, least recently used evicted first
+DISK_CACHE_URLS = 2048  # URL index entries kept on disk
+
+LOADED = Topic("artcache.loaded", tuple)  # (cache, key, texture, palette, skipped) from the workers
+
+
+class AlbumArtCache:
+    """
+    Album art loader with a memory LRU and an on-disk store.
+
+    Lookups go through three levels:
+
+    1. An LRU of decoded `Gdk.Texture`s keyed by (url, size).
+    2. A content-addressed disk store: downloaded bytes are saved under their
+       SHA-256 and a small per-URL index file points at them, so the same
+       image served from different URLs is stored once. Hits refresh the
+       files' mtimes, and each download evicts the least recently used files
+       beyond `disk_bytes` of images or `disk_urls` index entries.
+    3. The source itself. `file://` and `data:` URLs are read directly, only
+       remote URLs are downloaded.
+
+    Fetching and decoding run on a small bounded thread pool. Images are
+    decoded with a `GdkPixbuf.PixbufLoader` scaled in its size-prepared
+    handler, so full-resolution bitmaps are never allocated, and only the
+    finished `Gdk.Texture` is handed to the main loop. Concurrent requests for
+    the same image share one job, and jobs whose requests were all cancelled
+    are dropped before doing any work.
+
+    The worker also extracts a colour palette from each decoded image (see
+    `service.palette`), cached by the hash of the image bytes. Use `palette()`
+    once the texture has been delivered.
+
+    Example usage:
+
+    ```python
+    cache = AlbumArtCache.get_default()
+    cancellable = cache.request(url, 60, lambda texture: image.set_from_paintable(texture))
+    # Later, when the track changes before the art arrived:
+    cancellable.cancel()
+    ```
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_default(cls) -> 'AlbumArtCache':
+        """Get the default album art cache instance."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, cache_dir: str = ART_CACHE_DIR, memory_size: int = MEMORY_CACHE_SIZE,
+                 max_workers: int = MAX_WORKERS, disk_bytes: int = DISK_CACHE_BYTES,
+                 disk_urls: int = DISK_CACHE_URLS):
+        self._cache_dir = cache_dir
+        self._disk_bytes = disk_bytes
+        self._disk_urls = disk_urls
+        self._disk_lock = threading.Lock()  # one worker evicts at a time
+        self._memory_size = memory_size
+        self._textures: "OrderedDict[tuple, tuple]" = OrderedDict()  # (url, size) -> (texture, palette)
+        self._palette_cache = PaletteCache()
+        self._in_flight: dict[tuple, list] = {}  # (url, size) -> [(callback, cancellable)]
+        self._in_flight_lock = threading.Lock()  # workers read the waiters in _is_wanted
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="art-loader")
+
+    def lookup(self, url: str, size: int) -> Optional[Gdk.Texture]:
+        """Return the decoded texture from memory, or None."""
+        key = (url, size)
+        entry = self._textures.get(key)
+        if entry is None:
+            return None
+        self._textures.move_to_end(key)
+        return entry[0]
+
+    def palette(self, url: str, size: int) -> Optional[dict]:
+        """Return the palette of a texture held in memory, or None."""
+        entry = self._textures.get((url, size))
+        return entry[1] if entry is not None else None
+
+    def request(self, url: str, size: int,
+                callback: Callable[[Optional[Gdk.Texture]], None]) -> Optional[Gio.Cancellable]:
+        """
+        Load `url` scaled to fit `size` pixels and call `callback(texture)`.
+
+        The callback always runs on the main loop, with None on failure. It is
+        called synchronously on a memory hit, in which case None is returned.
+        Otherwise the returned `Gio.Cancellable` drops the callback (and the
+        work, if nobody else is waiting for it) when cancelled.
+        """
+        texture = self.lookup(url, size)
+        if texture is not None:
+            callback(texture)
+            return None
+
+        cancellable = Gio.Cancellable()
+        key = (url, size)
+        with self._in_flight_lock:
+            waiters = self._in_flight.get(key)
+            if waiters is not None:
+                waiters.append((callback, cancellable))
+                return cancellable
+            self._in_flight[key] = [(callback, cancellable)]
+        self._executor.submit(self._load, key)
+        return cancellable
+
+    def _is_wanted(self, key: tuple) -> bool:
+        """Whether any request for `key` is still waiting."""
+        with self._in_flight_lock:
+            waiters = list(self._in_flight.get(key, ()))
+        return any(not cancellable.is_cancelled() for _, cancellable in waiters)
+
+    def _load(self, key: tuple):
+        """Fetch and decode one image (runs in the worker pool)."""
+        url, size = key
+        texture = None
+        palette = None
+        skipped = False  # dropped because nobody wanted it any more
+        try:
+            skipped = not self._is_wanted(key)
+            if not skipped:
+                data = self._fetch(url)
+                skipped = data is not None and not self._is_wanted(key)
+                if data is not None and not skipped:
+                    pixbuf = self._decode(data, size)
+                    if pixbuf is not None:
+                        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+                        digest = hashlib.sha256(data).hexdigest()
+                        palette = self._palette_cache.get_or_compute(digest, pixbuf)
+        except Exception as e:
+            print(f"Error loading album art: {e}")
+        bus.publish(LOADED, (self, key, texture, palette, skipped), key=(id(self), key))
+
+    def _fetch(self, url: str) -> Optional[bytes]:
+        """Return the encoded image bytes for `url`."""
+        path = self._local_path(url)
+        if path is None and url.startswith("data:"):
+            return self._decode_data_url(url)
+        if path is None:
+            path = self._disk_lookup(url)
+        if path is not None:
+            with open(path, "rb") as f:
+                return f.read()
+
+        with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+            data = response.read()
+        self._disk_store(url, data)
+        return data
+
+    def _local_path(self, url: str) -> Optional[str]:
+        if url.startswith("file://"):
+            return urllib.parse.unquote(urllib.parse.urlparse(url).path)
+        if url.startswith("/"):
+            return url
+        return None
+
+    def _decode_data_url(self, url: str) -> Optional[bytes]:
+        try:
+            header, _, payload = url.partition(",")
+            if header.endswith(";base64"):
+                return base64.b64decode(payload)
+            return urllib.parse.unquote_to_bytes(payload)
+        except ValueError as e:
+            print(f"Error decoding data URL: {e}")
+            return None
+
+    # --- Disk store ---
+
+    def _index_path(self, url: str) -> str:
+        return os.path.join(self._cache_dir, "urls", hashlib.sha1(url.encode()).hexdigest())
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self._cache_dir, "objects", digest[:2], digest)
+
+    def _disk_lookup(self, url: str) -> Optional[str]:
+        index_path = self._index_path(url)
+        try:
+            with open(index_path) as f:
+                path = self._object_path(f.read().strip())
+            # Mark both as recently used for eviction
+            os.utime(path)
+            os.utime(index_path)
+        except OSError:
+            return None
+        return path
+
+    def _disk_store(self, url: str, data: bytes) -> Optional[str]:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        try:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(f"{path}.tmp", "wb") as f:
+                    f.write(data)
+                os.replace(f"{path}.tmp", path)
+            index_path = self._index_path(url)
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            with open(index_path, "w") as f:
+                f.write(digest)
+        except OSError as e:
+            print(f"Error caching album art: {e}")
+            return None
+        self._disk_evict()
+        return path
+
+    def _disk_evict(self):
+        """Remove the least recently used files beyond the disk limits."""
+        with self._disk_lock:
+            objects = self._list_files(os.path.join(self._cache_dir, "objects"))
+            total = sum(size for _, _, size in objects)
+            for _, path, size in objects:
+                if total <= self._disk_bytes:
+                    break
+                self._remove(path)
+                total -= size
+            urls = self._list_files(os.path.join(self._cache_dir, "urls"))
+            for _, path, _ in urls[:max(0, len(urls) - self._disk_urls)]:
+                self._remove(path)
+
+    @staticmethod
+    def _list_files(directory: str) -> list[tuple[float, str, int]]:
+        """(mtime, path, size) of the files under `directory`, oldest first."""
+        files = []
+        for root, _dirs, names in os.walk(directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, path, stat.st_size))
+        files.sort()
+        return files
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    # --- Decoding ---
+
+    def _decode(self, data: bytes, size: int) -> Optional[GdkPixbuf.Pixbuf]:
+        """Decode `data` straight to display size."""
+        loader = GdkPixbuf.PixbufLoader()
+        loader.connect("size-prepared", self._on_size_prepared, size)
+        try:
+            loader.write(data)
+            loader.close()
+        except GLib.Error as e:
+            print(f"Error decoding album art: {e}")
+            return None
+        return loader.get_pixbuf()
+
+    def _deliver(self, key: tuple, texture: Optional[Gdk.Texture], palette: Optional[dict] = None,
+                 skipped: bool = False):
+        """Store the texture and run the callbacks that weren't cancelled."""
+        if texture is not None:
+            self._remember(key, texture, palette)
+        with self._in_flight_lock:
+            waiters = [w for w in self._in_flight.pop(key, []) if not w[1].is_cancelled()]
+            if skipped and waiters:
+                # Requests joined after the worker gave up on the job; run it again for them
+                self._in_flight[key] = waiters
+        if skipped and waiters:
+            self._executor.submit(self._load, key)
+            return
+        for callback, _cancellable in waiters:
+            callback(texture)
+
+    @staticmethod
+    def _on_size_prepared(loader, width, height, size):
+        """Scale to fit `size` while keeping the aspect ratio."""
+        scale = min(size / width, size / height) if width and height else 1
+        loader.set_size(max(1, int(width * scale)), max(1, int(height * scale)))
+
+    def _remember(self, key: tuple, texture: Gdk.Texture, palette: Optional[dict]):
+        self._textures[key] = (texture, palette)
+        self._textures.move_to_end(key)
+        while len(self._textures) > self._memory_size:
+            self._textures.popitem(last=False)
+
+
+def _on_loaded(loaded: list[tuple]):
+    for cache, key, texture, palette, skipped in loaded:
+        cache._deliver(key, texture, palette, skipped)
+
+
+bus.subscribe(LOADED, _on_loaded)
@@ -4,9 +4,14 @@ from typing import Literal
 import sys # For logger setup
 
 gi.require_version("Gtk", "4.0") # Though not directly used, good for GObject apps
-gi.require_version("Cvc", "1.0")
 
 from gi.repository import GObject, Gio, GLib # Added GLib for MainLoop
+from .lazy import require_typelib, TypelibUnavailable
+from .metrics import metrics
+
+STREAM_CHANGES = metrics.counter("audio.stream_changes", "Property changes of audio streams")
+STREAMS_ADDED = metrics.counter("audio.streams_added", "Audio streams added")
+STREAMS_REMOVED = metrics.counter("audio.streams_removed", "Audio streams removed")
 
 # --- Logger Setup ---
 logger.remove() # Remove default handler
@@ -24,16 +29,16 @@ def get_enum_member_name(enum_value, default: str = "unknown") -> str:
     return str(enum_value) if enum_value is not None else default
 
 
-class CvcImportError(ImportError):
+class CvcImportError(TypelibUnavailable):
     def __init__(self, *args):
         super().__init__(
-            "Cvc is not installed, please install it first, you can use automated installer in the git repository",
-            *args,
+            "Cvc", "1.0",
+            "please install it first, you can use automated installer in the git repository",
         )
 
 try:
-    from gi.repository import Cvc
-except ImportError:
+    Cvc = require_typelib("Cvc", "1.0")
+except TypelibUnavailable:
     logger.error("Failed to import Cvc. Please ensure it's installed correctly.")
     raise CvcImportError()
 
@@ -329,6 +334,7 @@ class Audio(GObject.Object):
                  return
 
         audio_stream = AudioStream(stream, self._control, self)
+        STREAMS_ADDED.inc()
         self._streams[stream_id] = audio_stream
         connector_id = audio_stream.connect("changed", lambda _as, sid=stream_id: self._handle_individual_stream_change(sid))
         self._stream_connectors[stream_id] = connector_id
@@ -342,6 +348,7 @@ class Audio(GObject.Object):
 
     def _handle_individual_stream_change(self, stream_id: int):
         # Callback for when a specific AudioStream's 'changed' signal is emitted
+        STREAM_CHANGES.inc()
         stream = self._streams.get(stream_id)
         if stream:
             logger.debug(f"Individual stream changed: {stream.name} (ID: {stream.id}, Volume: {stream.volume}%, Muted: {stream.muted})")
@@ -349,6 +356,7 @@ class Audio(GObject.Object):
 
     def on_stream_removed(self, _control: Cvc.MixerControl, stream_id: int):
         audio_stream = self._streams.pop(stream_id, None)
+        STREAMS_REMOVED.inc()
         if not audio_stream:
             logger.debug(f"Stream removed (id: {stream_id}) but it was not in our tracked list.")
             return
@@ -1,4 +1,5 @@
 import os
+import math
 import asyncio
 from typing import List, Optional, Callable
 import gi
@@ -12,6 +13,168 @@ from gi.repository import GObject, Gio, GLib
 # Constants
 SYS_BACKLIGHT = "/sys/class/backlight"
 
+# Brightness curves
+CURVE_LINEAR = "linear"
+CURVE_GAMMA = "gamma"
+CURVE_LOG = "log"
+DEFAULT_GAMMA = 2.2
+LOG_CURVE_BASE = 100.0
+
+# Ramp settings
+DEFAULT_RAMP_DURATION = 150  # milliseconds
+MAX_RAMP_WRITES = 30  # upper bound on bus writes issued by a single ramp
+
+
+def to_perceptual(value: int, max_value: int, curve: str = CURVE_GAMMA, gamma: float = DEFAULT_GAMMA) -> float:
+    """Map a raw brightness value to a perceptual fraction in [0, 1]."""
+    if max_value <= 0:
+        return 0.0
+    fraction = max(0.0, min(1.0, value / max_value))
+    if curve == CURVE_GAMMA:
+        return fraction ** (1.0 / gamma)
+    elif curve == CURVE_LOG:
+        return math.log1p(fraction * LOG_CURVE_BASE) / math.log1p(LOG_CURVE_BASE)
+    return fraction
+
+
+def from_perceptual(level: float, max_value: int, curve: str = CURVE_GAMMA, gamma: float = DEFAULT_GAMMA) -> int:
+    """Map a perceptual fraction in [0, 1] back to a raw brightness value."""
+    if max_value <= 0:
+        return 0
+    level = max(0.0, min(1.0, level))
+    if curve == CURVE_GAMMA:
+        fraction = level ** gamma
+    elif curve == CURVE_LOG:
+        fraction = math.expm1(level * math.log1p(LOG_CURVE_BASE)) / LOG_CURVE_BASE
+    else:
+        fraction = level
+    return int(round(fraction * max_value))
+
+
+class LogindSession(GObject.Object):
+    """
+    Shared systemd-logind session proxy.
+    
+    The session is resolved asynchronously (bus, GetSessionByPID, Session
+    proxy), so nothing blocks the main loop. Devices call `when_ready` to run
+    code once the proxy is available.
+    """
+    
+    __gsignals__ = {
+        'ready': (GObject.SignalFlags.RUN_FIRST, None, ()),
+    }
+    
+    LOGIND_NAME = "org.freedesktop.login1"
+    LOGIND_PATH = "/org/freedesktop/login1"
+    AUTO_SESSION_PATH = "/org/freedesktop/login1/session/auto"
+    
+    _instance = None
+    
+    @classmethod
+    def get_default(cls) -> 'LogindSession':
+        """Get the session shared by all backlight devices on the system bus."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self, connection: Optional[Gio.DBusConnection] = None):
+        """
+        Args:
+            connection: Bus to talk to logind on. Defaults to the system bus;
+                pass a private connection to use a logind stand-in.
+        """
+        super().__init__()
+        self._connection = connection
+        self._proxy: Optional[Gio.DBusProxy] = None
+        self._failed = False
+        self._resolving = False
+        self._pending: List[Callable[[Optional[Gio.DBusProxy]], None]] = []
+    
+    @property
+    def proxy(self) -> Optional[Gio.DBusProxy]:
+        """The session proxy, or None while unresolved or on failure."""
+        return self._proxy
+    
+    def when_ready(self, callback: Callable[[Optional[Gio.DBusProxy]], None]) -> None:
+        """Call `callback(proxy)` once the session is resolved (None on failure)."""
+        if self._proxy is not None or self._failed:
+            callback(self._proxy)
+            return
+        self._pending.append(callback)
+        self.resolve()
+    
+    def resolve(self) -> None:
+        """Start resolving the session proxy if not already in progress."""
+        if self._resolving or self._proxy is not None or self._failed:
+            return
+        self._resolving = True
+        if self._connection is None:
+            Gio.bus_get(Gio.BusType.SYSTEM, None, self._on_bus_ready, None)
+        else:
+            self._request_session_path()
+    
+    def _on_bus_ready(self, source, result, user_data):
+        try:
+            self._connection = Gio.bus_get_finish(result)
+        except Exception as e:
+            print(f"Error connecting to system bus: {e}")
+            self._finish(None)
+            return
+        self._request_session_path()
+    
+    def _request_session_path(self):
+        self._connection.call(
+            self.LOGIND_NAME,
+            self.LOGIND_PATH,
+            "org.freedesktop.login1.Manager",
+            "GetSessionByPID",
+            GLib.Variant("(u)", (os.getpid(),)),
+            GLib.VariantType.new("(o)"),
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None,
+            self._on_session_path,
+            None
+        )
+    
+    def _on_session_path(self, connection, result, user_data):
+        try:
+            session_path = connection.call_finish(result).get_child_value(0).get_string()
+        except Exception as e:
+            # Fallback - logind resolves "auto" to the caller's session
+            print(f"Error getting session path: {e}")
+            session_path = self.AUTO_SESSION_PATH
+        
+        Gio.DBusProxy.new(
+            connection,
+            Gio.DBusProxyFlags.DO_NOT_LOAD_PROPERTIES | Gio.DBusProxyFlags.DO_NOT_CONNECT_SIGNALS,
+            None,
+            self.LOGIND_NAME,
+            session_path,
+            "org.freedesktop.login1.Session",
+            None,
+            self._on_proxy_ready,
+            None
+        )
+    
+    def _on_proxy_ready(self, source, result, user_data):
+        try:
+            proxy = Gio.DBusProxy.new_finish(result)
+        except Exception as e:
+            print(f"Error setting up DBus proxy: {e}")
+            proxy = None
+        self._finish(proxy)
+    
+    def _finish(self, proxy: Optional[Gio.DBusProxy]):
+        self._resolving = False
+        self._proxy = proxy
+        self._failed = proxy is None
+        pending, self._pending = self._pending, []
+        for callback in pending:
+            callback(proxy)
+        if proxy is not None:
+            self.emit('ready')
+
 
 class BacklightDevice(GObject.Object):
     """
@@ -28,29 +191,43 @@ class BacklightDevice(GObject.Object):
                           -1, GLib.MAXINT, -1, GObject.ParamFlags.READABLE),
     }
     
-    def __init__(self, device_name: str):
+    def __init__(self, device_name: str, session: Optional[LogindSession] = None, root: str = SYS_BACKLIGHT):
         super().__init__()
         self._device_name = device_name
         self._brightness = -1
         self._max_brightness = -1
+        self._session = session or LogindSession.get_default()
+        self._brightness_fd: Optional[int] = None
+        
+        # Coalescing writer state: at most one SetBrightness call in flight,
+        # newer values overwrite the pending one instead of queueing up.
+        self._write_in_flight = False
+        self._pending_write: Optional[int] = None
+        self._last_written: Optional[int] = None
         
-        self._PATH_TO_BRIGHTNESS = os.path.join(SYS_BACKLIGHT, device_name, "brightness")
-        self._PATH_TO_MAX_BRIGHTNESS = os.path.join(SYS_BACKLIGHT, device_name, "max_brightness")
+        self._PATH_TO_BRIGHTNESS = os.path.join(root, device_name, "brightness")
+        self._PATH_TO_MAX_BRIGHTNESS = os.path.join(root, device_name, "max_brightness")
         
         # Read max brightness
         try:
-            with open(self._PATH_TO_MAX_BRIGHTNESS) as f:
-                self._max_brightness = int(f.read().strip())
-        except (IOError, ValueError) as e:
+            fd = os.open(self._PATH_TO_MAX_BRIGHTNESS, os.O_RDONLY)
+            try:
+                self._max_brightness = int(os.pread(fd, 32, 0).strip())
+            finally:
+                os.close(fd)
+        except (OSError, ValueError) as e:
             print(f"Error reading max brightness for {device_name}: {e}")
             self._max_brightness = -1
         
+        # Keep the brightness attribute open, re-reading it is a single pread
+        try:
+            self._brightness_fd = os.open(self._PATH_TO_BRIGHTNESS, os.O_RDONLY)
+        except OSError as e:
+            print(f"Error opening brightness for {device_name}: {e}")
+        
         # Set up file monitoring
         self._setup_file_monitor()
         
-        # Set up DBus proxy for systemd-logind
-        self._setup_dbus_proxy()
-        
         # Initial brightness sync
         self._sync_brightness()
     
@@ -64,56 +241,18 @@ class BacklightDevice(GObject.Object):
             print(f"Error setting up file monitor for {self._device_name}: {e}")
             self._file_monitor = None
     
-    def _setup_dbus_proxy(self):
-        """Set up DBus proxy for systemd-logind session."""
-        try:
-            # Get session path (simplified - you may need to implement get_session_path())
-            session_path = self._get_session_path()
-            
-            self._session_proxy = Gio.DBusProxy.new_for_bus_sync(
-                Gio.BusType.SYSTEM,
-                Gio.DBusProxyFlags.NONE,
-                None,  # interface info
-                "org.freedesktop.login1",
-                session_path,
-                "org.freedesktop.login1.Session",
-                None  # cancellable
-            )
-        except Exception as e:
-            print(f"Error setting up DBus proxy: {e}")
-            self._session_proxy = None
+    @property
+    def _session_proxy(self) -> Optional[Gio.DBusProxy]:
+        return self._session.proxy
     
-    def _get_session_path(self) -> str:
-        """Get the session path for the current user session."""
-        # This is a simplified implementation
-        # You may need to implement the full get_session_path() logic
-        try:
-            manager_proxy = Gio.DBusProxy.new_for_bus_sync(
-                Gio.BusType.SYSTEM,
-                Gio.DBusProxyFlags.NONE,
-                None,
-                "org.freedesktop.login1",
-                "/org/freedesktop/login1",
-                "org.freedesktop.login1.Manager",
-                None
-            )
-            
-            # Get current session
-            result = manager_proxy.call_sync(
-                "GetSessionByPID",
-                GLib.Variant("(u)", (os.getpid(),)),
-                Gio.DBusCallFlags.NONE,
-                -1,
-                None
-            )
-            
-            if result:
-                return result.get_child_value(0).get_string()
-        except Exception as e:
-            print(f"Error getting session path: {e}")
-        
-        # Fallback - this might not work for all systems
-        return "/org/freedesktop/login1/session/auto"
+    def close(self) -> None:
+        """Release the file monitor and the sysfs file descriptor."""
+        if self._file_monitor:
+            self._file_monitor.cancel()
+            self._file_monitor = None
+        if self._brightness_fd is not None:
+            os.close(self._brightness_fd)
+            self._brightness_fd = None
     
     def _on_brightness_file_changed(self, monitor, file, other_file, event_type):
         """Handle brightness file changes."""
@@ -122,13 +261,18 @@ class BacklightDevice(GObject.Object):
     
     def _sync_brightness(self):
         """Synchronize brightness value from file."""
+        if self._brightness_fd is None:
+            return
         try:
-            with open(self._PATH_TO_BRIGHTNESS) as f:
-                new_brightness = int(f.read().strip())
-                if new_brightness != self._brightness:
-                    self._brightness = new_brightness
-                    self.notify('brightness')
-        except (IOError, ValueError) as e:
+            new_brightness = int(os.pread(self._brightness_fd, 32, 0).strip())
+            if new_brightness != self._last_written:
+                # Changed behind our back (brightnessctl, a hotkey), so the
+                # next queued value must be sent even if we wrote it before
+                self._last_written = None
+            if new_brightness != self._brightness:
+                self._brightness = new_brightness
+                self.notify('brightness')
+        except (OSError, ValueError) as e:
             print(f"Error reading brightness for {self._device_name}: {e}")
     
     def do_get_property(self, prop):
@@ -166,19 +310,59 @@ class BacklightDevice(GObject.Object):
     
     def set_brightness(self, value: int) -> None:
         """Set brightness using systemd-logind."""
-        if self._session_proxy:
-            try:
-                self._session_proxy.call_sync(
-                    "SetBrightness",
-                    GLib.Variant("(ssu)", ("backlight", self._device_name, value)),
-                    Gio.DBusCallFlags.NONE,
-                    -1,
-                    None
-                )
-            except Exception as e:
-                print(f"Error setting brightness via DBus: {e}")
-        else:
+        self.queue_brightness(value)
+    
+    def queue_brightness(self, value: int) -> None:
+        """
+        Set brightness without blocking the main loop.
+        
+        Only one SetBrightness call is in flight at a time. Values queued while
+        a call is pending replace each other, so only the latest is sent.
+        """
+        self._pending_write = max(0, min(value, self._max_brightness)) if self._max_brightness > 0 else max(0, value)
+        if self._write_in_flight:
+            return
+        
+        # Hold the write until the shared session proxy is resolved
+        self._write_in_flight = True
+        self._session.when_ready(self._on_session_ready)
+    
+    def _on_session_ready(self, proxy):
+        if proxy is None:
             print("No DBus proxy available for setting brightness")
+            self._pending_write = None
+            self._write_in_flight = False
+            return
+        self._flush_pending_write()
+    
+    def _flush_pending_write(self) -> None:
+        """Send the pending brightness value, if any."""
+        value = self._pending_write
+        self._pending_write = None
+        if value is None or value == self._last_written:
+            self._write_in_flight = False
+            return
+        
+        self._write_in_flight = True
+        self._last_written = value
+        self._session_proxy.call(
+            "SetBrightness",
+            GLib.Variant("(ssu)", ("backlight", self._device_name, value)),
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None,
+            self._on_write_finished,
+            None
+        )
+    
+    def _on_write_finished(self, proxy, result, user_data):
+        """Handle completion of a queued SetBrightness call."""
+        try:
+            proxy.call_finish(result)
+        except Exception as e:
+            print(f"Error setting brightness via DBus: {e}")
+            self._last_written = None
+        self._flush_pending_write()
     
     async def set_brightness_async(self, value: int) -> None:
         """Asynchronously set brightness."""
@@ -225,27 +409,59 @@ class BacklightService(GObject.Object):
                       -1, GLib.MAXINT, -1, GObject.ParamFlags.READWRITE),
         'max-brightness': (int, 'Max Brightness', 'Max brightness of first device', 
                           -1, GLib.MAXINT, -1, GObject.ParamFlags.READABLE),
+        'curve': (str, 'Curve', 'Brightness curve used for stepping (linear, gamma or log)',
+                  CURVE_GAMMA, GObject.ParamFlags.READWRITE),
+        'gamma': (float, 'Gamma', 'Exponent used by the gamma curve',
+                  1.0, 4.0, DEFAULT_GAMMA, GObject.ParamFlags.READWRITE),
+        'ramping': (bool, 'Ramping', 'Whether a brightness ramp is in progress',
+                    False, GObject.ParamFlags.READABLE),
     }
     
     _instance = None
     
-    def __new__(cls):
+    def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
     
-    def __init__(self):
+    def __init__(self, root: str = SYS_BACKLIGHT, session: Optional[LogindSession] = None):
+        """
+        Args:
+            root: Directory holding the backlight devices, `/sys/class/backlight`
+                by default.
+            session: logind session used for writes, shared by all devices.
+        """
         if hasattr(self, '_initialized'):
             return
         
         super().__init__()
         self._initialized = True
+        self._root = root
+        self._session = session or LogindSession.get_default()
         self._devices: List[BacklightDevice] = []
+        self._first_device_handler = None
+        
+        # Curve settings
+        self._curve = CURVE_GAMMA
+        self._gamma = DEFAULT_GAMMA
+        
+        # Ramp state (levels are perceptual fractions)
+        self._frame_widget = None
+        self._frame_widget_handler = None
+        self._ramp_tick_id = None
+        self._ramp_timeout_id = None
+        self._ramp_start_time = 0
+        self._ramp_duration = DEFAULT_RAMP_DURATION
+        self._ramp_from = 0.0
+        self._ramp_to = 0.0
+        self._ramp_level = 0.0
+        self._ramp_slot = 0
         
         # Set up directory monitoring
         self._setup_directory_monitor()
         
-        # Initial device sync
+        # Resolve the logind session in the background and sync devices
+        self._session.resolve()
         self._sync_devices()
     
     @classmethod
@@ -256,7 +472,7 @@ class BacklightService(GObject.Object):
     def _setup_directory_monitor(self):
         """Set up monitoring of the backlight directory."""
         try:
-            backlight_dir = Gio.File.new_for_path(SYS_BACKLIGHT)
+            backlight_dir = Gio.File.new_for_path(self._root)
             self._dir_monitor = backlight_dir.monitor_directory(Gio.FileMonitorFlags.NONE, None)
             self._dir_monitor.connect('changed', self._on_directory_changed)
         except Exception as e:
@@ -269,28 +485,37 @@ class BacklightService(GObject.Object):
             self._sync_devices()
     
     def _sync_devices(self):
-        """Synchronize the list of backlight devices."""
-        old_devices = self._devices
+        """Synchronize the list of backlight devices, reusing known ones."""
+        old_devices = {device.device_name: device for device in self._devices}
+        old_first = self._devices[0] if self._devices else None
         self._devices = []
         
         try:
-            if os.path.exists(SYS_BACKLIGHT):
-                for device_name in os.listdir(SYS_BACKLIGHT):
-                    device_path = os.path.join(SYS_BACKLIGHT, device_name)
-                    if os.path.isdir(device_path):
-                        device = BacklightDevice(device_name)
-                        self._devices.append(device)
+            if os.path.exists(self._root):
+                for device_name in sorted(os.listdir(self._root)):
+                    device = old_devices.pop(device_name, None)
+                    if device is None:
+                        if not os.path.isdir(os.path.join(self._root, device_name)):
+                            continue
+                        device = BacklightDevice(device_name, session=self._session, root=self._root)
+                    self._devices.append(device)
         except Exception as e:
             print(f"Error syncing devices: {e}")
         
         # Connect to brightness changes on the first device
-        if len(self._devices) > 0:
-            self._devices[0].connect('notify::brightness', self._on_first_device_brightness_changed)
+        new_first = self._devices[0] if self._devices else None
+        if new_first is not old_first:
+            if old_first is not None and self._first_device_handler is not None:
+                old_first.disconnect(self._first_device_handler)
+            self._first_device_handler = None
+            if new_first is not None:
+                self._first_device_handler = new_first.connect(
+                    'notify::brightness', self._on_first_device_brightness_changed
+                )
         
-        # Clean up old devices
-        for device in old_devices:
-            if hasattr(device, '_file_monitor') and device._file_monitor:
-                device._file_monitor.cancel()
+        # Clean up removed devices
+        for device in old_devices.values():
+            device.close()
         
         # Notify all properties
         self.notify('available')
@@ -309,6 +534,12 @@ class BacklightService(GObject.Object):
             return self._devices[0].brightness if len(self._devices) > 0 else -1
         elif prop.name == 'max-brightness':
             return self._devices[0].max_brightness if len(self._devices) > 0 else -1
+        elif prop.name == 'curve':
+            return self._curve
+        elif prop.name == 'gamma':
+            return self._gamma
+        elif prop.name == 'ramping':
+            return self.ramping
         else:
             raise AttributeError(f'Unknown property {prop.name}')
     
@@ -316,6 +547,12 @@ class BacklightService(GObject.Object):
         """Handle property setting."""
         if prop.name == 'brightness':
             self.set_brightness(value)
+        elif prop.name == 'curve':
+            if value not in (CURVE_LINEAR, CURVE_GAMMA, CURVE_LOG):
+                raise ValueError(f'Unknown brightness curve {value}')
+            self._curve = value
+        elif prop.name == 'gamma':
+            self._gamma = value
         else:
             raise AttributeError(f'Unknown property {prop.name}')
     
@@ -352,6 +589,152 @@ class BacklightService(GObject.Object):
     def max_brightness(self) -> int:
         """The maximum brightness of the first backlight device, -1 if none available."""
         return self._devices[0].max_brightness if len(self._devices) > 0 else -1
+    
+    @property
+    def ramping(self) -> bool:
+        """Whether a brightness ramp is currently running."""
+        return self._ramp_tick_id is not None or self._ramp_timeout_id is not None
+    
+    def set_frame_widget(self, widget) -> None:
+        """
+        Use the frame clock of `widget` to drive brightness ramps.
+        
+        Without a mapped frame widget ramps fall back to a 16 ms timeout. A
+        ramp still running when the widget is unmapped jumps to its target.
+        """
+        if self._frame_widget is not None and self._frame_widget_handler is not None:
+            self._frame_widget.disconnect(self._frame_widget_handler)
+        self._frame_widget = widget
+        self._frame_widget_handler = widget.connect("unmap", self._on_frame_widget_unmap) if widget else None
+    
+    def _on_frame_widget_unmap(self, widget):
+        # The frame clock stops with the widget, so the tick would never finish the ramp
+        if self._ramp_tick_id is not None:
+            self._stop_ramp()
+            self._write_level(self._ramp_to)
+    
+    def get_level(self) -> float:
+        """The perceptual brightness level of the first device in [0, 1]."""
+        if self.ramping:
+            return self._ramp_to
+        return to_perceptual(self.brightness, self.max_brightness, self._curve, self._gamma)
+    
+    def step_brightness(self, steps: float, step_size: float = 0.05, duration: int = DEFAULT_RAMP_DURATION) -> None:
+        """
+        Ramp brightness by `steps` perceptual steps of `step_size`.
+        
+        Steps accumulate on the target of an in-progress ramp, so fast scrolling
+        keeps moving in the same direction instead of restarting from the
+        current (lagging) hardware value.
+        """
+        max_brightness = self.max_brightness
+        if max_brightness <= 0:
+            return
+        
+        current = self.get_level()
+        target = max(0.0, min(1.0, current + steps * step_size))
+        
+        # Guarantee at least one raw unit of movement at the low end
+        current_raw = from_perceptual(current, max_brightness, self._curve, self._gamma)
+        target_raw = from_perceptual(target, max_brightness, self._curve, self._gamma)
+        if target_raw == current_raw and steps != 0:
+            target_raw = max(0, min(max_brightness, current_raw + (1 if steps > 0 else -1)))
+            target = to_perceptual(target_raw, max_brightness, self._curve, self._gamma)
+        
+        self.ramp_to_level(target, duration)
+    
+    def ramp_to(self, value: int, duration: int = DEFAULT_RAMP_DURATION) -> None:
+        """Ramp the brightness of all devices to the raw `value`."""
+        self.ramp_to_level(
+            to_perceptual(value, self.max_brightness, self._curve, self._gamma), duration
+        )
+    
+    def ramp_to_level(self, level: float, duration: int = DEFAULT_RAMP_DURATION) -> None:
+        """
+        Ramp to a perceptual `level` in [0, 1] over `duration` milliseconds.
+        
+        A ramp already in progress is retargeted from its current level. Each
+        ramp issues at most MAX_RAMP_WRITES writes through the coalescing
+        device writer, independent of its duration.
+        """
+        if not self.available:
+            return
+        
+        level = max(0.0, min(1.0, level))
+        was_ramping = self.ramping
+        
+        self._ramp_from = self._ramp_level if was_ramping else to_perceptual(
+            self.brightness, self.max_brightness, self._curve, self._gamma
+        )
+        self._ramp_to = level
+        self._ramp_level = self._ramp_from
+        self._ramp_duration = max(0, duration)
+        self._ramp_start_time = GLib.get_monotonic_time()
+        self._ramp_slot = 0
+        
+        if self._ramp_duration == 0:
+            self._stop_ramp()
+            self._write_level(level)
+            return
+        
+        if not was_ramping:
+            widget = self._frame_widget
+            if widget is not None and widget.get_mapped():
+                self._ramp_tick_id = widget.add_tick_callback(self._on_ramp_tick)
+            else:
+                self._ramp_timeout_id = GLib.timeout_add(16, self._on_ramp_timeout)
+            self.notify('ramping')
+    
+    def _on_ramp_tick(self, widget, frame_clock):
+        """Frame clock callback driving the ramp."""
+        if self._advance_ramp(frame_clock.get_frame_time()):
+            return GLib.SOURCE_CONTINUE
+        self._ramp_tick_id = None
+        self.notify('ramping')
+        return GLib.SOURCE_REMOVE
+    
+    def _on_ramp_timeout(self):
+        """Timeout fallback driving the ramp when no frame clock is available."""
+        if self._advance_ramp(GLib.get_monotonic_time()):
+            return True
+        self._ramp_timeout_id = None
+        self.notify('ramping')
+        return False
+    
+    def _advance_ramp(self, now: int) -> bool:
+        """Advance the ramp to time `now` (µs). Returns False once finished."""
+        elapsed = (now - self._ramp_start_time) / 1000
+        progress = max(0.0, min(1.0, elapsed / self._ramp_duration))
+        eased = 1 - math.pow(1 - progress, 3)
+        self._ramp_level = self._ramp_from + (self._ramp_to - self._ramp_from) * eased
+        
+        # Only write when the ramp enters a new write slot
+        slot = int(progress * MAX_RAMP_WRITES)
+        if slot > self._ramp_slot:
+            self._ramp_slot = slot
+            self._write_level(self._ramp_level)
+        
+        return progress < 1.0
+    
+    def _stop_ramp(self) -> None:
+        """Cancel any running ramp."""
+        was_ramping = self.ramping
+        if self._ramp_tick_id is not None:
+            if self._frame_widget is not None:
+                self._frame_widget.remove_tick_callback(self._ramp_tick_id)
+            self._ramp_tick_id = None
+        if self._ramp_timeout_id is not None:
+            GLib.source_remove(self._ramp_timeout_id)
+            self._ramp_timeout_id = None
+        if was_ramping:
+            self.notify('ramping')
+    
+    def _write_level(self, level: float) -> None:
+        """Queue a perceptual level on every device."""
+        for device in self._devices:
+            device.queue_brightness(
+                from_perceptual(level, device.max_brightness, self._curve, self._gamma)
+            )
 
 
 # Example usage
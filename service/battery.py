@@ -1,65 +1,681 @@
 #!/usr/bin/env python3
 import json
-import subprocess
-import sys
+import math
 import os
-import signal
+import struct
+import sys
+import time
+from array import array
+from typing import List, Optional
+
+import gi
+gi.require_version('GLib', '2.0')
+gi.require_version('Gio', '2.0')
+
+from gi.repository import GObject, Gio, GLib
+
+try:
+    from .constants import CACHE_DIR
+except ImportError:
+    # Run directly as a script rather than as part of the service package
+    from constants import CACHE_DIR
+
+# Constants
+SYS_POWER_SUPPLY = "/sys/class/power_supply"
+HISTORY_FILE = os.path.join(CACHE_DIR, "battery-history.bin")
+
+UPOWER_NAME = "org.freedesktop.UPower"
+UPOWER_DISPLAY_DEVICE = "/org/freedesktop/UPower/devices/DisplayDevice"
+UPOWER_DEVICE_IFACE = "org.freedesktop.UPower.Device"
 
-shutdown_flag = False
+# Adaptive polling (seconds), only used without UPower
+POLL_MIN_INTERVAL = 5
+POLL_MAX_INTERVAL = 60
 
-def signal_handler(signum, frame):
-    global shutdown_flag
-    shutdown_flag = True
-    print(json.dumps({"Charge State": "Shutdown", "Battery Percentage": "N/A", "Time": "Service terminated"}))
-    sys.exit(0)
+STATUS_CHARGING = "charging"
+STATUS_DISCHARGING = "discharging"
+STATUS_FULL = "full"
+STATUS_NOT_CHARGING = "not-charging"
+STATUS_UNKNOWN = "unknown"
 
-def get_battery_info():
-    if shutdown_flag:
-        return {"Charge State": "Shutdown", "Battery Percentage": "N/A", "Time": "Service terminated"}
-    
+# UPower Device.State values
+_UPOWER_STATES = {
+    1: STATUS_CHARGING,
+    2: STATUS_DISCHARGING,
+    3: STATUS_DISCHARGING,  # empty
+    4: STATUS_FULL,
+    5: STATUS_NOT_CHARGING,  # pending charge
+    6: STATUS_DISCHARGING,  # pending discharge
+}
+
+# Sysfs status attribute values
+_SYSFS_STATES = {
+    "Charging": STATUS_CHARGING,
+    "Discharging": STATUS_DISCHARGING,
+    "Full": STATUS_FULL,
+    "Not charging": STATUS_NOT_CHARGING,
+}
+
+
+def _read_attr(path: str) -> Optional[str]:
+    """Read a sysfs attribute, None if missing or unreadable."""
     try:
-        acpi_output = subprocess.check_output(['acpi', '-b'], text=True).strip()
-        parts = acpi_output.split(', ')
-
-        status = "Unknown"
-        if "Charging" in parts[0]:
-            status = "Charging"
-        elif "Discharging" in parts[0]:
-            status = "Discharging"
-        elif "Full" in parts[0]:
-            status = "Full"
-
-        percentage = parts[1].strip() if len(parts) >= 2 else "0%"
-        time_info = "N/A"
-        if len(parts) >= 3:
-            time_raw = parts[2].strip()
-            time_info = (
-                f"Time to empty: {time_raw.replace(' remaining', '')}" if "remaining" in time_raw else
-                f"Time to full: {time_raw.replace(' until charged', '')}" if "until charged" in time_raw else
-                "N/A"
-            )
-            
-        return {
-            "Charge State": status,
-            "Battery Percentage": percentage,
-            "Time": time_info
-        }
-        
-    except Exception as e:
-        return {
-            "Charge State": "Error",
-            "Battery Percentage": "N/A",
-            "Time": f"Error: {str(e)}"
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _read_int(path: str) -> Optional[int]:
+    value = _read_attr(path)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class BatteryHistory:
+    """
+    Fixed-size ring buffer of (timestamp, energy, power) samples with
+    EWMA-smoothed charge and discharge rates.
+
+    Samples live in preallocated `array('d')` buffers, and each sample
+    updates the smoothed rates in O(1). The smoothing weight depends on the
+    time since the previous sample (time constant `tau` seconds), so irregular
+    sampling intervals are handled correctly.
+    """
+
+    _MAGIC = b"BATH"
+    _VERSION = 1
+    _HEADER = struct.Struct("<4sHHIdd")  # magic, version, reserved, count, discharge, charge
+    _SAMPLE = struct.Struct("<ddd")
+
+    def __init__(self, capacity: int = 720, tau: float = 300.0, path: Optional[str] = HISTORY_FILE):
+        """
+        Args:
+            capacity: Number of samples kept.
+            tau: EWMA time constant in seconds.
+            path: File the history is persisted to, None to disable.
+        """
+        self.capacity = capacity
+        self.tau = tau
+        self.path = path
+        self._timestamps = array('d', bytes(8 * capacity))
+        self._energy = array('d', bytes(8 * capacity))
+        self._power = array('d', bytes(8 * capacity))
+        self._head = 0  # next slot to write
+        self._count = 0
+        self._discharge_rate = 0.0  # W, 0 if unknown
+        self._charge_rate = 0.0  # W, 0 if unknown
+        self._unsaved = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def discharge_rate(self) -> float:
+        """Smoothed discharge rate in W, 0 if unknown."""
+        return self._discharge_rate
+
+    @property
+    def charge_rate(self) -> float:
+        """Smoothed charge rate in W, 0 if unknown."""
+        return self._charge_rate
+
+    def _last_index(self) -> int:
+        return (self._head - 1) % self.capacity
+
+    def last(self) -> Optional[tuple]:
+        """The newest (timestamp, energy, power) sample, or None."""
+        if self._count == 0:
+            return None
+        i = self._last_index()
+        return self._timestamps[i], self._energy[i], self._power[i]
+
+    def add(self, timestamp: float, energy: float, power: float, status: str) -> None:
+        """
+        Record a sample and update the smoothed rate for `status`.
+
+        Args:
+            timestamp: Wall-clock time in seconds.
+            energy: Remaining energy in Wh.
+            power: Instantaneous power reading in W, 0 if the battery has none.
+            status: Battery status at the time of the sample.
+        """
+        observed = abs(power)
+        previous = self.last()
+        dt = timestamp - previous[0] if previous else 0.0
+
+        # Batteries without a power reading: derive it from the energy delta
+        if observed == 0 and previous and dt > 0:
+            observed = abs(energy - previous[1]) / dt * 3600
+
+        if observed > 0 and status in (STATUS_DISCHARGING, STATUS_CHARGING):
+            attr = '_discharge_rate' if status == STATUS_DISCHARGING else '_charge_rate'
+            current = getattr(self, attr)
+            if current == 0 or dt <= 0:
+                setattr(self, attr, observed)
+            else:
+                alpha = 1 - math.exp(-dt / self.tau)
+                setattr(self, attr, current + alpha * (observed - current))
+
+        i = self._head
+        self._timestamps[i] = timestamp
+        self._energy[i] = energy
+        self._power[i] = power
+        self._head = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self._unsaved += 1
+
+    def time_to_empty(self, energy: float) -> int:
+        """Seconds until empty at the smoothed discharge rate, 0 if unknown."""
+        if self._discharge_rate <= 0:
+            return 0
+        return int(energy / self._discharge_rate * 3600)
+
+    def time_to_full(self, energy: float, energy_full: float) -> int:
+        """Seconds until full at the smoothed charge rate, 0 if unknown."""
+        if self._charge_rate <= 0:
+            return 0
+        return int(max(0.0, energy_full - energy) / self._charge_rate * 3600)
+
+    def values(self, field: str = 'energy', limit: Optional[int] = None) -> List[float]:
+        """
+        Samples of `field` (timestamp, energy or power), oldest first.
+
+        Intended for drawing a sparkline; `limit` keeps only the newest values.
+        """
+        buffer = {'timestamp': self._timestamps, 'energy': self._energy, 'power': self._power}[field]
+        count = self._count if limit is None else min(limit, self._count)
+        start = (self._head - count) % self.capacity
+        if start + count <= self.capacity:
+            return buffer[start:start + count].tolist()
+        return buffer[start:].tolist() + buffer[:self._head].tolist()
+
+    def save(self) -> None:
+        """Write the history to `path` atomically."""
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            timestamps = self.values('timestamp')
+            energy = self.values('energy')
+            power = self.values('power')
+            data = bytearray(self._HEADER.pack(
+                self._MAGIC, self._VERSION, 0, self._count, self._discharge_rate, self._charge_rate
+            ))
+            for sample in zip(timestamps, energy, power):
+                data += self._SAMPLE.pack(*sample)
+
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+            self._unsaved = 0
+        except OSError as e:
+            print(f"Error saving battery history: {e}")
+
+    def save_if_needed(self, every: int = 10) -> None:
+        """Save once `every` samples have been added since the last save."""
+        if self._unsaved >= every:
+            self.save()
+
+    def load(self, max_age: float = 12 * 3600) -> bool:
+        """
+        Restore the history from `path`.
+
+        Smoothed rates are only restored when the newest sample is younger than
+        `max_age` seconds. Returns True if anything was loaded.
+        """
+        if not self.path:
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+            magic, version, _, count, discharge, charge = self._HEADER.unpack_from(data, 0)
+        except (OSError, struct.error):
+            return False
+        if magic != self._MAGIC or version != self._VERSION:
+            return False
+
+        offset = self._HEADER.size
+        count = min(count, (len(data) - offset) // self._SAMPLE.size)
+        skip = max(0, count - self.capacity)
+        for index in range(skip, count):
+            timestamp, energy, power = self._SAMPLE.unpack_from(data, offset + index * self._SAMPLE.size)
+            i = self._head
+            self._timestamps[i] = timestamp
+            self._energy[i] = energy
+            self._power[i] = power
+            self._head = (i + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+        last = self.last()
+        if last and time.time() - last[0] <= max_age:
+            self._discharge_rate = discharge
+            self._charge_rate = charge
+        return self._count > 0
+
+
+class BatteryService(GObject.Object):
+    """
+    Battery state from UPower, or from /sys/class/power_supply when UPower is
+    not running.
+
+    UPower pushes property changes over D-Bus, so nothing is polled in that
+    mode. The sysfs fallback polls at an adaptive interval: it starts at
+    POLL_MIN_INTERVAL and backs off towards POLL_MAX_INTERVAL while nothing
+    changes.
+
+    Time estimates come from the EWMA-smoothed rates kept in `history`
+    rather than the instantaneous reading, so they don't jump around under
+    bursty load.
+
+    Example usage:
+
+    ```python
+    battery = BatteryService.get_default()
+    battery.connect("notify::percentage", lambda b, p: print(b.percentage))
+    ```
+    """
+
+    __gproperties__ = {
+        'available': (bool, 'Available', 'Whether a battery is present',
+                      False, GObject.ParamFlags.READABLE),
+        'percentage': (float, 'Percentage', 'Charge level in percent',
+                       0.0, 100.0, 0.0, GObject.ParamFlags.READABLE),
+        'status': (str, 'Status', 'charging, discharging, full, not-charging or unknown',
+                   STATUS_UNKNOWN, GObject.ParamFlags.READABLE),
+        'energy': (float, 'Energy', 'Remaining energy in Wh',
+                   0.0, GLib.MAXDOUBLE, 0.0, GObject.ParamFlags.READABLE),
+        'energy-full': (float, 'Energy Full', 'Energy when full in Wh',
+                        0.0, GLib.MAXDOUBLE, 0.0, GObject.ParamFlags.READABLE),
+        'rate': (float, 'Rate', 'Charge or discharge rate in W',
+                 0.0, GLib.MAXDOUBLE, 0.0, GObject.ParamFlags.READABLE),
+        'time-to-empty': (int, 'Time To Empty', 'Seconds until empty, 0 if unknown',
+                          0, GLib.MAXINT, 0, GObject.ParamFlags.READABLE),
+        'time-to-full': (int, 'Time To Full', 'Seconds until full, 0 if unknown',
+                         0, GLib.MAXINT, 0, GObject.ParamFlags.READABLE),
+        'on-battery': (bool, 'On Battery', 'Whether the system runs on battery power',
+                       False, GObject.ParamFlags.READABLE),
+        'source': (str, 'Source', 'Where the state comes from: upower, sysfs or none',
+                   'none', GObject.ParamFlags.READABLE),
+    }
+
+    __gsignals__ = {
+        'sample-added': (GObject.SignalFlags.RUN_FIRST, None, ()),
+    }
+
+    _instance = None
+
+    @classmethod
+    def get_default(cls) -> 'BatteryService':
+        """Get the default battery service instance."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, root: str = SYS_POWER_SUPPLY, use_upower: bool = True,
+                 history: Optional[BatteryHistory] = None):
+        """
+        Args:
+            root: Directory holding the power supplies, `/sys/class/power_supply`
+                by default.
+            use_upower: Try UPower first and only fall back to sysfs when it is
+                not running.
+            history: Sample history, loaded from HISTORY_FILE by default.
+        """
+        super().__init__()
+        self._root = root
+        if history is None:
+            history = BatteryHistory()
+            history.load()
+        self._history = history
+        self._state = {
+            'available': False,
+            'percentage': 0.0,
+            'status': STATUS_UNKNOWN,
+            'energy': 0.0,
+            'energy-full': 0.0,
+            'rate': 0.0,
+            'time-to-empty': 0,
+            'time-to-full': 0,
+            'on-battery': False,
         }
+        self._source = 'none'
+        self._upower_proxy: Optional[Gio.DBusProxy] = None
+        self._poll_id = None
+        self._poll_interval = POLL_MIN_INTERVAL
+
+        # Read sysfs right away so properties are valid before UPower answers
+        self._sync_sysfs()
+
+        if use_upower:
+            Gio.DBusProxy.new_for_bus(
+                Gio.BusType.SYSTEM,
+                Gio.DBusProxyFlags.DO_NOT_AUTO_START,
+                None,
+                UPOWER_NAME,
+                UPOWER_DISPLAY_DEVICE,
+                UPOWER_DEVICE_IFACE,
+                None,
+                self._on_upower_proxy_ready,
+                None
+            )
+        else:
+            self._start_polling()
+
+    def do_get_property(self, prop):
+        """Handle property getting."""
+        if prop.name == 'source':
+            return self._source
+        if prop.name in self._state:
+            return self._state[prop.name]
+        raise AttributeError(f'Unknown property {prop.name}')
+
+    @property
+    def available(self) -> bool:
+        """Whether a battery is present."""
+        return self._state['available']
+
+    @property
+    def percentage(self) -> float:
+        """Charge level in percent."""
+        return self._state['percentage']
+
+    @property
+    def status(self) -> str:
+        """One of charging, discharging, full, not-charging or unknown."""
+        return self._state['status']
+
+    @property
+    def energy(self) -> float:
+        """Remaining energy in Wh."""
+        return self._state['energy']
+
+    @property
+    def energy_full(self) -> float:
+        """Energy when full in Wh."""
+        return self._state['energy-full']
+
+    @property
+    def rate(self) -> float:
+        """Charge or discharge rate in W."""
+        return self._state['rate']
+
+    @property
+    def time_to_empty(self) -> int:
+        """Seconds until empty, 0 if unknown or not discharging."""
+        return self._state['time-to-empty']
+
+    @property
+    def time_to_full(self) -> int:
+        """Seconds until full, 0 if unknown or not charging."""
+        return self._state['time-to-full']
+
+    @property
+    def on_battery(self) -> bool:
+        """Whether the system is running on battery power."""
+        return self._state['on-battery']
+
+    @property
+    def source(self) -> str:
+        """Where the state comes from: upower, sysfs or none."""
+        return self._source
+
+    @property
+    def history(self) -> BatteryHistory:
+        """Recent samples and smoothed rates, e.g. for a sparkline."""
+        return self._history
+
+    def _apply(self, values: dict) -> bool:
+        """Record a sample, smooth the time estimates and store `values`."""
+        if values.get('available') and values.get('energy', 0) > 0:
+            energy = values['energy']
+            status = values['status']
+            last = self._history.last()
+            now = time.time()
+            if last is None or last[1] != energy or last[2] != values['rate'] or now - last[0] >= POLL_MAX_INTERVAL:
+                self._history.add(now, energy, values['rate'], status)
+                self._history.save_if_needed()
+                self.emit('sample-added')
+
+            if status == STATUS_DISCHARGING:
+                values['time-to-empty'] = self._history.time_to_empty(energy) or values['time-to-empty']
+            elif status == STATUS_CHARGING:
+                values['time-to-full'] = (
+                    self._history.time_to_full(energy, values['energy-full']) or values['time-to-full']
+                )
+        return self._update(**values)
+
+    def _update(self, **values) -> bool:
+        """Store new values and notify the ones that changed."""
+        changed = [key for key, value in values.items() if self._state[key] != value]
+        if not changed:
+            return False
+
+        self.freeze_notify()
+        for key in changed:
+            self._state[key] = values[key]
+            self.notify(key)
+        self.thaw_notify()
+        return True
+
+    def _set_source(self, source: str):
+        if self._source != source:
+            self._source = source
+            self.notify('source')
+
+    # --- UPower ---
+
+    def _on_upower_proxy_ready(self, source, result, user_data):
+        try:
+            proxy = Gio.DBusProxy.new_for_bus_finish(result)
+        except Exception as e:
+            print(f"Error connecting to UPower: {e}")
+            proxy = None
+
+        if proxy is None or proxy.get_name_owner() is None:
+            # UPower is not running, poll sysfs instead
+            self._start_polling()
+            return
+
+        self._upower_proxy = proxy
+        proxy.connect('g-properties-changed', self._on_upower_properties_changed)
+        self._set_source('upower')
+        self._sync_upower()
+
+    def _upower_property(self, name: str, default=None):
+        value = self._upower_proxy.get_cached_property(name)
+        return value.unpack() if value is not None else default
+
+    def _on_upower_properties_changed(self, proxy, changed, invalidated):
+        self._sync_upower()
+
+    def _sync_upower(self):
+        """Read the cached UPower DisplayDevice properties."""
+        status = _UPOWER_STATES.get(self._upower_property('State', 0), STATUS_UNKNOWN)
+        self._apply({
+            'available': bool(self._upower_property('IsPresent', False)),
+            'percentage': float(self._upower_property('Percentage', 0.0)),
+            'status': status,
+            'energy': float(self._upower_property('Energy', 0.0)),
+            'energy-full': float(self._upower_property('EnergyFull', 0.0)),
+            'rate': abs(float(self._upower_property('EnergyRate', 0.0))),
+            'time-to-empty': int(self._upower_property('TimeToEmpty', 0)),
+            'time-to-full': int(self._upower_property('TimeToFull', 0)),
+            'on-battery': status == STATUS_DISCHARGING,
+        })
+
+    # --- sysfs ---
+
+    def _start_polling(self):
+        """Poll sysfs at the adaptive interval."""
+        self._set_source('sysfs' if self.available else 'none')
+        if self._poll_id is None and self.available:
+            self._poll_interval = POLL_MIN_INTERVAL
+            self._poll_id = GLib.timeout_add_seconds(self._poll_interval, self._on_poll)
+
+    def _on_poll(self):
+        # Poll quickly while things change, back off while they don't
+        if self._sync_sysfs():
+            interval = POLL_MIN_INTERVAL
+        else:
+            interval = min(self._poll_interval * 2, POLL_MAX_INTERVAL)
+
+        if interval != self._poll_interval:
+            self._poll_interval = interval
+            self._poll_id = GLib.timeout_add_seconds(interval, self._on_poll)
+            return False
+        return True
+
+    def _list_supplies(self) -> List[str]:
+        try:
+            return sorted(os.listdir(self._root))
+        except OSError:
+            return []
+
+    def _sync_sysfs(self) -> bool:
+        """Read all batteries under the sysfs root. Returns True if anything changed."""
+        energy = 0.0
+        energy_full = 0.0
+        power = 0.0
+        capacities = []
+        statuses = []
+        ac_online = None
+
+        for name in self._list_supplies():
+            path = os.path.join(self._root, name)
+            supply_type = _read_attr(os.path.join(path, "type"))
+
+            if supply_type == "Mains":
+                online = _read_int(os.path.join(path, "online"))
+                if online is not None:
+                    ac_online = bool(ac_online) or online == 1
+                continue
+            if supply_type != "Battery" or _read_int(os.path.join(path, "present")) == 0:
+                continue
+            # Skip peripherals (mice, headsets) reporting through power_supply
+            if _read_attr(os.path.join(path, "scope")) == "Device":
+                continue
+
+            # Energy in µWh/µW, or charge in µAh/µA scaled by voltage in µV
+            now = _read_int(os.path.join(path, "energy_now"))
+            full = _read_int(os.path.join(path, "energy_full"))
+            rate = _read_int(os.path.join(path, "power_now"))
+            if now is None:
+                voltage = _read_int(os.path.join(path, "voltage_now")) or 0
+                charge_now = _read_int(os.path.join(path, "charge_now"))
+                charge_full = _read_int(os.path.join(path, "charge_full"))
+                current = _read_int(os.path.join(path, "current_now"))
+                now = charge_now * voltage / 1e6 if charge_now is not None else None
+                full = charge_full * voltage / 1e6 if charge_full is not None else None
+                rate = current * voltage / 1e6 if current is not None else None
+
+            if now is not None:
+                energy += now / 1e6
+            if full is not None:
+                energy_full += full / 1e6
+            if rate is not None:
+                power += abs(rate) / 1e6
+
+            capacity = _read_int(os.path.join(path, "capacity"))
+            if capacity is not None:
+                capacities.append(capacity)
+            statuses.append(_SYSFS_STATES.get(_read_attr(os.path.join(path, "status")), STATUS_UNKNOWN))
+
+        available = bool(statuses)
+        if not available:
+            return self._update(**{'available': False})
+
+        if energy_full > 0:
+            percentage = min(100.0, energy / energy_full * 100)
+        else:
+            percentage = float(sum(capacities) / len(capacities)) if capacities else 0.0
+
+        if STATUS_DISCHARGING in statuses:
+            status = STATUS_DISCHARGING
+        elif STATUS_CHARGING in statuses:
+            status = STATUS_CHARGING
+        elif all(s == STATUS_FULL for s in statuses):
+            status = STATUS_FULL
+        elif STATUS_NOT_CHARGING in statuses:
+            status = STATUS_NOT_CHARGING
+        else:
+            status = STATUS_UNKNOWN
+
+        time_to_empty = 0
+        time_to_full = 0
+        if power > 0:
+            if status == STATUS_DISCHARGING:
+                time_to_empty = int(energy / power * 3600)
+            elif status == STATUS_CHARGING:
+                time_to_full = int(max(0.0, energy_full - energy) / power * 3600)
+
+        on_battery = (not ac_online) if ac_online is not None else status == STATUS_DISCHARGING
+
+        return self._apply({
+            'available': True,
+            'percentage': round(percentage, 1),
+            'status': status,
+            'energy': round(energy, 3),
+            'energy-full': round(energy_full, 3),
+            'rate': round(power, 3),
+            'time-to-empty': time_to_empty,
+            'time-to-full': time_to_full,
+            'on-battery': on_battery,
+        })
+
+    def refresh(self) -> None:
+        """Re-read the battery state now."""
+        if self._upower_proxy is not None:
+            self._sync_upower()
+        else:
+            self._sync_sysfs()
+
+    def cleanup(self) -> None:
+        """Stop polling and persist the history."""
+        if self._poll_id is not None:
+            GLib.source_remove(self._poll_id)
+            self._poll_id = None
+        self._history.save()
+
+
+def _format_duration(seconds: int) -> str:
+    hours, remainder = divmod(seconds, 3600)
+    return f"{hours:02d}:{remainder // 60:02d}"
+
+
+def get_battery_info(battery: Optional[BatteryService] = None) -> dict:
+    """Battery summary in the JSON shape printed by this script."""
+    battery = battery or BatteryService(use_upower=False, history=BatteryHistory(path=None))
+    if not battery.available:
+        return {"Charge State": "Unknown", "Battery Percentage": "N/A", "Time": "N/A"}
+
+    time_info = "N/A"
+    if battery.status == STATUS_DISCHARGING and battery.time_to_empty > 0:
+        time_info = f"Time to empty: {_format_duration(battery.time_to_empty)}"
+    elif battery.status == STATUS_CHARGING and battery.time_to_full > 0:
+        time_info = f"Time to full: {_format_duration(battery.time_to_full)}"
+
+    return {
+        "Charge State": battery.status.replace("-", " ").title(),
+        "Battery Percentage": f"{int(battery.percentage)}%",
+        "Time": time_info,
+    }
+
 
 def main():
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
-    if not os.path.exists('/usr/bin/acpi'):
-        print("Install Acpi, Gandu")
-        sys.exit(1)
-    print(json.dumps(get_battery_info()))
+    if "--watch" in sys.argv:
+        battery = BatteryService.get_default()
+        battery.connect("notify", lambda b, pspec: print(json.dumps(get_battery_info(b)), flush=True))
+        try:
+            GLib.MainLoop().run()
+        except KeyboardInterrupt:
+            battery.cleanup()
+            sys.exit(0)
+    else:
+        print(json.dumps(get_battery_info()))
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,201 @@
+import datetime
+import time
+from typing import Callable, Optional
+import gi
+
+gi.require_version('Gtk', '4.0')
+gi.require_version('Gio', '2.0')
+gi.require_version('GLib', '2.0')
+
+from gi.repository import GObject, Gio, GLib
+
+from .metrics import metrics
+
+# Granularities, in seconds
+SECOND = 1
+MINUTE = 60
+
+# Timeouts may fire a little early or late, so aim just past the boundary
+BOUNDARY_SLACK_MS = 5
+
+WAKEUPS = metrics.counter("clock.wakeups", "Wall clock boundary timeouts")
+
+
+class ClockSubscription:
+    """A callback registered with `WallClock.subscribe`."""
+
+    def __init__(self, callback: Callable[[datetime.datetime], None], granularity: int, widget=None):
+        self.callback = callback
+        self.granularity = granularity
+        self.widget = widget
+        self.last_key = None
+        self.handlers = []
+
+    @property
+    def active(self) -> bool:
+        return self.widget is None or self.widget.get_mapped()
+
+    def key(self, now: datetime.datetime):
+        if self.granularity >= MINUTE:
+            return now.replace(second=0, microsecond=0)
+        return now.replace(microsecond=0)
+
+
+class WallClock(GObject.Object):
+    """
+    Shared wall-clock ticker.
+
+    Subscribers ask for SECOND or MINUTE granularity and are called with the
+    current local `datetime` only when that value changes. A single
+    `GLib.timeout_add` is aimed at the next boundary any active subscriber
+    needs and re-aimed after every tick, so timers never drift and nothing
+    ticks every second when only minutes are shown. Subscribers bound to a
+    widget receive nothing while it is unmapped and catch up when mapped.
+
+    The clock resyncs after system resume (logind PrepareForSleep) and
+    timezone changes (timedated), since the monotonic timeout doesn't account
+    for either.
+
+    Example usage:
+
+    ```python
+    clock = WallClock.get_default()
+    clock.subscribe(lambda now: label.set_label(now.strftime("%H:%M")), MINUTE, widget=label)
+    ```
+    """
+
+    LOGIND_NAME = "org.freedesktop.login1"
+    LOGIND_PATH = "/org/freedesktop/login1"
+    LOGIND_MANAGER_IFACE = "org.freedesktop.login1.Manager"
+    TIMEDATE_NAME = "org.freedesktop.timedate1"
+    TIMEDATE_PATH = "/org/freedesktop/timedate1"
+
+    _instance = None
+
+    @classmethod
+    def get_default(cls) -> 'WallClock':
+        """Get the clock shared by all time displays."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, connection: Optional[Gio.DBusConnection] = None):
+        super().__init__()
+        self._subscriptions: list[ClockSubscription] = []
+        self._timeout_id = None
+        self._paused = False
+        self._connection = connection
+        if connection is None:
+            Gio.bus_get(Gio.BusType.SYSTEM, None, self._on_bus_ready, None)
+        else:
+            self._watch_system(connection)
+
+    def subscribe(self, callback: Callable[[datetime.datetime], None], granularity: int = MINUTE,
+                  widget=None) -> ClockSubscription:
+        """
+        Call `callback(now)` whenever the time changes at `granularity`.
+
+        The callback runs once immediately (if active). With `widget`, delivery
+        follows the widget's mapped state and ends when it is destroyed.
+        """
+        subscription = ClockSubscription(callback, granularity, widget)
+        if widget is not None:
+            subscription.handlers = [
+                widget.connect("map", lambda _w: self.resync()),
+                widget.connect("unmap", lambda _w: self._schedule()),
+                widget.connect("destroy", lambda _w: self.unsubscribe(subscription)),
+            ]
+        self._subscriptions.append(subscription)
+        self._deliver(datetime.datetime.now(), [subscription])
+        self._schedule()
+        return subscription
+
+    def unsubscribe(self, subscription: ClockSubscription):
+        """Stop delivering to `subscription`."""
+        if subscription not in self._subscriptions:
+            return
+        self._subscriptions.remove(subscription)
+        for handler in subscription.handlers:
+            subscription.widget.disconnect(handler)
+        subscription.handlers = []
+        self._schedule()
+
+    def set_paused(self, paused: bool):
+        """Stop ticking while `paused`, e.g. while the session is locked; unpausing resyncs."""
+        if paused == self._paused:
+            return
+        self._paused = paused
+        if paused:
+            self._schedule()
+        else:
+            self.resync()
+
+    def resync(self):
+        """Deliver the current time to active subscribers and re-aim the timeout."""
+        self._deliver(datetime.datetime.now(), self._subscriptions)
+        self._schedule()
+
+    def _deliver(self, now: datetime.datetime, subscriptions):
+        for subscription in list(subscriptions):
+            if not subscription.active:
+                continue
+            key = subscription.key(now)
+            if key != subscription.last_key:
+                subscription.last_key = key
+                try:
+                    subscription.callback(now)
+                except Exception as e:
+                    print(f"Error in clock subscriber: {e}")
+
+    def _schedule(self):
+        """Aim the single timeout at the next boundary an active subscriber needs."""
+        if self._timeout_id is not None:
+            GLib.source_remove(self._timeout_id)
+            self._timeout_id = None
+
+        granularities = [s.granularity for s in self._subscriptions if s.active]
+        if not granularities or self._paused:
+            return
+        step = min(granularities)
+        wall = time.time()
+        # Boundaries are in local time; whole-minute UTC offsets make this the same instant
+        delay_ms = (step - wall % step) * 1000
+        self._timeout_id = GLib.timeout_add(int(delay_ms) + BOUNDARY_SLACK_MS, self._on_timeout)
+
+    def _on_timeout(self):
+        self._timeout_id = None
+        WAKEUPS.inc()
+        self.resync()
+        return False
+
+    # --- System events ---
+
+    def _on_bus_ready(self, _source, result, _user_data):
+        try:
+            self._connection = Gio.bus_get_finish(result)
+        except GLib.Error as e:
+            print(f"Clock: system bus unavailable, not watching resume/timezone: {e}")
+            return
+        self._watch_system(self._connection)
+
+    def _watch_system(self, connection: Gio.DBusConnection):
+        connection.signal_subscribe(
+            self.LOGIND_NAME, self.LOGIND_MANAGER_IFACE, "PrepareForSleep", self.LOGIND_PATH,
+            None, Gio.DBusSignalFlags.NONE, self._on_prepare_for_sleep, None,
+        )
+        connection.signal_subscribe(
+            self.TIMEDATE_NAME, "org.freedesktop.DBus.Properties", "PropertiesChanged",
+            self.TIMEDATE_PATH, None, Gio.DBusSignalFlags.NONE, self._on_timedate_changed, None,
+        )
+
+    def _on_prepare_for_sleep(self, conn, sender, path, interface, signal, params, user_data):
+        (sleeping,) = params.unpack()
+        if not sleeping and not self._paused:
+            self.resync()
+
+    def _on_timedate_changed(self, conn, sender, path, interface, signal, params, user_data):
+        _iface, changed, invalidated = params.unpack()
+        if "Timezone" in changed or "Timezone" in invalidated:
+            time.tzset()
+        if not self._paused:
+            self.resync()
@@ -3,3 +3,7 @@ import os
 HYPRLAND_INSTANCE_SIGNATURE = os.getenv("HYPRLAND_INSTANCE_SIGNATURE")
 XDG_RUNTIME_DIR = os.getenv("XDG_RUNTIME_DIR")
 HYPR_SOCKET_DIR = f"{XDG_RUNTIME_DIR}/hypr/{HYPRLAND_INSTANCE_SIGNATURE}"
+XDG_CACHE_HOME = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+CACHE_DIR = f"{XDG_CACHE_HOME}/hyprgtk4"
+CONTROL_SOCKET_DIR = f"{XDG_RUNTIME_DIR or '/tmp'}/hyprgtk4"
+CONTROL_SOCKET = f"{CONTROL_SOCKET_DIR}/control.sock"
@@ -0,0 +1,338 @@
+import inspect
+import os
+import shlex
+import socket
+from typing import Callable, Optional
+import gi
+
+gi.require_version('GLib', '2.0')
+
+from gi.repository import GObject, GLib
+
+from .constants import CONTROL_SOCKET, CONTROL_SOCKET_DIR
+from .metrics import metrics
+
+# Constants
+MAX_LINE = 4096  # longest accepted command line, in bytes
+MAX_PENDING_OUTPUT = 1 << 20  # clients that fall this far behind are dropped
+
+COMMANDS = metrics.counter("control.commands", "Control socket commands run")
+CONNECTIONS = metrics.counter("control.connections", "Control socket connections accepted")
+
+
+class ControlError(Exception):
+    """Raised by command handlers to report an error to the client."""
+
+
+class _Client:
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.buffer = b""
+        self.output = b""
+        self.read_id = None
+        self.write_id = None
+        self.streams: list[Callable[[], None]] = []  # functions ending the client's streams
+        self.closed = False
+
+
+class ControlServer(GObject.Object):
+    """
+    Line protocol on a Unix socket for keybinds and scripts.
+
+    Each line is one command, `name arg...` split like a shell would. A line
+    may also hold several commands separated by `;`, and any number of lines
+    can arrive in one write (batch mode). Every command gets one reply line,
+    `ok`, `ok <result>` or `error <message>`, in order. Commands run directly
+    in the socket's main loop watch, so a command costs one wakeup.
+
+    ```sh
+    echo 'open dashboard' | socat - UNIX-CONNECT:$XDG_RUNTIME_DIR/hyprgtk4/control.sock
+    printf 'volume +5\\nopen osd\\n' | socat - UNIX-CONNECT:$XDG_RUNTIME_DIR/hyprgtk4/control.sock
+    ```
+
+    Handlers are registered with `register(name, handler, usage)` and called
+    with the command's arguments as strings. They return an optional result
+    string and raise `ControlError` (or ValueError) for bad input.
+
+    The command names are also written to `<path>.commands`, one per line,
+    so clients can tell commands from shorthands without a round trip.
+
+    Stream commands, registered with `register_stream`, keep the connection
+    open after replying and push lines to the client until it disconnects.
+    Their handler is called as `handler(write, *args)` and returns a function
+    that ends the stream. Writes never block: output is buffered and flushed
+    when the socket is writable, and clients that stop reading are dropped.
+    """
+
+    __gsignals__ = {
+        'command': (GObject.SignalFlags.RUN_FIRST, None, (str, bool)),  # line, succeeded
+    }
+
+    def __init__(self, path: str = CONTROL_SOCKET):
+        super().__init__()
+        self.path = path
+        self._socket: Optional[socket.socket] = None
+        self._watch_id = None
+        self._clients: dict[int, _Client] = {}
+        self._commands: dict[str, tuple[Callable, str]] = {}
+        self._streams: set[str] = set()
+        self.register("help", self._cmd_help, "help - list commands")
+        self.register("ping", lambda *args: "pong", "ping - check that the bar is responding")
+
+    def register(self, name: str, handler: Callable[..., Optional[str]], usage: str = ""):
+        """Add command `name`; `handler(*args)` returns an optional result string."""
+        self._commands[name] = (handler, usage or name)
+        if self._socket is not None:
+            self._write_command_list()
+
+    def register_stream(self, name: str, handler: Callable[..., Callable[[], None]], usage: str = ""):
+        """Add stream command `name`; `handler(write, *args)` returns a function ending the stream."""
+        self.register(name, handler, usage)
+        self._streams.add(name)
+
+    @property
+    def commands(self) -> list[str]:
+        return sorted(self._commands)
+
+    def start(self) -> bool:
+        """Bind the socket. Returns False if another instance already owns it."""
+        os.makedirs(os.path.dirname(self.path) or CONTROL_SOCKET_DIR, mode=0o700, exist_ok=True)
+        if os.path.exists(self.path):
+            if self._is_alive():
+                print(f"Control socket {self.path} is in use by another instance")
+                return False
+            os.unlink(self.path)
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM | socket.SOCK_CLOEXEC | socket.SOCK_NONBLOCK)
+        old_umask = os.umask(0o077)
+        try:
+            sock.bind(self.path)
+        finally:
+            os.umask(old_umask)
+        sock.listen(16)
+        self._socket = sock
+        self._watch_id = GLib.io_add_watch(
+            GLib.IOChannel.unix_new(sock.fileno()), GLib.PRIORITY_HIGH, GLib.IOCondition.IN, self._on_accept,
+        )
+        self._write_command_list()
+        return True
+
+    def stop(self):
+        """Close the socket and all clients."""
+        for client in list(self._clients.values()):
+            self._close_client(client)
+        if self._watch_id is not None:
+            GLib.source_remove(self._watch_id)
+            self._watch_id = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            for path in (self.path, self.commands_path):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+    @property
+    def commands_path(self) -> str:
+        return f"{self.path}.commands"
+
+    def _write_command_list(self):
+        try:
+            with open(f"{self.commands_path}.tmp", "w") as f:
+                f.write("".join(f"{name}\n" for name in self.commands))
+            os.replace(f"{self.commands_path}.tmp", self.commands_path)
+        except OSError as e:
+            print(f"Could not write {self.commands_path}: {e}")
+
+    def _is_alive(self) -> bool:
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.path)
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+
+    # --- Connections ---
+
+    def _on_accept(self, channel, condition):
+        while True:
+            try:
+                conn, _ = self._socket.accept()
+            except BlockingIOError:
+                break
+            except OSError as e:
+                print(f"Control socket accept failed: {e}")
+                break
+            conn.setblocking(False)
+            CONNECTIONS.inc()
+            client = _Client(conn)
+            client.read_id = GLib.io_add_watch(
+                GLib.IOChannel.unix_new(conn.fileno()), GLib.PRIORITY_HIGH,
+                GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR,
+                self._on_client_readable, client,
+            )
+            self._clients[conn.fileno()] = client
+        return True
+
+    def _on_client_readable(self, channel, condition, client: _Client):
+        try:
+            data = client.sock.recv(MAX_LINE)
+        except BlockingIOError:
+            return True
+        except OSError:
+            data = b""
+
+        if data:
+            client.buffer += data
+            *lines, client.buffer = client.buffer.split(b"\n")
+            if len(client.buffer) > MAX_LINE:
+                lines.append(client.buffer)
+                client.buffer = b""
+        else:
+            # EOF: run a final line sent without a newline
+            lines, client.buffer = [client.buffer] if client.buffer.strip() else [], b""
+
+        for line in lines:
+            if line.strip() and not client.closed:
+                self.execute_line(line.decode(errors="replace"), client)
+
+        if data or client.closed:
+            return not client.closed
+        client.read_id = None
+        if client.streams:
+            # Half-closed by the client (`echo subscribe | socat ...`): keep streaming
+            # and only watch for the peer going away
+            client.read_id = GLib.io_add_watch(
+                GLib.IOChannel.unix_new(client.sock.fileno()), GLib.PRIORITY_DEFAULT,
+                GLib.IOCondition.HUP | GLib.IOCondition.ERR, self._on_client_gone, client,
+            )
+        elif not client.output:
+            self._close_client(client)
+        return False
+
+    def _on_client_gone(self, channel, condition, client: _Client):
+        client.read_id = None
+        self._close_client(client)
+        return False
+
+    def _write(self, client: _Client, text: str):
+        if client.closed or not text:
+            return
+        client.output += text.encode()
+        if len(client.output) > MAX_PENDING_OUTPUT:
+            print("Control client is not reading its output, disconnecting")
+            self._close_client(client)
+            return
+        self._flush(client)
+
+    def _flush(self, client: _Client) -> bool:
+        try:
+            sent = client.sock.send(client.output)
+            client.output = client.output[sent:]
+        except BlockingIOError:
+            pass
+        except OSError:
+            self._close_client(client)
+            return False
+
+        if client.output and client.write_id is None:
+            client.write_id = GLib.io_add_watch(
+                GLib.IOChannel.unix_new(client.sock.fileno()), GLib.PRIORITY_DEFAULT,
+                GLib.IOCondition.OUT, self._on_client_writable, client,
+            )
+        elif not client.output and client.read_id is None and not client.streams:
+            # Everything was answered and the client has finished sending
+            self._close_client(client)
+        return bool(client.output)
+
+    def _on_client_writable(self, channel, condition, client: _Client):
+        pending = self._flush(client)
+        if not pending:
+            client.write_id = None
+        return pending
+
+    def _close_client(self, client: _Client):
+        if client.closed:
+            return
+        client.closed = True
+        for end_stream in client.streams:
+            end_stream()
+        client.streams = []
+        for source_id in (client.read_id, client.write_id):
+            if source_id is not None:
+                GLib.source_remove(source_id)
+        client.read_id = client.write_id = None
+        self._clients.pop(client.sock.fileno(), None)
+        client.sock.close()
+
+    # --- Commands ---
+
+    def execute_line(self, line: str, client: Optional[_Client] = None) -> str:
+        """
+        Run the `;`-separated commands in `line`. Replies are written to
+        `client` as each command finishes, or returned when there is none.
+        """
+        replies = []
+        for command in line.split(";"):
+            if not command.strip():
+                continue
+            reply = self.execute(command, client) + "\n"
+            if client is not None:
+                self._write(client, reply)
+            else:
+                replies.append(reply)
+        return "".join(replies)
+
+    def execute(self, command: str, client: Optional[_Client] = None) -> str:
+        """Run one command and return its reply (without newline)."""
+        COMMANDS.inc()
+        try:
+            name, *args = shlex.split(command)
+        except ValueError as e:
+            return f"error {e}"
+        entry = self._commands.get(name)
+        if entry is None:
+            self.emit('command', command, False)
+            return f"error unknown command '{name}', try 'help'"
+
+        handler, usage = entry
+        stream = name in self._streams
+        if stream:
+            if client is None:
+                return f"error '{name}' needs a socket connection"
+            # Lines written while the handler runs must follow the "ok" reply
+            pending = []
+
+            def write(text):
+                if pending is None:
+                    self._write(client, text)
+                else:
+                    pending.append(text)
+            args = [write, *args]
+        try:
+            inspect.signature(handler).bind(*args)
+        except TypeError:
+            self.emit('command', command, False)
+            return f"error usage: {usage}"
+        try:
+            result = handler(*args)
+            if stream:
+                client.streams.append(result)
+                self.emit('command', command, True)
+                initial, pending = "".join(pending), None
+                return f"ok\n{initial}".removesuffix("\n")
+        except (ControlError, ValueError) as e:
+            self.emit('command', command, False)
+            return f"error {e}"
+        except Exception as e:
+            print(f"Control command '{command}' failed: {e}")
+            self.emit('command', command, False)
+            return f"error {e}"
+        self.emit('command', command, True)
+        return f"ok {result}" if result else "ok"
+
+    def _cmd_help(self):
+        return " | ".join(self._commands[name][1] for name in self.commands)
@@ -0,0 +1,170 @@
+"""
+Hand-off of events from any thread to the main loop, in batches.
+
+Producers declare typed topics at module level and publish from any thread;
+consumers subscribe on the main thread and receive each topic's events as
+one list per dispatch:
+
+```python
+from .eventbus import Topic, bus
+
+LINES = Topic("hyprland.event", str)
+
+# Listener thread
+bus.publish(LINES, line)
+
+# Main thread
+bus.subscribe(LINES, lambda lines: ...)
+```
+
+Events go into a deque and the first event after a dispatch schedules the
+next one, so a burst of events wakes the main context once. Dispatches run
+just before GTK's redraw and at most once per `frame_interval`, so whatever
+arrives during a frame is handled together. Events published with a `key`
+are coalesced: within a batch the last payload for a (topic, key) wins.
+Events without a key are all delivered, in order.
+"""
+import time
+from collections import deque
+from typing import Callable
+import gi
+
+gi.require_version('GLib', '2.0')
+
+from gi.repository import GLib
+
+from .metrics import metrics
+
+# Constants
+FRAME_INTERVAL_MS = 16  # minimum time between dispatches
+DISPATCH_PRIORITY = GLib.PRIORITY_HIGH_IDLE + 10  # before GTK's redraw (PRIORITY_HIGH_IDLE + 20)
+
+PUBLISHED = metrics.counter("bus.published", "Events published")
+COALESCED = metrics.counter("bus.coalesced", "Events replaced by a later event with the same key")
+DISPATCHES = metrics.counter("bus.dispatches", "Batches dispatched to the main loop")
+LATENCY_MS = metrics.histogram("bus.latency_ms", "Publish to dispatch delay of the oldest event in a batch")
+DISPATCH_MS = metrics.histogram("bus.dispatch_ms", "Time spent running subscribers per dispatch")
+
+
+class Topic:
+    """A named stream of events whose payloads are instances of `payload_type`."""
+
+    __slots__ = ("name", "payload_type")
+
+    def __init__(self, name: str, payload_type: type = object):
+        self.name = name
+        self.payload_type = payload_type
+
+    def __repr__(self) -> str:
+        return f"<Topic {self.name} ({self.payload_type.__name__})>"
+
+
+class EventBus:
+    """
+    Thread-safe event queue drained on the main loop in coalesced batches.
+
+    `publish` may be called from any thread. `subscribe`, `unsubscribe` and
+    the subscribers themselves run on the main thread.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_default(cls) -> 'EventBus':
+        """Get the bus shared by all services."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, frame_interval: int = FRAME_INTERVAL_MS):
+        self.frame_interval = frame_interval
+        self._queue: deque = deque()  # (topic, key, payload, published at)
+        self._subscribers: dict[Topic, list[tuple[int, Callable[[list], None]]]] = {}
+        self._next_id = 1
+        self._wake_pending = False
+        self._last_dispatch = 0.0
+        self._peak_depth = 0
+        metrics.gauge("bus.queue_depth", "Events waiting for dispatch", lambda: len(self._queue))
+        metrics.gauge("bus.queue_depth_peak", "Most events waiting for one dispatch", lambda: self._peak_depth)
+
+    def subscribe(self, topic: Topic, callback: Callable[[list], None]) -> int:
+        """Call `callback(payloads)` with each batch of `topic`. Returns an id for `unsubscribe`."""
+        subscription_id = self._next_id
+        self._next_id += 1
+        self._subscribers.setdefault(topic, []).append((subscription_id, callback))
+        return subscription_id
+
+    def unsubscribe(self, subscription_id: int):
+        for topic, subscribers in self._subscribers.items():
+            self._subscribers[topic] = [s for s in subscribers if s[0] != subscription_id]
+
+    def publish(self, topic: Topic, payload, key=None):
+        """
+        Queue `payload` on `topic` from any thread. With a `key`, only the
+        last payload published for it before the next dispatch is delivered.
+        """
+        if not isinstance(payload, topic.payload_type):
+            raise TypeError(f"{topic.name} expects {topic.payload_type.__name__}, got {type(payload).__name__}")
+        self._queue.append((topic, key, payload, time.monotonic()))
+        PUBLISHED.inc()
+        if not self._wake_pending:
+            self._wake()
+
+    def _wake(self):
+        # Racing producers may both get here; the extra dispatch finds an empty queue
+        self._wake_pending = True
+        delay_ms = int((self._last_dispatch - time.monotonic()) * 1000) + self.frame_interval
+        if delay_ms > 0:
+            GLib.timeout_add(delay_ms, self._dispatch, priority=DISPATCH_PRIORITY)
+        else:
+            GLib.idle_add(self._dispatch, priority=DISPATCH_PRIORITY)
+
+    def _dispatch(self):
+        # Clear the flag before draining, so an event queued after the drain wakes us again
+        self._wake_pending = False
+        start = time.monotonic()
+        self._last_dispatch = start
+        self._peak_depth = max(self._peak_depth, len(self._queue))
+
+        batches: dict[Topic, dict] = {}
+        oldest = None
+        unkeyed = 0
+        while self._queue:
+            topic, key, payload, published = self._queue.popleft()
+            if oldest is None:
+                oldest = published
+            pending = batches.setdefault(topic, {})
+            if key is None:
+                key = (_UNKEYED, unkeyed)
+                unkeyed += 1
+            elif key in pending:
+                COALESCED.inc()
+            pending[key] = payload
+        if oldest is None:
+            return False
+
+        DISPATCHES.inc()
+        LATENCY_MS.observe((start - oldest) * 1000)
+        for topic, pending in batches.items():
+            payloads = list(pending.values())
+            for _id, callback in self._subscribers.get(topic, ()):
+                try:
+                    callback(payloads)
+                except Exception as e:
+                    print(f"Error dispatching {topic.name}: {e}")
+        DISPATCH_MS.observe((time.monotonic() - start) * 1000)
+        return False
+
+    def report(self) -> dict:
+        """Queue state and the topics with subscribers."""
+        return {
+            "queue_depth": len(self._queue),
+            "queue_depth_peak": self._peak_depth,
+            "frame_interval_ms": self.frame_interval,
+            "topics": {topic.name: len(subscribers) for topic, subscribers in self._subscribers.items()},
+        }
+
+
+_UNKEYED = object()  # key prefix keeping events published without a key apart
+
+bus = EventBus.get_default()
@@ -0,0 +1,125 @@
+import json
+from typing import Any, Optional
+import gi
+
+gi.require_version('GLib', '2.0')
+
+from gi.repository import GLib, GObject
+
+from .hyprland import HyprlandService, HyprlandIPCNotFoundError
+
+# Events after which a monitor's workspace may have gained or lost a fullscreen window
+FULLSCREEN_EVENTS = frozenset({
+    "fullscreen", "workspace", "workspacev2", "focusedmon", "activewindow",
+    "closewindow", "movewindow", "moveworkspace", "destroyworkspace",
+})
+
+
+class FullscreenMonitor(GObject.Object):
+    """
+    Tracks whether a fullscreen window covers a monitor.
+
+    Follows the `hasfullscreen` flag of the workspace shown on `connector`
+    (the focused monitor if None), read from Hyprland's `j/monitors`. Events
+    that can change it only mark the state stale; it is re-read once per
+    batch of events, from an idle callback. Workspaces come from
+    HyprlandService's own sync, or from Hyprland directly while the bar
+    defers those syncs. While paused, e.g. while the session is locked,
+    nothing is read until `set_paused(False)`.
+
+    Example usage:
+
+    ```python
+    monitor = FullscreenMonitor(connector="DP-1")
+    monitor.connect("notify::fullscreen", lambda m, _: print(m.fullscreen))
+    ```
+    """
+
+    def __init__(self, connector: Optional[str] = None, hyprland: Optional[HyprlandService] = None):
+        super().__init__()
+        self.connector = connector
+        self.hyprland = hyprland or HyprlandService.get_default()
+        self._fullscreen = False
+        self._paused = False
+        self._stale = False
+        self._refresh_id = None
+        self.hyprland.connect("event", self._on_event)
+        self._refresh()
+
+    @GObject.Property(type=bool, default=False, flags=GObject.ParamFlags.READABLE)
+    def fullscreen(self) -> bool:
+        return self._fullscreen
+
+    def set_connector(self, connector: Optional[str]):
+        """Track the monitor named `connector` instead, e.g. after a window moved."""
+        if connector != self.connector:
+            self.connector = connector
+            self._stale = True
+            if not self._paused:
+                self._schedule_refresh()
+
+    def follow_window(self, window):
+        """Track whichever monitor the layer-shell `window` is placed on."""
+        def on_realize(window):
+            window.get_surface().connect(
+                "enter-monitor", lambda _surface, monitor: self.set_connector(monitor.get_connector())
+            )
+        if window.get_realized():
+            on_realize(window)
+        else:
+            window.connect("realize", on_realize)
+
+    def set_paused(self, paused: bool):
+        """Stop reading Hyprland state while `paused`; catch up once on resume."""
+        self._paused = paused
+        if paused:
+            if self._refresh_id is not None:
+                GLib.source_remove(self._refresh_id)
+                self._refresh_id = None
+        elif self._stale:
+            self._schedule_refresh()
+
+    def _on_event(self, hyprland, event_type, event_data):
+        if event_type not in FULLSCREEN_EVENTS:
+            return
+        self._stale = True
+        if not self._paused:
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        # Runs after the batch's syncs, so the service's workspaces are current
+        if self._refresh_id is None:
+            self._refresh_id = GLib.idle_add(self._on_refresh)
+
+    def _on_refresh(self):
+        self._refresh_id = None
+        self._refresh()
+        return False
+
+    def _refresh(self):
+        self._stale = False
+        try:
+            monitors = json.loads(self.hyprland.send_command("j/monitors"))
+            if self.hyprland.syncs_deferred:
+                workspaces = json.loads(self.hyprland.send_command("j/workspaces"))
+            else:
+                workspaces = self.hyprland.get_workspaces()
+        except (OSError, ValueError, HyprlandIPCNotFoundError) as e:
+            # Runs from an idle callback, so nothing may escape into GLib
+            print(f"Error reading monitors: {e}")
+            return
+        self._update(monitors, workspaces)
+
+    def _update(self, monitors: list[dict[str, Any]], workspaces: list[dict[str, Any]]):
+        monitor = next((
+            m for m in monitors
+            if (m.get("name") == self.connector if self.connector else m.get("focused"))
+        ), None)
+        workspace_id = (monitor or {}).get("activeWorkspace", {}).get("id")
+        fullscreen = any(
+            workspace.get("id") == workspace_id and bool(workspace.get("hasfullscreen"))
+            for workspace in workspaces
+        )
+        if fullscreen != self._fullscreen:
+            self._fullscreen = fullscreen
+            self.notify("fullscreen")
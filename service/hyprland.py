@@ -8,9 +8,17 @@ from typing import Any, Optional, Callable
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('GLib', '2.0')
-from gi.repository import GObject, GLib, Gio
+from gi.repository import GObject, Gio
 
 from .constants import HYPR_SOCKET_DIR
+from .metrics import metrics
+from .eventbus import Topic, bus
+
+EVENTS = metrics.counter("hyprland.events", "IPC events received")
+SYNCS = metrics.counter("hyprland.syncs", "State syncs run in response to events")
+COMMAND_MS = metrics.histogram("hyprland.command_ms", "IPC command round trip")
+
+EVENT_LINES = Topic("hyprland.event", str)  # raw lines from the event socket
 
 
 class HyprlandIPCNotFoundError(Exception):
@@ -44,7 +52,8 @@ class HyprlandService(GObject.Object):
         'workspaces-changed': (GObject.SignalFlags.RUN_FIRST, None, ()),
         'active-workspace-changed': (GObject.SignalFlags.RUN_FIRST, None, ()),
         'kb-layout-changed': (GObject.SignalFlags.RUN_FIRST, None, ()),
-        'active-window-changed': (GObject.SignalFlags.RUN_FIRST, None, ())
+        'active-window-changed': (GObject.SignalFlags.RUN_FIRST, None, ()),
+        'event': (GObject.SignalFlags.RUN_FIRST, None, (str, str)),  # type, data
     }
     
     # Define GObject properties
@@ -77,9 +86,13 @@ class HyprlandService(GObject.Object):
         self._last_window_address = None
         self._auto_sync_enabled = True
         self._event_thread_running = False
+        self._deferred_syncs: Optional[set[Callable[[], None]]] = None  # set while syncs are deferred
+        self._defer_count = 0
         
         # Connect to Hyprland if available
         if self.is_available():
+            bus.subscribe(EVENT_LINES, self._on_events_received)
+            
             # Initial sync
             self._sync_kb_layout()
             self._sync_workspaces()
@@ -112,7 +125,7 @@ class HyprlandService(GObject.Object):
         """Start listening for events from Hyprland IPC in a separate thread."""
         if not self._event_thread_running:
             self._event_thread_running = True
-            thread = threading.Thread(target=self._listen_events_thread, daemon=True)
+            thread = threading.Thread(target=self._listen_events_thread, name="hyprland-events", daemon=True)
             thread.start()
     
     def _listen_events_thread(self) -> None:
@@ -138,8 +151,8 @@ class HyprlandService(GObject.Object):
                             # Process complete lines
                             for i in range(len(lines) - 1):
                                 if lines[i]:
-                                    # Schedule event processing on main thread
-                                    GLib.idle_add(self._on_event_received, lines[i])
+                                    # Hand over to the main thread, batched per frame
+                                    bus.publish(EVENT_LINES, lines[i])
                             
                             # Keep partial line in buffer
                             buffer = lines[-1]
@@ -156,45 +169,84 @@ class HyprlandService(GObject.Object):
                 # Wait before retry
                 time.sleep(1)
     
-    def _on_event_received(self, event: str) -> None:
-        """Handle received events from Hyprland."""
-        event = event.strip()
+    def _on_events_received(self, events: list[str]) -> None:
+        """
+        Handle a batch of events from Hyprland.
         
-        # Extract event type and data
-        event_parts = event.split(">>")
-        # Extract event type and data
-        event_parts = event.split(">>")
-        event_type = event_parts[0] if event_parts else ""
-        event_data = event_parts[1] if len(event_parts) > 1 else ""
+        Each event is emitted as "event" in order; the syncs they call for
+        then run once each, so a burst of events costs one sync per kind.
+        """
+        syncs: dict[Callable[[], None], None] = {}  # ordered set
+        for event in events:
+            EVENTS.inc()
+            
+            # Extract event type and data
+            event_type, _, event_data = event.strip().partition(">>")
+            self.emit("event", event_type, event_data)
+            syncs.update(dict.fromkeys(self._syncs_for(event_type)))
         
+        for sync in syncs:
+            if self._deferred_syncs is not None:
+                self._deferred_syncs.add(sync)
+            else:
+                sync()
+    
+    def _syncs_for(self, event_type: str) -> tuple[Callable[[], None], ...]:
+        """The sync methods an event type calls for, in order."""
         # Handle workspace events
         if event_type in ["workspace", "createworkspace", "destroyworkspace", 
                           "renameworkspace", "moveworkspace", "focusedmon"]:
-            self._sync_workspaces()
+            return (self._sync_workspaces,)
         
         # Handle keyboard layout events
-        elif event_type == "activelayout":
-            self._sync_kb_layout()
+        if event_type == "activelayout":
+            return (self._sync_kb_layout,)
         
         # Handle window events
-        elif event_type in ["activewindow", "windowtitle", "closewindow", 
-                           "movewindow", "openwindow", "fullscreen", "windowfocus"]:
+        if event_type in ["activewindow", "windowtitle", "closewindow", 
+                          "movewindow", "openwindow", "fullscreen", "windowfocus"]:
             # For window-related events, sync both window and workspaces
             # Windows events can affect workspace counts
-            self._sync_active_window()
-            self._sync_workspaces()
+            return (self._sync_active_window, self._sync_workspaces)
             
         # Handle special events for windows on specific workspaces
-        elif event_type in ["windowclose", "windowopen"]:
+        if event_type in ["windowclose", "windowopen"]:
             # These events directly inform us about window count changes
-            self._sync_workspaces()
+            return (self._sync_workspaces,)
         
-        return False  # Return False to remove from idle queue
+        return ()
+    
+    @property
+    def syncs_deferred(self) -> bool:
+        return self._deferred_syncs is not None
+    
+    def defer_syncs(self, deferred: bool = True) -> None:
+        """
+        Hold back syncs while `deferred`, e.g. while the bar is hidden.
+        
+        Events keep arriving and are still emitted as "event", but each kind
+        of sync they call for runs at most once, when syncs are resumed.
+        Calls nest: syncs resume after as many `defer_syncs(False)` as
+        `defer_syncs(True)`.
+        """
+        if deferred:
+            self._defer_count += 1
+            if self._deferred_syncs is None:
+                self._deferred_syncs = set()
+            return
+        self._defer_count = max(0, self._defer_count - 1)
+        if self._defer_count:
+            return
+        pending, self._deferred_syncs = self._deferred_syncs, None
+        for sync in (self._sync_kb_layout, self._sync_active_window, self._sync_workspaces):
+            if pending and sync in pending:
+                sync()
     
     def _sync_workspaces(self) -> None:
         """Sync workspaces information from Hyprland."""
         if not self._auto_sync_enabled:
             return
+        SYNCS.inc()
             
         try:
             self._workspaces = sorted(
@@ -216,6 +268,7 @@ class HyprlandService(GObject.Object):
         """Sync keyboard layout information from Hyprland."""
         if not self._auto_sync_enabled:
             return
+        SYNCS.inc()
             
         try:
             for kb in json.loads(self.send_command("j/devices"))["keyboards"]:
@@ -231,6 +284,7 @@ class HyprlandService(GObject.Object):
         """Sync active window information from Hyprland."""
         if not self._auto_sync_enabled:
             return
+        SYNCS.inc()
             
         try:
             self._active_window = json.loads(self.send_command("j/activewindow"))
@@ -259,7 +313,7 @@ class HyprlandService(GObject.Object):
             raise HyprlandIPCNotFoundError()
         
         try:
-            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            with COMMAND_MS.time(), socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
                 sock.connect(f"{HYPR_SOCKET_DIR}/.socket.sock")
                 sock.send(cmd.encode('utf-8'))
                 
@@ -0,0 +1,117 @@
+"""
+Deferred imports for optional subsystems.
+
+Modules that pull in optional GI typelibs (Cvc, NM, GnomeBluetooth,
+Playerctl, AstalTray) are imported through `lazy_import`, so their typelibs
+load when the service is first used rather than before the first window.
+Optional typelibs are loaded with `require_typelib`, which turns a missing or
+mismatched typelib into `TypelibUnavailable` (an ImportError) that callers
+can catch to degrade a single page.
+
+Every lazy import is timed; `import_report()` returns the cumulative time per
+module, nested imports included. It is exposed as `imports [text]` on the
+control socket.
+"""
+import importlib
+import sys
+import time
+from typing import Optional
+
+import gi
+
+_import_times: dict[str, float] = {}  # module -> cumulative milliseconds
+_import_errors: dict[str, str] = {}  # module -> error message
+
+
+class TypelibUnavailable(ImportError):
+    """A GI typelib needed by an optional subsystem is not installed."""
+
+    def __init__(self, namespace: str, version: str, reason: str = ""):
+        self.namespace = namespace
+        self.version = version
+        super().__init__(f"{namespace} {version} typelib is not available{': ' + reason if reason else ''}")
+
+
+def require_typelib(namespace: str, version: str):
+    """Load and return `gi.repository.<namespace>` at `version`."""
+    start = time.perf_counter()
+    try:
+        gi.require_version(namespace, version)
+        module = importlib.import_module(f"gi.repository.{namespace}")
+    except (ValueError, ImportError) as e:
+        raise TypelibUnavailable(namespace, version, str(e)) from e
+    finally:
+        _import_times.setdefault(f"gi.repository.{namespace}", (time.perf_counter() - start) * 1000)
+    return module
+
+
+def import_module(name: str):
+    """Import `name` now, recording how long the first import took."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    start = time.perf_counter()
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        _import_errors[name] = str(e)
+        raise
+    finally:
+        _import_times[name] = (time.perf_counter() - start) * 1000
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self):
+        if self._module is None:
+            self._module = import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        return f"<LazyModule {self._name}{' (loaded)' if self.loaded else ''}>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Return a proxy for module `name`; it is imported when first used.
+
+    ```python
+    audio = lazy_import("service.audio")
+    ...
+    try:
+        service = audio.Audio()  # service.audio (and Cvc) load here
+    except ImportError:
+        service = None
+    ```
+    """
+    return LazyModule(name)
+
+
+def import_report(errors: bool = False) -> dict:
+    """
+    Cumulative import time in milliseconds per lazily imported module,
+    slowest first. With `errors`, also return the modules that failed.
+    """
+    report = dict(sorted(_import_times.items(), key=lambda item: item[1], reverse=True))
+    if errors:
+        return {"times": report, "errors": dict(_import_errors)}
+    return report
+
+
+def format_import_report(limit: Optional[int] = None) -> str:
+    """The import report as aligned text lines."""
+    lines = [f"{ms:8.1f} ms  {name}" for name, ms in list(import_report().items())[:limit]]
+    lines += [f"  failed     {name}: {error}" for name, error in _import_errors.items()]
+    return "\n".join(lines)
@@ -0,0 +1,397 @@
+"""
+Runtime metrics: counters, gauges and latency histograms.
+
+Services record into the shared registry at module level:
+
+```python
+from .metrics import metrics
+
+EVENTS = metrics.counter("hyprland.events", "IPC events received")
+COMMAND_MS = metrics.histogram("hyprland.command_ms", "IPC command round trip")
+
+EVENTS.inc()
+with COMMAND_MS.time():
+    ...
+```
+
+Values live in arrays allocated once by the registry, so recording is an
+index and an add. The registry is exposed as `metrics [prefix]` on the
+control socket and written to `metrics.json` in the cache directory every
+`HYPRGTK4_METRICS_INTERVAL` seconds (60 by default, 0 disables it).
+With `HYPRGTK4_TRACK_SOURCES=1`, GLib timeouts and idle sources are counted
+as well.
+
+This module does not import gi at module level, so any module can record
+into it without loading typelibs.
+"""
+import bisect
+import json
+import os
+import threading
+import time
+from array import array
+from typing import Callable, Optional
+
+from .constants import CACHE_DIR
+
+MAX_METRICS = 128  # slots per kind, allocated up front
+DEFAULT_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250, 1000)  # upper bounds; the last bucket is open
+METRICS_INTERVAL_ENV = "HYPRGTK4_METRICS_INTERVAL"
+TRACK_SOURCES_ENV = "HYPRGTK4_TRACK_SOURCES"  # 1 to count GLib timeouts and idle sources
+DEFAULT_SNAPSHOT_INTERVAL = 60  # seconds
+DEFAULT_SNAPSHOT_PATH = os.path.join(CACHE_DIR, "metrics.json")
+
+
+class Counter:
+    """Monotonic count of events."""
+
+    __slots__ = ("name", "description", "_values", "_index")
+
+    def __init__(self, name: str, description: str, values: array, index: int):
+        self.name = name
+        self.description = description
+        self._values = values
+        self._index = index
+
+    def inc(self, amount: float = 1):
+        self._values[self._index] += amount
+
+    @property
+    def value(self) -> float:
+        return self._values[self._index]
+
+
+class Gauge:
+    """Current level of something; set directly or sampled from `source` when read."""
+
+    __slots__ = ("name", "description", "_values", "_index", "_source")
+
+    def __init__(self, name: str, description: str, values: array, index: int,
+                 source: Optional[Callable[[], float]] = None):
+        self.name = name
+        self.description = description
+        self._values = values
+        self._index = index
+        self._source = source
+
+    def set(self, value: float):
+        self._values[self._index] = value
+
+    def inc(self, amount: float = 1):
+        self._values[self._index] += amount
+
+    def dec(self, amount: float = 1):
+        self._values[self._index] -= amount
+
+    @property
+    def value(self) -> float:
+        if self._source is not None:
+            try:
+                self._values[self._index] = self._source()
+            except Exception as e:
+                print(f"Error sampling gauge {self.name}: {e}")
+        return self._values[self._index]
+
+
+class Histogram:
+    """Fixed-bucket distribution of durations in milliseconds."""
+
+    __slots__ = ("name", "description", "bounds", "_counts", "_sum")
+
+    def __init__(self, name: str, description: str, bounds: tuple):
+        self.name = name
+        self.description = description
+        self.bounds = bounds
+        self._counts = array("Q", [0]) * (len(bounds) + 1)
+        self._sum = array("d", [0.0])
+
+    def observe(self, value: float):
+        self._counts[bisect.bisect_left(self.bounds, value)] += 1
+        self._sum[0] += value
+
+    def time(self) -> '_Timer':
+        """Context manager observing how long its body takes."""
+        return _Timer(self)
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    def to_dict(self) -> dict:
+        count = self.count
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "count": count,
+            "sum": round(self._sum[0], 3),
+            "mean": round(self._sum[0] / count, 3) if count else 0,
+            "buckets": dict(zip(labels, self._counts)),
+        }
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe((time.perf_counter() - self._start) * 1000)
+        return False
+
+
+class MetricsRegistry:
+    """
+    Named counters, gauges and histograms shared by all services.
+
+    Registering a name twice returns the existing metric, so modules can
+    declare their metrics at import time.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_default(cls) -> 'MetricsRegistry':
+        """Get the registry shared by all services."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, capacity: int = MAX_METRICS):
+        self.capacity = capacity
+        self._counter_values = array("d", [0.0]) * capacity
+        self._gauge_values = array("d", [0.0]) * capacity
+        self._counters: dict[str, Counter] = {}
+        self._gauges: dict[str, Gauge] = {}
+        self._histograms: dict[str, Histogram] = {}
+        self._started_at = time.monotonic()
+        self._snapshot_id = None
+        self._source_tracker: Optional['SourceTracker'] = None
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        if name not in self._counters:
+            index = self._next_index(self._counters)
+            self._counters[name] = Counter(name, description, self._counter_values, index)
+        return self._counters[name]
+
+    def gauge(self, name: str, description: str = "", source: Optional[Callable[[], float]] = None) -> Gauge:
+        if name not in self._gauges:
+            index = self._next_index(self._gauges)
+            self._gauges[name] = Gauge(name, description, self._gauge_values, index, source)
+        return self._gauges[name]
+
+    def histogram(self, name: str, description: str = "", bounds: tuple = DEFAULT_BUCKETS_MS) -> Histogram:
+        if name not in self._histograms:
+            self._histograms[name] = Histogram(name, description, tuple(bounds))
+        return self._histograms[name]
+
+    def _next_index(self, metrics: dict) -> int:
+        if len(metrics) >= self.capacity:
+            raise ValueError(f"metrics registry is full ({self.capacity} per kind)")
+        return len(metrics)
+
+    def snapshot(self, prefix: str = "") -> dict:
+        """All metrics whose name starts with `prefix`, JSON-serialisable."""
+        uptime = time.monotonic() - self._started_at
+        minutes = max(uptime / 60, 1 / 60)
+        return {
+            "time": time.time(),
+            "uptime_s": round(uptime, 1),
+            "counters": {
+                name: {"value": counter.value, "per_minute": round(counter.value / minutes, 2)}
+                for name, counter in sorted(self._counters.items()) if name.startswith(prefix)
+            },
+            "gauges": {
+                name: gauge.value
+                for name, gauge in sorted(self._gauges.items()) if name.startswith(prefix)
+            },
+            "histograms": {
+                name: histogram.to_dict()
+                for name, histogram in sorted(self._histograms.items()) if name.startswith(prefix)
+            },
+        }
+
+    def describe(self) -> dict[str, str]:
+        """Description of every metric by name."""
+        return {
+            metric.name: metric.description
+            for group in (self._counters, self._gauges, self._histograms) for metric in group.values()
+        }
+
+    # --- Snapshot file ---
+
+    def write_snapshot(self, path: str = DEFAULT_SNAPSHOT_PATH) -> bool:
+        """Write `snapshot()` to `path`, replacing it atomically."""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump(self.snapshot(), f, indent=1)
+            os.replace(temp_path, path)
+            return True
+        except OSError as e:
+            print(f"Error writing metrics snapshot: {e}")
+            return False
+
+    def start_snapshots(self, path: str = DEFAULT_SNAPSHOT_PATH, interval: Optional[int] = None):
+        """Write a snapshot every `interval` seconds (from the environment if None)."""
+        from gi.repository import GLib
+
+        if interval is None:
+            try:
+                interval = int(os.getenv(METRICS_INTERVAL_ENV, DEFAULT_SNAPSHOT_INTERVAL))
+            except ValueError:
+                interval = DEFAULT_SNAPSHOT_INTERVAL
+        self.stop_snapshots()
+        if interval <= 0:
+            return
+
+        def on_timeout():
+            self.write_snapshot(path)
+            return True
+
+        self._snapshot_id = GLib.timeout_add_seconds(interval, on_timeout)
+
+    def stop_snapshots(self):
+        if self._snapshot_id is not None:
+            from gi.repository import GLib
+            GLib.source_remove(self._snapshot_id)
+            self._snapshot_id = None
+
+    # --- GLib sources ---
+
+    def track_sources(self):
+        """
+        Count GLib timeouts and idle sources added through the Python bindings.
+
+        Installs a `SourceTracker`, so it only sees sources added after it is
+        called. Every callback is wrapped while it is installed, so this is
+        opt-in: call it when `HYPRGTK4_TRACK_SOURCES=1`.
+        """
+        if self._source_tracker is not None:
+            return
+        added = {
+            "timeout_add": self.counter("glib.timeouts_added", "GLib timeouts added"),
+            "timeout_add_seconds": self.counter("glib.timeouts_added", "GLib timeouts added"),
+            "idle_add": self.counter("glib.idles_added", "GLib idle sources added"),
+        }
+        tracker = SourceTracker(on_add=lambda kind: added[kind].inc())
+        self.gauge("glib.timeouts_alive", "GLib timeouts pending",
+                   lambda: tracker.count(lambda kind: kind != "idle_add"))
+        self.gauge("glib.idles_queued", "GLib idle sources pending",
+                   lambda: tracker.count(lambda kind: kind == "idle_add"))
+        tracker.install()
+        self._source_tracker = tracker
+
+
+class SourceTracker:
+    """
+    Live GLib timeout and idle sources created through the Python bindings.
+
+    Wraps `GLib.timeout_add`, `timeout_add_seconds`, `idle_add` and
+    `source_remove` between `install` and `uninstall`. Sources are keyed by
+    their `TrackedCallback`, and the adder records the id under a lock that
+    the callback takes before dropping its entry, so a source added from
+    another thread and dispatched before the adder returns is still dropped.
+    """
+
+    _ADDERS = ("timeout_add", "timeout_add_seconds", "idle_add")
+
+    def __init__(self, on_add: Optional[Callable[[str], None]] = None):
+        """
+        Args:
+            on_add: Called with the adder's name for every source added.
+        """
+        self._on_add = on_add
+        self._lock = threading.Lock()
+        self._live: dict = {}  # TrackedCallback -> adder name
+        self._ids: dict[int, TrackedCallback] = {}  # source id -> TrackedCallback
+        self._originals = {}
+
+    def install(self):
+        from gi.repository import GLib
+
+        for name in self._ADDERS:
+            original = getattr(GLib, name)
+            self._originals[name] = original
+            setattr(GLib, name, self._wrap_adder(name, original))
+        self._originals["source_remove"] = GLib.source_remove
+        GLib.source_remove = self._source_remove
+
+    def uninstall(self):
+        from gi.repository import GLib
+
+        for name, original in self._originals.items():
+            setattr(GLib, name, original)
+        self._originals.clear()
+
+    def counts(self) -> dict:
+        """Live sources per adder name."""
+        counts = {}
+        with self._lock:
+            for kind in self._live.values():
+                counts[kind] = counts.get(kind, 0) + 1
+        return counts
+
+    def count(self, predicate: Callable[[str], bool]) -> int:
+        """Live sources whose adder name matches `predicate`."""
+        with self._lock:
+            return sum(1 for kind in self._live.values() if predicate(kind))
+
+    def _wrap_adder(self, name, original):
+        def add(*args, **kwargs):
+            # The callback is the first callable argument: (interval, cb, ...) or (cb, ...)
+            index = next((i for i, arg in enumerate(args) if callable(arg)), None)
+            if index is None:
+                # Let GLib report the bad arguments
+                return original(*args, **kwargs)
+            tracked = TrackedCallback(self, args[index])
+            with self._lock:
+                source_id = original(*args[:index], tracked, *args[index + 1:], **kwargs)
+                tracked.source_id = source_id
+                self._live[tracked] = name
+                self._ids[source_id] = tracked
+            if self._on_add is not None:
+                self._on_add(name)
+            return source_id
+        return add
+
+    def _finished(self, tracked: 'TrackedCallback'):
+        # Blocks until the adder has recorded the id if it is still returning
+        with self._lock:
+            self._live.pop(tracked, None)
+            self._ids.pop(tracked.source_id, None)
+
+    def _source_remove(self, source_id):
+        with self._lock:
+            tracked = self._ids.pop(source_id, None)
+            if tracked is not None:
+                self._live.pop(tracked, None)
+        return self._originals["source_remove"](source_id)
+
+
+class TrackedCallback:
+    """A source callback wrapped by `SourceTracker`; its frame is skipped by the watchdog."""
+
+    __slots__ = ("tracker", "callback", "source_id")
+
+    def __init__(self, tracker: SourceTracker, callback: Callable):
+        self.tracker = tracker
+        self.callback = callback
+        self.source_id = None
+
+    def __call__(self, *args):
+        keep = False
+        try:
+            keep = self.callback(*args)
+            return keep
+        finally:
+            # A callback that raises is removed by GLib too
+            if not keep:
+                self.tracker._finished(self)
+
+
+metrics = MetricsRegistry.get_default()
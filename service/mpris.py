@@ -1,16 +1,37 @@
 import contextlib
 import gi
 gi.require_version('Gtk', '4.0')
-gi.require_version('Playerctl', '2.0')
-from gi.repository import Gtk, GObject, Playerctl, GLib, Gdk # Add Gdk
+from gi.repository import Gtk, GObject, GLib, Gdk # Add Gdk
 from loguru import logger
 import os # Add os
+from .lazy import require_typelib
+from .metrics import metrics
+from .eventbus import Topic, bus
+
+Playerctl = require_typelib('Playerctl', '2.0')
+
+# Property names reported in the "changed" signal's dirty set
+METADATA_PROPS = ("metadata", "title", "artist", "arturl", "length")
+CAPABILITY_PROPS = ("can-seek", "can-pause", "can-shuffle", "can-go-next", "can-go-previous")
+STATUS_PROPS = ("playback-status", "loop-status", "shuffle", "volume", "seeked")
+ALL_PROPS = frozenset(METADATA_PROPS + CAPABILITY_PROPS + STATUS_PROPS)
+
+CHANGED_EMISSIONS = metrics.counter("mpris.changed", "Coalesced player change emissions")
+PROGRESS_TICKS = metrics.counter("mpris.ticks", "Progress clock ticks")
 
 # Updated MprisPlayer class
 class MprisPlayer(GObject.Object):
+    """
+    Wrapper around a Playerctl player.
+
+    Property changes are collected into a dirty set and reported by a single
+    "changed" emission per event bus dispatch, carrying the frozenset of
+    property names that changed since the last emission.
+    """
+
     __gsignals__ = {
         "exit": (GObject.SignalFlags.RUN_FIRST, None, (bool,)),
-        "changed": (GObject.SignalFlags.RUN_FIRST, None, ()),
+        "changed": (GObject.SignalFlags.RUN_FIRST, None, (object,)),  # frozenset of property names
         "progress-updated": (GObject.SignalFlags.RUN_FIRST, None, (GObject.TYPE_INT64, GObject.TYPE_INT64)), # pos_usec, len_usec
     }
 
@@ -18,39 +39,57 @@ class MprisPlayer(GObject.Object):
         GObject.Object.__init__(self, **kwargs)
         self._signal_connectors = {}
         self._player = player
-        self._progress_timer_id = None  # Store timer ID
+        self._dirty = set()
+
+        # Position anchor used to extrapolate the position locally
+        self._anchor_position = 0  # microseconds
+        self._anchor_time = GLib.get_monotonic_time()
+        self._rate = 0.0
 
-        for sn in ["playback-status", "loop-status", "shuffle", "volume", "seeked"]:
+        for sn in STATUS_PROPS:
             self._signal_connectors[sn] = self._player.connect(
-                sn, lambda *args, sn=sn: self.notifier(sn, args)
+                sn, lambda *args, sn=sn: self.notifier(sn, args=args)
             )
         self._signal_connectors["exit"] = self._player.connect("exit", self.on_player_exit)
         self._signal_connectors["metadata"] = self._player.connect(
             "metadata", lambda *args: self.update_status()
         )
-        GLib.idle_add(lambda *args: self.update_status_once())
-        # Start the progress update timer
-        self._progress_timer_id = GLib.timeout_add(500, self._update_progress_tick)
-
-
-    def _update_progress_tick(self):
-        """Called periodically to update and emit progress."""
-        if not self._player:
-            return False # Stop timer if player is gone
-
-        try:
-            pos_usec = self._player.get_position()
-        except Exception:
-            pos_usec = 0
-
-        len_usec = self.length or 0 # Use the existing length property
+        # Resync the position anchor only when the player tells us it moved
+        self._signal_connectors["seeked-anchor"] = self._player.connect(
+            "seeked", lambda _player, position: self.resync_position(position)
+        )
+        self._signal_connectors["status-anchor"] = self._player.connect(
+            "playback-status", lambda *args: self.resync_position()
+        )
+        self._signal_connectors["metadata-anchor"] = self._player.connect(
+            "metadata", lambda *args: self.resync_position()
+        )
+        self.resync_position()
+        self.update_status_once()
+
+    def resync_position(self, position: int | None = None):
+        """Re-anchor the extrapolated position, querying the player if `position` is None."""
+        if position is None:
+            try:
+                position = self._player.get_position()
+            except Exception:
+                position = 0
+        self._anchor_position = position
+        self._anchor_time = GLib.get_monotonic_time()
+        self._rate = 1.0 if self.playback_status == "playing" else 0.0
 
-        # Emit the signal
-        self.emit("progress-updated", pos_usec, len_usec)
+    @property
+    def rate(self) -> float:
+        """Playback rate used for extrapolation, 0 when not playing."""
+        return self._rate
 
-        # Keep the timer running only if player is playing
-        # return self.playback_status == "playing" # Option 1: Only update when playing
-        return True # Option 2: Always update to show paused state correctly
+    @property
+    def estimated_position(self) -> int:
+        """Position in microseconds extrapolated from the last anchor."""
+        elapsed = GLib.get_monotonic_time() - self._anchor_time
+        position = self._anchor_position + int(elapsed * self._rate)
+        length = self.length
+        return min(position, length) if length else position
 
     @property
     def player(self) -> Playerctl.Player:
@@ -179,34 +218,23 @@ class MprisPlayer(GObject.Object):
             return False
 
     def update_status(self):
-        def notify_property(prop):
-            if getattr(self, prop, None) is not None:
-                self.notifier(prop)
-        for prop in ["metadata", "title", "artist", "arturl", "length"]:
-            GLib.idle_add(lambda p=prop: (notify_property(p), False))
-        for prop in ["can-seek", "can-pause", "can-shuffle", "can-go-next", "can-go-previous"]:
-            GLib.idle_add(lambda p=prop: (self.notifier(p), False))
+        self.notifier(*METADATA_PROPS, *CAPABILITY_PROPS)
 
     def update_status_once(self):
-        def notify_all():
-            for prop in list(self.__dict__.keys()):
-                self.notifier(prop)
-            return False
-        GLib.idle_add(notify_all, priority=GLib.PRIORITY_DEFAULT_IDLE)
+        self.notifier(*ALL_PROPS)
 
-    def notifier(self, name: str, args=None):
-        """Emit the 'changed' signal without notifying undefined properties."""
-        def notify_and_emit():
-            self.emit("changed")
-            return False
-        GLib.idle_add(notify_and_emit, priority=GLib.PRIORITY_DEFAULT_IDLE)
+    def notifier(self, *names, args=None):
+        """Mark properties dirty and schedule one "changed" emission for all of them."""
+        self._dirty.update(names)
+        bus.publish(PLAYER_CHANGED, self, key=id(self))
 
-    def on_player_exit(self, player):
-        # Stop the progress timer
-        if self._progress_timer_id:
-            GLib.source_remove(self._progress_timer_id)
-            self._progress_timer_id = None
+    def _emit_changed(self):
+        dirty, self._dirty = frozenset(self._dirty), set()
+        if dirty and hasattr(self, "_player"):
+            CHANGED_EMISSIONS.inc()
+            self.emit("changed", dirty)
 
+    def on_player_exit(self, player):
         for id in list(self._signal_connectors.values()):
             with contextlib.suppress(Exception):
                 self._player.disconnect(id)
@@ -230,6 +258,122 @@ class MprisPlayer(GObject.Object):
         if self.can_go_previous:
             GLib.idle_add(lambda: (self._player.previous(), False))
 
+
+PLAYER_CHANGED = Topic("mpris.changed", MprisPlayer)  # players with dirty properties
+
+
+def _on_players_changed(players: list[MprisPlayer]):
+    for player in players:
+        player._emit_changed()
+
+
+bus.subscribe(PLAYER_CHANGED, _on_players_changed)
+
+
+class ProgressClock(GObject.Object):
+    """
+    Single clock driving "progress-updated" for the visible player.
+
+    Instead of every player polling its position, the clock extrapolates the
+    position of one player (see `MprisPlayer.estimated_position`) and only
+    ticks while that player is playing and its view is visible. Ticks are
+    aligned to whole seconds of track position, matching the resolution of
+    the time labels. Seeks, status and track changes reschedule the clock.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_default(cls) -> "ProgressClock":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, **kwargs):
+        GObject.Object.__init__(self, **kwargs)
+        self._player: MprisPlayer | None = None
+        self._player_handlers = []
+        self._visible = False
+        self._paused = False
+        self._timeout_id = None
+
+    @property
+    def player(self) -> MprisPlayer | None:
+        return self._player
+
+    def set_player(self, player: MprisPlayer | None):
+        """Follow `player`, dropping the previous one."""
+        if player is self._player:
+            return
+        for handler in self._player_handlers:
+            with contextlib.suppress(Exception):
+                self._player.disconnect(handler)
+        self._player = player
+        self._player_handlers = []
+        if player is not None:
+            self._player_handlers = [
+                player.connect("changed", self._on_player_changed),
+                player.connect("exit", self._on_player_exit),
+            ]
+        self.tick()
+
+    def set_visible(self, visible: bool):
+        """Start or stop ticking with the visibility of the progress view."""
+        if visible == self._visible:
+            return
+        self._visible = visible
+        if visible:
+            self.tick()
+        else:
+            self._cancel()
+
+    def set_paused(self, paused: bool):
+        """Stop ticking while `paused`, e.g. while the session is locked; unpausing ticks now."""
+        if paused == self._paused:
+            return
+        self._paused = paused
+        if paused:
+            self._cancel()
+        else:
+            self.tick()
+
+    def _on_player_changed(self, player, dirty):
+        if dirty & {"seeked", "playback-status", "metadata", "length"}:
+            self.tick()
+
+    def _on_player_exit(self, player, _exited):
+        if player is self._player:
+            self._player = None
+            self._player_handlers = []
+            self._cancel()
+
+    def _cancel(self):
+        if self._timeout_id is not None:
+            GLib.source_remove(self._timeout_id)
+            self._timeout_id = None
+
+    def tick(self):
+        """Emit the current position now and schedule the next second boundary."""
+        self._cancel()
+        player = self._player
+        if player is None or not self._visible or self._paused or not hasattr(player, "_player"):
+            return False
+
+        position = player.estimated_position
+        PROGRESS_TICKS.inc()
+        player.emit("progress-updated", position, player.length or 0)
+
+        if player.rate > 0:
+            delay_ms = (1000000 - position % 1000000) / player.rate / 1000
+            self._timeout_id = GLib.timeout_add(max(1, int(delay_ms) + 1), self._on_timeout)
+        return False
+
+    def _on_timeout(self):
+        self._timeout_id = None
+        self.tick()
+        return False
+
+
 # MprisPlayerManager class (unchanged)
 class MprisPlayerManager(GObject.Object):
     __gsignals__ = {
@@ -1,10 +1,14 @@
 
 import json
 import os
+import socket
 import subprocess
 import sched
 import time
 
+XDG_RUNTIME_DIR = os.getenv("XDG_RUNTIME_DIR") or "/tmp"
+CONTROL_SOCKET = f"{XDG_RUNTIME_DIR}/hyprgtk4/control.sock"
+
 class HyprlandMonitor:
     def __init__(self, output_file="~/.cache/hypr_info.txt", update_interval=0.5):
         self.output_file = os.path.expanduser(output_file)
@@ -68,9 +72,40 @@ class HyprlandMonitor:
             print(f"Error in check_update: {e}")
         self.scheduler.enter(self.update_interval, 1, self.check_update)
 
+    def follow_bar(self):
+        """
+        Follow the running bar's state stream instead of polling hyprctl.
+        Returns when the bar isn't running or goes away.
+        """
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(CONTROL_SOCKET)
+        except OSError:
+            return
+        print(f"Following bar state on {CONTROL_SOCKET}")
+        with sock, sock.makefile("rw") as stream:
+            stream.write("subscribe active-workspace active-window\n")
+            stream.flush()
+            for line in stream:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # the "ok" reply
+                value = event.get("value") or {}
+                if event.get("topic") == "active-workspace":
+                    self.current_workspace = value.get("id") or 1
+                elif event.get("topic") == "active-window":
+                    self.active_window = {key: value.get(key, "") for key in ("title", "class", "app_id")}
+                self._update_info_file()
+
     def start(self):
         self._update_info_file()
         print(f"Hyprland monitor started - writing info to {self.output_file}")
+        try:
+            self.follow_bar()
+        except KeyboardInterrupt:
+            print("Monitoring stopped.")
+            return
         self.scheduler.enter(self.update_interval, 1, self.check_update)
         try:
             self.scheduler.run()
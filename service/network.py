@@ -9,9 +9,11 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('GLib', '2.0')
 gi.require_version('Gio', '2.0')
-gi.require_version('NM', '1.0')
 
-from gi.repository import Gtk, GLib, Gio, GObject, NM
+from gi.repository import Gtk, GLib, Gio, GObject
+from .lazy import require_typelib
+
+NM = require_typelib('NM', '1.0')
 
 
 class ConnectionState(IntEnum):
@@ -10,6 +10,9 @@ gi.require_version('GdkPixbuf', '2.0')
 gi.require_version("Gdk", "4.0")
 
 from gi.repository import Gio, GLib, GdkPixbuf, GObject, Gdk
+from .metrics import metrics
+
+NOTIFICATIONS_RECEIVED = metrics.counter("notifications.received", "Notify calls handled")
 
 def load_dbus_xml(xml_path: str) -> Gio.DBusNodeInfo:
     with open(xml_path, "r") as f:
@@ -342,6 +345,7 @@ class Notifications(GObject.Object):
                     GLib.Variant("(ssss)", ("fabric", "Fabric-Development", "0.0.2", "1.2"))
                 )
             case "Notify":
+                NOTIFICATIONS_RECEIVED.inc()
                 notif_id = self.new_notification_id()
                 notification = Notification(
                     id=notif_id,
@@ -0,0 +1,137 @@
+import os
+import threading
+from typing import Optional
+
+import gi
+gi.require_version('GdkPixbuf', '2.0')
+from gi.repository import GdkPixbuf
+
+from .constants import CACHE_DIR
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Constants
+PALETTE_CACHE_DIR = os.path.join(CACHE_DIR, "art", "palettes")
+SAMPLE_SIZE = 24  # art is downsampled to SAMPLE_SIZE x SAMPLE_SIZE before clustering
+PALETTE_SIZE = 4
+KMEANS_ITERATIONS = 8
+
+
+def _hex(color) -> str:
+    return "#{:02x}{:02x}{:02x}".format(*(int(round(c)) for c in color))
+
+
+def _luminance(rgb) -> float:
+    r, g, b = (c / 255 for c in rgb)
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def extract_palette(pixbuf, k: int = PALETTE_SIZE) -> Optional[dict]:
+    """
+    Compute a colour palette from a `GdkPixbuf.Pixbuf`.
+
+    The art is downsampled to SAMPLE_SIZE² pixels and clustered with a
+    vectorised k-means, seeded deterministically from luminance quantiles.
+    Returns a dict of hex colours (primary, secondary, accent, on-primary) or
+    None when NumPy is not installed.
+    """
+    if np is None:
+        return None
+
+    small = pixbuf.scale_simple(SAMPLE_SIZE, SAMPLE_SIZE, GdkPixbuf.InterpType.BILINEAR)
+    channels = small.get_n_channels()
+    rowstride = small.get_rowstride()
+    raw = np.frombuffer(small.get_pixels(), dtype=np.uint8)
+    rows = [raw[y * rowstride:y * rowstride + SAMPLE_SIZE * channels] for y in range(SAMPLE_SIZE)]
+    grid = np.stack(rows).reshape(-1, channels)
+    pixels = grid[:, :3].astype(np.float32)
+
+    if channels == 4:
+        pixels = pixels[grid[:, 3] > 127]
+    if len(pixels) < k:
+        return None
+
+    # Seed with pixels at luminance quantiles so results are stable per image
+    luma = pixels @ np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+    order = np.argsort(luma)
+    centers = pixels[order[np.linspace(0, len(order) - 1, k).astype(int)]].copy()
+
+    for _ in range(KMEANS_ITERATIONS):
+        distances = ((pixels[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        labels = distances.argmin(axis=1)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(centers)
+        np.add.at(sums, labels, pixels)
+        nonempty = counts > 0
+        centers[nonempty] = sums[nonempty] / counts[nonempty, None]
+
+    by_size = [centers[i] for i in np.argsort(-counts) if counts[i] > 0]
+    saturation = [float(c.max() - c.min()) for c in by_size]
+    accent = by_size[int(np.argmax(saturation))]
+    primary = by_size[0]
+    secondary = by_size[1] if len(by_size) > 1 else primary
+
+    return {
+        "primary": _hex(primary),
+        "secondary": _hex(secondary),
+        "accent": _hex(accent),
+        "on-primary": "#000000" if _luminance(primary) > 0.5 else "#ffffff",
+    }
+
+
+class PaletteCache:
+    """
+    Palettes keyed by the SHA-256 of the encoded art.
+
+    Kept in memory and mirrored to small files under PALETTE_CACHE_DIR, so
+    art that was seen before, in this session or an earlier one, is never
+    clustered again. Safe to use from worker threads.
+    """
+
+    _ROLES = ("primary", "secondary", "accent", "on-primary")
+
+    def __init__(self, cache_dir: str = PALETTE_CACHE_DIR):
+        self._cache_dir = cache_dir
+        self._palettes: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> Optional[dict]:
+        with self._lock:
+            palette = self._palettes.get(digest)
+        if palette is not None:
+            return palette
+
+        try:
+            with open(os.path.join(self._cache_dir, digest)) as f:
+                colors = f.read().split()
+        except OSError:
+            return None
+        if len(colors) != len(self._ROLES):
+            return None
+
+        palette = dict(zip(self._ROLES, colors))
+        with self._lock:
+            self._palettes[digest] = palette
+        return palette
+
+    def put(self, digest: str, palette: dict) -> None:
+        with self._lock:
+            self._palettes[digest] = palette
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(os.path.join(self._cache_dir, digest), "w") as f:
+                f.write(" ".join(palette[role] for role in self._ROLES))
+        except OSError as e:
+            print(f"Error caching palette: {e}")
+
+    def get_or_compute(self, digest: str, pixbuf) -> Optional[dict]:
+        """Return the cached palette for `digest`, computing it from `pixbuf` if needed."""
+        palette = self.get(digest)
+        if palette is None:
+            palette = extract_palette(pixbuf)
+            if palette is not None:
+                self.put(digest, palette)
+        return palette
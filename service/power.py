@@ -0,0 +1,225 @@
+import os
+from typing import Optional
+import gi
+
+gi.require_version('GLib', '2.0')
+gi.require_version('Gio', '2.0')
+
+from gi.repository import GObject, Gio, GLib
+
+from .battery import BatteryService
+
+# Profiles
+PROFILE_FULL = "full"
+PROFILE_REDUCED = "reduced"
+PROFILES = (PROFILE_FULL, PROFILE_REDUCED)
+POWER_PROFILE_ENV = "HYPRGTK4_POWER_PROFILE"  # full or reduced, overrides the automatic choice
+
+# power-profiles-daemon, under its current and its original bus name
+PPD_NAMES = (
+    ("org.freedesktop.UPower.PowerProfiles", "/org/freedesktop/UPower/PowerProfiles"),
+    ("net.hadess.PowerProfiles", "/net/hadess/PowerProfiles"),
+)
+PPD_POWER_SAVER = "power-saver"
+PPD_PERFORMANCE = "performance"
+
+# Timing per profile
+_SETTINGS = {
+    PROFILE_FULL: {
+        'frame-interval': 16,  # ms between steps of timeout-driven animations
+        'transitions': True,  # False makes frame-clock transitions instant
+        'debounce-scale': 1,  # multiplier for debounce windows
+        'prewarm': True,  # build hidden pages in idle time
+        'clock-seconds': True,  # clocks may tick every second
+    },
+    PROFILE_REDUCED: {
+        'frame-interval': 33,
+        'transitions': False,
+        'debounce-scale': 3,
+        'prewarm': False,
+        'clock-seconds': False,
+    },
+}
+
+
+class PowerProfile(GObject.Object):
+    """
+    Chooses between the full and reduced timing profile from the power state.
+
+    The reduced profile applies when power-profiles-daemon is set to
+    power-saver, or when running on battery unless it is set to performance.
+    `set_override()` (the `power` control command, or HYPRGTK4_POWER_PROFILE)
+    pins a profile until set back to None.
+
+    Widgets read their timing from here (`frame_interval`, `transitions`,
+    `debounce()`, `transition_duration()`, `prewarm`, `clock_seconds`) and
+    follow `notify::profile`.
+
+    Example usage:
+
+    ```python
+    power = PowerProfile.get_default()
+    power.connect("notify::profile", lambda p, _: print(p.profile))
+    GLib.timeout_add(power.frame_interval, step)
+    ```
+    """
+
+    __gproperties__ = {
+        'profile': (str, 'Profile', 'Active profile: full or reduced',
+                    PROFILE_FULL, GObject.ParamFlags.READABLE),
+        'automatic': (str, 'Automatic', 'Profile chosen from the power state',
+                      PROFILE_FULL, GObject.ParamFlags.READABLE),
+        'override': (str, 'Override', 'Profile pinned at runtime, empty for automatic',
+                     '', GObject.ParamFlags.READABLE),
+        'ppd-profile': (str, 'PPD Profile', 'Active power-profiles-daemon profile, empty if not running',
+                        '', GObject.ParamFlags.READABLE),
+    }
+
+    _instance = None
+
+    @classmethod
+    def get_default(cls) -> 'PowerProfile':
+        """Get the profile shared by all widgets."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, battery: Optional[BatteryService] = None):
+        super().__init__()
+        self._profile = PROFILE_FULL
+        self._automatic = PROFILE_FULL
+        self._override = os.getenv(POWER_PROFILE_ENV) if os.getenv(POWER_PROFILE_ENV) in PROFILES else ''
+        self._ppd_profile = ''
+        self._ppd_proxy: Optional[Gio.DBusProxy] = None
+
+        self._battery = battery or BatteryService.get_default()
+        self._battery.connect('notify::on-battery', lambda *_: self._update())
+        self._connect_ppd(0)
+        self._update()
+
+    def do_get_property(self, prop):
+        """Handle property getting."""
+        if prop.name == 'profile':
+            return self._profile
+        if prop.name == 'automatic':
+            return self._automatic
+        if prop.name == 'override':
+            return self._override
+        if prop.name == 'ppd-profile':
+            return self._ppd_profile
+        raise AttributeError(f'Unknown property {prop.name}')
+
+    @property
+    def profile(self) -> str:
+        return self._profile
+
+    @property
+    def reduced(self) -> bool:
+        return self._profile == PROFILE_REDUCED
+
+    def set_override(self, profile: Optional[str]):
+        """Pin `profile`, or return to the automatic choice with None."""
+        if profile is not None and profile not in PROFILES:
+            raise ValueError(f"unknown profile '{profile}', expected one of: {', '.join(PROFILES)}")
+        override = profile or ''
+        if override != self._override:
+            self._override = override
+            self.notify('override')
+            self._update()
+
+    def status(self) -> dict:
+        """Profile, how it was chosen and its settings."""
+        return {
+            'profile': self._profile,
+            'automatic': self._automatic,
+            'override': self._override or None,
+            'on_battery': self._battery.on_battery,
+            'ppd_profile': self._ppd_profile or None,
+            'settings': dict(_SETTINGS[self._profile]),
+        }
+
+    # --- Settings ---
+
+    @property
+    def frame_interval(self) -> int:
+        """Milliseconds between animation steps driven by timeouts."""
+        return _SETTINGS[self._profile]['frame-interval']
+
+    @property
+    def transitions(self) -> bool:
+        """False when stack and page transitions should be instant."""
+        return _SETTINGS[self._profile]['transitions']
+
+    @property
+    def prewarm(self) -> bool:
+        return _SETTINGS[self._profile]['prewarm']
+
+    @property
+    def clock_seconds(self) -> bool:
+        return _SETTINGS[self._profile]['clock-seconds']
+
+    def debounce(self, ms: int) -> int:
+        """A debounce window of `ms` milliseconds, lengthened when reduced."""
+        return ms * _SETTINGS[self._profile]['debounce-scale']
+
+    def transition_duration(self, ms: int) -> int:
+        """A transition of `ms` milliseconds, or 0 when transitions are off."""
+        return ms if self.transitions else 0
+
+    # --- State ---
+
+    def _update(self):
+        ppd = self._ppd_profile
+        if ppd == PPD_POWER_SAVER or (self._battery.on_battery and ppd != PPD_PERFORMANCE):
+            automatic = PROFILE_REDUCED
+        else:
+            automatic = PROFILE_FULL
+        if automatic != self._automatic:
+            self._automatic = automatic
+            self.notify('automatic')
+
+        profile = self._override or automatic
+        if profile != self._profile:
+            self._profile = profile
+            self.notify('profile')
+            print(f"Power profile: {profile}")
+
+    # --- power-profiles-daemon ---
+
+    def _connect_ppd(self, index: int):
+        name, path = PPD_NAMES[index]
+        Gio.DBusProxy.new_for_bus(
+            Gio.BusType.SYSTEM,
+            Gio.DBusProxyFlags.DO_NOT_AUTO_START,
+            None,
+            name,
+            path,
+            name,
+            None,
+            self._on_ppd_proxy_ready,
+            index
+        )
+
+    def _on_ppd_proxy_ready(self, source, result, index):
+        try:
+            proxy = Gio.DBusProxy.new_for_bus_finish(result)
+        except GLib.Error as e:
+            print(f"Error connecting to power-profiles-daemon: {e}")
+            proxy = None
+
+        if proxy is None or proxy.get_name_owner() is None:
+            if index + 1 < len(PPD_NAMES):
+                self._connect_ppd(index + 1)
+            return
+
+        self._ppd_proxy = proxy
+        proxy.connect('g-properties-changed', lambda *_: self._sync_ppd())
+        self._sync_ppd()
+
+    def _sync_ppd(self):
+        value = self._ppd_proxy.get_cached_property('ActiveProfile')
+        profile = value.unpack() if value is not None else ''
+        if profile != self._ppd_profile:
+            self._ppd_profile = profile
+            self.notify('ppd-profile')
+            self._update()
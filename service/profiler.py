@@ -0,0 +1,186 @@
+"""
+Startup timeline profiler.
+
+Enabled with `--profile-startup` or `HYPRGTK4_PROFILE_STARTUP=1` (or a file
+path instead of 1). Records module imports, service and widget construction
+and the first painted frame, then writes a Chrome trace JSON that opens in
+chrome://tracing or https://ui.perfetto.dev.
+
+This module must not import gi, so that main.py can import it first and the
+gi imports themselves are timed.
+"""
+import builtins
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Optional
+
+from .constants import CACHE_DIR
+
+PROFILE_ENV = "HYPRGTK4_PROFILE_STARTUP"
+PROFILE_FLAG = "--profile-startup"
+DEFAULT_TRACE_PATH = os.path.join(CACHE_DIR, "startup-trace.json")
+
+
+class StartupProfiler:
+    """
+    Collects trace events from process start to the first frame.
+
+    Spans are "complete" events in microseconds of `time.monotonic_ns()`,
+    relative to when this module was imported. When disabled, `span()`
+    returns a shared null context and nothing is recorded.
+
+    Example usage:
+
+    ```python
+    profiler = StartupProfiler.get_default()
+    with profiler.span("Bar", "widget"):
+        bar = Bar(app)
+    profiler.finish_on_first_frame(bar)
+    ```
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_default(cls) -> 'StartupProfiler':
+        """Get the profiler, enabled from the command line or environment."""
+        if cls._instance is None:
+            cls._instance = cls(cls._path_from_environment())
+        return cls._instance
+
+    @staticmethod
+    def _path_from_environment() -> Optional[str]:
+        value = os.getenv(PROFILE_ENV)
+        if PROFILE_FLAG in sys.argv:
+            sys.argv.remove(PROFILE_FLAG)
+            value = value or "1"
+        if not value or value == "0":
+            return None
+        return DEFAULT_TRACE_PATH if value == "1" else value
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._origin = time.monotonic_ns()
+        self._events = []
+        self._pid = os.getpid()
+        self._original_import = None
+        self._finished = False
+        if self.enabled:
+            self._install_import_hook()
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None and not self._finished
+
+    def _now_us(self) -> float:
+        return (time.monotonic_ns() - self._origin) / 1000
+
+    def _record(self, name: str, category: str, start: float, duration: float):
+        self._events.append({
+            "name": name, "cat": category, "ph": "X",
+            "ts": start, "dur": duration,
+            "pid": self._pid, "tid": threading.get_native_id(),
+        })
+
+    @contextlib.contextmanager
+    def _span(self, name: str, category: str):
+        start = self._now_us()
+        try:
+            yield
+        finally:
+            self._record(name, category, start, self._now_us() - start)
+
+    def span(self, name: str, category: str = "startup"):
+        """Context manager recording how long its body takes."""
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._span(name, category)
+
+    def instant(self, name: str, category: str = "startup"):
+        """Record a point in time."""
+        if self.enabled:
+            self._events.append({
+                "name": name, "cat": category, "ph": "i", "s": "p",
+                "ts": self._now_us(), "pid": self._pid, "tid": threading.get_native_id(),
+            })
+
+    # --- Imports ---
+
+    def _install_import_hook(self):
+        original = builtins.__import__
+        self._original_import = original
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            # Only first imports are interesting; cached ones cost nothing.
+            # `from gi.repository import Gtk` loads Gtk through the fromlist.
+            if level:
+                return original(name, globals, locals, fromlist, level)
+            if name in sys.modules:
+                missing = [item for item in fromlist or ()
+                           if f"{name}.{item}" not in sys.modules and not hasattr(sys.modules[name], item)]
+                if not missing:
+                    return original(name, globals, locals, fromlist, level)
+                label = f"{name}.{','.join(missing)}"
+            else:
+                label = name
+            with self._span(label, "import"):
+                return original(name, globals, locals, fromlist, level)
+
+        builtins.__import__ = timed_import
+
+    def _remove_import_hook(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    # --- Output ---
+
+    def finish_on_first_frame(self, widget):
+        """Write the trace after `widget`'s first frame has been painted."""
+        if not self.enabled:
+            return
+        frame_clock = widget.get_frame_clock()
+        if frame_clock is None:
+            widget.connect("realize", lambda w: self.finish_on_first_frame(w))
+            return
+
+        def on_after_paint(clock):
+            clock.disconnect(handler)
+            self.instant("first-frame")
+            self.finish()
+
+        handler = frame_clock.connect("after-paint", on_after_paint)
+
+    def finish(self) -> Optional[str]:
+        """Stop recording and write the trace. Returns the path written."""
+        if not self.enabled:
+            return None
+        self._finished = True
+        self._remove_import_hook()
+        from .lazy import import_report  # imports gi, so not at module level
+        trace = {
+            "traceEvents": [
+                {"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": "hyprgtk4"}},
+                *self._events,
+            ],
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "argv": sys.argv,
+                "python": sys.version.split()[0],
+                "time_to_first_frame_ms": self._now_us() / 1000,
+                "lazy_imports": import_report(errors=True),
+            },
+        }
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(trace, f)
+        except OSError as e:
+            print(f"Error writing startup trace: {e}")
+            return None
+        print(f"Startup trace written to {self.path} ({self._now_us() / 1000:.1f} ms to first frame)")
+        return self.path
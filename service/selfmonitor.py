@@ -0,0 +1,264 @@
+import gc
+import os
+import threading
+import time
+from array import array
+from typing import Optional
+import gi
+
+gi.require_version('GLib', '2.0')
+
+from gi.repository import GObject, GLib
+from loguru import logger
+
+from .metrics import metrics
+
+# Constants
+SAMPLE_INTERVAL_S = 2
+HISTORY = 150  # samples kept per series, 5 minutes at the default interval
+GC_PAUSE_HISTORY = 256
+FREEZE_DELAY_S = 10  # after startup, once the notch pages have been prewarmed
+SELF_MONITOR_ENV = "HYPRGTK4_SELF_MONITOR"
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+GC_PAUSE_MS = metrics.histogram("gc.pause_ms", "Garbage collection pauses", (0.1, 0.5, 1, 2, 5, 10, 20, 50, 100))
+GC_COLLECTIONS = metrics.counter("gc.collections", "Garbage collections run")
+
+
+class RingBuffer:
+    """Fixed number of float samples; the oldest is overwritten when full."""
+
+    __slots__ = ("_values", "_next", "_count")
+
+    def __init__(self, capacity: int = HISTORY):
+        self._values = array("d", [0.0]) * capacity
+        self._next = 0
+        self._count = 0
+
+    def append(self, value: float):
+        self._values[self._next] = value
+        self._next = (self._next + 1) % len(self._values)
+        self._count = min(self._count + 1, len(self._values))
+
+    @property
+    def last(self) -> float:
+        return self._values[self._next - 1] if self._count else 0.0
+
+    def values(self) -> list[float]:
+        """Samples, oldest first."""
+        if self._count < len(self._values):
+            return self._values[:self._count].tolist()
+        return (self._values[self._next:] + self._values[:self._next]).tolist()
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def _read_cpu_ticks(path: str) -> int:
+    """utime + stime from a /proc stat file"""
+    with open(path) as f:
+        # The command name may contain spaces, so split after its closing paren
+        fields = f.read().rpartition(")")[2].split()
+    return int(fields[11]) + int(fields[12])
+
+
+def _read_status() -> dict[str, str]:
+    status = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            status[key] = value.strip()
+    return status
+
+
+class SelfMonitor(GObject.Object):
+    """
+    Samples the bar's own resource use from /proc, replacing external
+    `ps` polling.
+
+    Every SAMPLE_INTERVAL_S while held, it records process CPU, per-thread
+    CPU (named from `threading`, e.g. the Hyprland listener, art loaders and
+    Bluetooth workers), RSS and thread count into fixed-size ring buffers,
+    and emits "sampled". Sampling runs only while something holds the
+    monitor: the debug overlay while it is shown, `selfmonitor start` on the
+    control socket, or HYPRGTK4_SELF_MONITOR=1.
+
+    Garbage collection pauses are always timed through `gc.callbacks`, and
+    `freeze_after_startup` moves the long-lived startup objects (widgets,
+    services) out of the collector's reach with `gc.freeze()`, timing a full
+    collection before and after to report the effect.
+    """
+
+    __gsignals__ = {
+        'sampled': (GObject.SignalFlags.RUN_FIRST, None, ()),
+    }
+
+    _instance = None
+
+    @classmethod
+    def get_default(cls) -> 'SelfMonitor':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.cpu_percent = RingBuffer()
+        self.rss_mb = RingBuffer()
+        self.threads: dict[int, RingBuffer] = {}  # native thread id -> CPU percent
+        self.thread_names: dict[int, str] = {}  # native thread id -> name, for labels
+        self.gc_pauses = RingBuffer(GC_PAUSE_HISTORY)
+        self.freeze_report: Optional[dict] = None
+        self._thread_count = 0
+        self._holders = 0
+        self._held_by_control = False
+        self._timeout_id = None
+        self._last_time = None
+        self._last_ticks = 0
+        self._last_thread_ticks: dict[int, int] = {}
+        self._gc_start = None
+
+        gc.callbacks.append(self._on_gc)
+        metrics.gauge("process.cpu_percent", "CPU use at the last sample", lambda: self.cpu_percent.last)
+        metrics.gauge("process.rss_mb", "Resident memory at the last sample", lambda: self.rss_mb.last)
+        metrics.gauge("process.threads", "Threads at the last sample", lambda: self._thread_count)
+        metrics.gauge("gc.frozen_objects", "Objects moved to the permanent generation", gc.get_freeze_count)
+
+        if os.getenv(SELF_MONITOR_ENV, "0") not in ("", "0"):
+            self.hold()
+
+    # --- Sampling ---
+
+    @property
+    def running(self) -> bool:
+        return self._timeout_id is not None
+
+    def hold(self):
+        """Sample until a matching `release()`."""
+        self._holders += 1
+        if self._timeout_id is None:
+            self.sample()
+            self._timeout_id = GLib.timeout_add_seconds(SAMPLE_INTERVAL_S, self._on_timeout)
+
+    def release(self):
+        self._holders = max(0, self._holders - 1)
+        if self._holders == 0 and self._timeout_id is not None:
+            GLib.source_remove(self._timeout_id)
+            self._timeout_id = None
+            self._last_time = None
+
+    def set_held_by_control(self, held: bool):
+        """Hold on behalf of the control socket; repeated calls don't stack."""
+        if held != self._held_by_control:
+            self._held_by_control = held
+            self.hold() if held else self.release()
+
+    def _on_timeout(self):
+        self.sample()
+        return True
+
+    def sample(self):
+        """Take one sample of CPU, per-thread CPU and memory."""
+        now = time.monotonic()
+        try:
+            ticks = _read_cpu_ticks("/proc/self/stat")
+            thread_ticks = {}
+            for tid in os.listdir("/proc/self/task"):
+                try:
+                    thread_ticks[int(tid)] = _read_cpu_ticks(f"/proc/self/task/{tid}/stat")
+                except OSError:
+                    pass  # exited while listing
+            status = _read_status()
+        except OSError as e:
+            print(f"Error sampling /proc/self: {e}")
+            return
+
+        self.rss_mb.append(int(status.get("VmRSS", "0 kB").split()[0]) / 1024)
+        self._thread_count = int(status.get("Threads", len(thread_ticks)))
+        if self._last_time is not None:
+            elapsed_ticks = (now - self._last_time) * CLOCK_TICKS
+            self.cpu_percent.append((ticks - self._last_ticks) / elapsed_ticks * 100)
+            # Keyed by thread id: pool workers and restarted threads may share a name
+            names = self._thread_names()
+            for tid, thread_total in thread_ticks.items():
+                self.thread_names[tid] = names.get(tid, f"native-{tid}")
+                previous = self._last_thread_ticks.get(tid, thread_total)
+                self.threads.setdefault(tid, RingBuffer()).append((thread_total - previous) / elapsed_ticks * 100)
+            for tid in list(self.threads):
+                if tid not in thread_ticks:
+                    del self.threads[tid]
+                    del self.thread_names[tid]
+        self._last_time = now
+        self._last_ticks = ticks
+        self._last_thread_ticks = thread_ticks
+        self.emit('sampled')
+
+    @staticmethod
+    def _thread_names() -> dict[int, str]:
+        names = {thread.native_id: thread.name for thread in threading.enumerate()}
+        names[threading.main_thread().native_id] = "main"
+        return names
+
+    # --- Garbage collection ---
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            pause_ms = (time.perf_counter() - self._gc_start) * 1000
+            self._gc_start = None
+            self.gc_pauses.append(pause_ms)
+            GC_PAUSE_MS.observe(pause_ms)
+            GC_COLLECTIONS.inc()
+
+    def freeze_after_startup(self, delay: int = FREEZE_DELAY_S):
+        """Call `freeze()` once startup has settled."""
+        GLib.timeout_add_seconds(delay, lambda: (self.freeze(), False)[1])
+
+    def freeze(self) -> dict:
+        """
+        Collect once, then `gc.freeze()` everything alive so later collections
+        skip it. Returns and logs the full-collection time before and after.
+        """
+        start = time.perf_counter()
+        gc.collect()
+        before_ms = (time.perf_counter() - start) * 1000
+        gc.freeze()
+        start = time.perf_counter()
+        gc.collect()
+        after_ms = (time.perf_counter() - start) * 1000
+        self.freeze_report = {
+            "frozen_objects": gc.get_freeze_count(),
+            "full_collect_ms_before": round(before_ms, 2),
+            "full_collect_ms_after": round(after_ms, 2),
+        }
+        logger.info(
+            f"[SelfMonitor] Froze {gc.get_freeze_count()} objects; "
+            f"full collection {before_ms:.1f} ms -> {after_ms:.1f} ms"
+        )
+        return self.freeze_report
+
+    # --- Report ---
+
+    def report(self, history: bool = False) -> dict:
+        """The latest sample, or every sample kept with `history`."""
+        series = (lambda buffer: [round(v, 2) for v in buffer.values()]) if history else (lambda buffer: round(buffer.last, 2))
+        pauses = self.gc_pauses.values()
+        return {
+            "running": self.running,
+            "interval_s": SAMPLE_INTERVAL_S,
+            "cpu_percent": series(self.cpu_percent),
+            "rss_mb": series(self.rss_mb),
+            "threads": [
+                {"tid": tid, "name": self.thread_names[tid], "cpu_percent": series(buffer)}
+                for tid, buffer in sorted(self.threads.items(), key=lambda item: (self.thread_names[item[0]], item[0]))
+            ],
+            "gc": {
+                "counts": gc.get_count(),
+                "collections": [stats["collections"] for stats in gc.get_stats()],
+                "recent_pauses": len(pauses),
+                "max_pause_ms": round(max(pauses, default=0), 3),
+                "mean_pause_ms": round(sum(pauses) / len(pauses), 3) if pauses else 0,
+                "freeze": self.freeze_report,
+            },
+        }
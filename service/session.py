@@ -0,0 +1,209 @@
+import os
+from typing import Optional
+import gi
+
+gi.require_version('GLib', '2.0')
+gi.require_version('Gio', '2.0')
+
+from gi.repository import GObject, Gio, GLib
+
+LOGIND_NAME = "org.freedesktop.login1"
+LOGIND_PATH = "/org/freedesktop/login1"
+LOGIND_MANAGER_IFACE = "org.freedesktop.login1.Manager"
+LOGIND_SESSION_IFACE = "org.freedesktop.login1.Session"
+PROPERTIES_IFACE = "org.freedesktop.DBus.Properties"
+
+
+class SessionState(GObject.Object):
+    """
+    Whether anyone is looking at the session, from logind.
+
+    Follows the session's `LockedHint` and `IdleHint` properties (set by
+    screen lockers and idle daemons such as hyprlock and hypridle) and the
+    manager's `PrepareForSleep`. The session is `suspended` while locked,
+    idle or going to sleep; "suspend" and "resume" are emitted when that
+    changes, so services can stop their timers and pollers and catch up once
+    with a single refresh.
+
+    Everything is asynchronous, so nothing blocks the main loop. Pass a
+    connection to a private bus to test against a logind stand-in (see
+    bench/fake_logind.py).
+
+    Example usage:
+
+    ```python
+    session = SessionState.get_default()
+    session.connect("suspend", lambda s: clock.set_paused(True))
+    session.connect("resume", lambda s: clock.set_paused(False))
+    ```
+    """
+
+    __gproperties__ = {
+        'locked': (bool, 'Locked', 'Whether the session is locked',
+                   False, GObject.ParamFlags.READABLE),
+        'idle': (bool, 'Idle', 'Whether the session is idle',
+                 False, GObject.ParamFlags.READABLE),
+        'sleeping': (bool, 'Sleeping', 'Whether the system is about to sleep',
+                     False, GObject.ParamFlags.READABLE),
+        'suspended': (bool, 'Suspended', 'Locked, idle or sleeping',
+                      False, GObject.ParamFlags.READABLE),
+    }
+
+    __gsignals__ = {
+        'suspend': (GObject.SignalFlags.RUN_FIRST, None, ()),
+        'resume': (GObject.SignalFlags.RUN_FIRST, None, ()),
+    }
+
+    _instance = None
+
+    @classmethod
+    def get_default(cls) -> 'SessionState':
+        """Get the state of this process's session on the system bus."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, connection: Optional[Gio.DBusConnection] = None, suspend_when_idle: bool = True):
+        """
+        Args:
+            connection: Bus to talk to logind on. Defaults to the system bus;
+                pass a private connection to use a logind stand-in.
+            suspend_when_idle: Also suspend while the session is idle, not
+                only while it is locked.
+        """
+        super().__init__()
+        self.suspend_when_idle = suspend_when_idle
+        self._state = {'locked': False, 'idle': False, 'sleeping': False}
+        self._suspended = False
+        self._connection = connection
+        self._session_path: Optional[str] = None
+        self._subscriptions = []
+        if connection is None:
+            Gio.bus_get(Gio.BusType.SYSTEM, None, self._on_bus_ready, None)
+        else:
+            self._request_session_path()
+
+    def do_get_property(self, prop):
+        """Handle property getting."""
+        if prop.name == 'suspended':
+            return self._suspended
+        if prop.name in self._state:
+            return self._state[prop.name]
+        raise AttributeError(f'Unknown property {prop.name}')
+
+    @property
+    def locked(self) -> bool:
+        return self._state['locked']
+
+    @property
+    def idle(self) -> bool:
+        return self._state['idle']
+
+    @property
+    def suspended(self) -> bool:
+        return self._suspended
+
+    def status(self) -> dict:
+        return {**self._state, 'suspended': self._suspended, 'session': self._session_path}
+
+    def cleanup(self):
+        for subscription in self._subscriptions:
+            self._connection.signal_unsubscribe(subscription)
+        self._subscriptions = []
+
+    # --- State ---
+
+    def _set(self, **values):
+        for name, value in values.items():
+            if self._state[name] != value:
+                self._state[name] = value
+                self.notify(name)
+
+        suspended = self._state['locked'] or self._state['sleeping'] or (
+            self.suspend_when_idle and self._state['idle']
+        )
+        if suspended != self._suspended:
+            self._suspended = suspended
+            self.notify('suspended')
+            self.emit('suspend' if suspended else 'resume')
+
+    # --- logind ---
+
+    def _on_bus_ready(self, source, result, user_data):
+        try:
+            self._connection = Gio.bus_get_finish(result)
+        except GLib.Error as e:
+            print(f"Session: system bus unavailable, not watching lock/idle: {e}")
+            return
+        self._request_session_path()
+
+    def _request_session_path(self):
+        self._subscriptions.append(self._connection.signal_subscribe(
+            LOGIND_NAME, LOGIND_MANAGER_IFACE, "PrepareForSleep", LOGIND_PATH,
+            None, Gio.DBusSignalFlags.NONE, self._on_prepare_for_sleep, None,
+        ))
+        self._connection.call(
+            LOGIND_NAME, LOGIND_PATH, LOGIND_MANAGER_IFACE, "GetSessionByPID",
+            GLib.Variant("(u)", (os.getpid(),)), GLib.VariantType.new("(o)"),
+            Gio.DBusCallFlags.NONE, -1, None, self._on_session_path, None,
+        )
+
+    def _on_session_path(self, connection, result, user_data):
+        try:
+            session_path = connection.call_finish(result).get_child_value(0).get_string()
+        except GLib.Error as e:
+            # Not in a session scope (e.g. started from a user service); ask for
+            # the real path behind "auto", since logind emits no signals on the alias
+            print(f"Error getting session path, trying the auto session: {e}")
+            connection.call(
+                LOGIND_NAME, LOGIND_PATH, LOGIND_MANAGER_IFACE, "GetSession",
+                GLib.Variant("(s)", ("auto",)), GLib.VariantType.new("(o)"),
+                Gio.DBusCallFlags.NONE, -1, None, self._on_auto_session_path, None,
+            )
+            return
+        self._watch_session(connection, session_path)
+
+    def _on_auto_session_path(self, connection, result, user_data):
+        try:
+            session_path = connection.call_finish(result).get_child_value(0).get_string()
+        except GLib.Error as e:
+            print(f"Session: no logind session, not watching lock/idle: {e}")
+            return
+        self._watch_session(connection, session_path)
+
+    def _watch_session(self, connection, session_path: str):
+        self._session_path = session_path
+        self._subscriptions.append(connection.signal_subscribe(
+            LOGIND_NAME, PROPERTIES_IFACE, "PropertiesChanged", self._session_path,
+            LOGIND_SESSION_IFACE, Gio.DBusSignalFlags.NONE, self._on_properties_changed, None,
+        ))
+        connection.call(
+            LOGIND_NAME, self._session_path, PROPERTIES_IFACE, "GetAll",
+            GLib.Variant("(s)", (LOGIND_SESSION_IFACE,)), GLib.VariantType.new("(a{sv})"),
+            Gio.DBusCallFlags.NONE, -1, None, self._on_properties, None,
+        )
+
+    def _on_properties(self, connection, result, user_data):
+        try:
+            (properties,) = connection.call_finish(result).unpack()
+        except GLib.Error as e:
+            print(f"Error reading session properties: {e}")
+            return
+        self._apply(properties)
+
+    def _on_properties_changed(self, conn, sender, path, interface, signal, params, user_data):
+        _iface, changed, _invalidated = params.unpack()
+        self._apply(changed)
+
+    def _apply(self, properties: dict):
+        values = {}
+        if 'LockedHint' in properties:
+            values['locked'] = bool(properties['LockedHint'])
+        if 'IdleHint' in properties:
+            values['idle'] = bool(properties['IdleHint'])
+        if values:
+            self._set(**values)
+
+    def _on_prepare_for_sleep(self, conn, sender, path, interface, signal, params, user_data):
+        (sleeping,) = params.unpack()
+        self._set(sleeping=bool(sleeping))
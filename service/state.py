@@ -0,0 +1,198 @@
+import json
+from typing import Any, Callable, Optional
+import gi
+
+gi.require_version('GObject', '2.0')
+
+from gi.repository import GObject
+
+# Topics published by the bar
+TOPIC_WORKSPACES = "workspaces"
+TOPIC_ACTIVE_WORKSPACE = "active-workspace"
+TOPIC_ACTIVE_WINDOW = "active-window"
+TOPIC_KB_LAYOUT = "kb-layout"
+TOPIC_VOLUME = "volume"
+TOPIC_BRIGHTNESS = "brightness"
+TOPIC_MEDIA = "media"
+TOPIC_POWER_PROFILE = "power-profile"
+
+
+class StateHub(GObject.Object):
+    """
+    Read-only snapshot of what the bar already knows, for external scripts.
+
+    Services are attached with the `watch_*` methods; the hub listens to their
+    signals and keeps one JSON-serialisable value per topic. `publish` drops
+    values equal to the current one, so subscribers only see real changes.
+    Nothing here polls or calls out: it reuses the services' own caches.
+
+    The control socket exposes it as `state [topic...]` (one JSON object) and
+    `subscribe [topic...]` (a JSON line `{"topic": ..., "value": ...}` per
+    change, starting with the current values).
+    """
+
+    __gsignals__ = {
+        'changed': (GObject.SignalFlags.RUN_FIRST, None, (str,)),  # topic
+    }
+
+    _instance = None
+
+    @classmethod
+    def get_default(cls) -> 'StateHub':
+        """Get the hub shared by the bar's services and the control socket."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._state: dict[str, Any] = {}
+        self._media_player = None
+        self._media_handlers = []
+
+    @property
+    def topics(self) -> list[str]:
+        return sorted(self._state)
+
+    def get(self, *topics: str) -> dict:
+        """The current value of `topics` (all topics if none are given)."""
+        if not topics:
+            return dict(self._state)
+        return {topic: self._state.get(topic) for topic in topics}
+
+    def publish(self, topic: str, value: Any):
+        """Set `topic` to `value` and emit "changed" if it differs."""
+        if self._state.get(topic, object()) == value:
+            return
+        self._state[topic] = value
+        self.emit('changed', topic)
+
+    def subscribe(self, callback: Callable[[str, Any], None], topics: Optional[list[str]] = None) -> Callable[[], None]:
+        """
+        Call `callback(topic, value)` now for the current values and on every
+        change. Returns a function that ends the subscription.
+        """
+        wanted = set(topics) if topics else None
+        for topic, value in self._state.items():
+            if wanted is None or topic in wanted:
+                callback(topic, value)
+
+        def on_changed(_hub, topic):
+            if wanted is None or topic in wanted:
+                callback(topic, self._state[topic])
+
+        handler = self.connect('changed', on_changed)
+        return lambda: self.disconnect(handler)
+
+    # --- Sources ---
+
+    def watch_hyprland(self, hyprland):
+        """Publish workspaces, the active window and keyboard layout from a HyprlandService."""
+        def on_workspaces(*_args):
+            self.publish(TOPIC_WORKSPACES, [
+                {"id": ws.get("id"), "name": ws.get("name"), "windows": ws.get("windows", 0),
+                 "monitor": ws.get("monitor")}
+                for ws in hyprland.get_workspaces()
+            ])
+
+        def on_active_workspace(*_args):
+            ws = hyprland.get_active_workspace() or {}
+            self.publish(TOPIC_ACTIVE_WORKSPACE, {"id": ws.get("id"), "name": ws.get("name")})
+
+        def on_active_window(*_args):
+            window = hyprland.get_active_window() or {}
+            self.publish(TOPIC_ACTIVE_WINDOW, {
+                "title": window.get("title", ""),
+                "class": window.get("class", ""),
+                "app_id": window.get("initialClass", ""),
+                "address": window.get("address", ""),
+            })
+
+        hyprland.connect('workspaces-changed', on_workspaces)
+        hyprland.connect('active-workspace-changed', on_active_workspace)
+        hyprland.connect('active-window-changed', on_active_window)
+        hyprland.connect('kb-layout-changed', lambda *_: self.publish(TOPIC_KB_LAYOUT, hyprland.get_kb_layout()))
+        on_workspaces()
+        on_active_workspace()
+        on_active_window()
+        self.publish(TOPIC_KB_LAYOUT, hyprland.get_kb_layout())
+
+    def watch_audio(self, audio):
+        """Publish the default speaker's volume from an Audio service."""
+        def update(*_args):
+            speaker = audio.speaker
+            if speaker is None:
+                self.publish(TOPIC_VOLUME, None)
+            else:
+                self.publish(TOPIC_VOLUME, {"volume": round(speaker.volume), "muted": bool(speaker.muted)})
+
+        audio.connect('changed', update)
+        audio.connect('speaker-changed', update)
+        update()
+
+    def watch_backlight(self, backlight):
+        """Publish the brightness of a BacklightService."""
+        def update(*_args):
+            if not backlight.available:
+                self.publish(TOPIC_BRIGHTNESS, None)
+                return
+            self.publish(TOPIC_BRIGHTNESS, {
+                "brightness": backlight.brightness,
+                "max": backlight.max_brightness,
+                "level": round(backlight.get_level() * 100),
+            })
+
+        backlight.connect('notify::brightness', update)
+        backlight.connect('notify::available', update)
+        update()
+
+    def watch_power(self, power):
+        """Publish the status of a PowerProfile."""
+        def update(*_args):
+            self.publish(TOPIC_POWER_PROFILE, power.status())
+
+        for name in ('profile', 'automatic', 'override', 'ppd-profile'):
+            power.connect(f'notify::{name}', update)
+        update()
+
+    def watch_media(self, player):
+        """Publish metadata of the active MprisPlayer (None clears it)."""
+        if player is self._media_player:
+            return
+        for handler in self._media_handlers:
+            try:
+                self._media_player.disconnect(handler)
+            except TypeError:
+                pass
+        self._media_player = player
+        self._media_handlers = []
+        if player is None:
+            self.publish(TOPIC_MEDIA, None)
+            return
+
+        def update(*_args):
+            if not hasattr(player, "_player"):  # player exited
+                return
+            self.publish(TOPIC_MEDIA, {
+                "player": player.player_name,
+                "title": player.title or "",
+                "artist": player.artist or "",
+                "album": player.album or "",
+                "art_url": player.arturl or "",
+                "length": player.length or 0,
+                "status": player.playback_status,
+            })
+
+        def on_exit(*_args):
+            if self._media_player is player:
+                self._media_player = None
+                self._media_handlers = []
+                self.publish(TOPIC_MEDIA, None)
+
+        self._media_handlers = [player.connect('changed', update), player.connect('exit', on_exit)]
+        update()
+
+
+def to_json(value: Any) -> str:
+    """Compact single-line JSON, as sent over the control socket."""
+    return json.dumps(value, separators=(",", ":"), default=str)
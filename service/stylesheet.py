@@ -0,0 +1,221 @@
+import os
+import re
+import time
+from typing import Optional
+import gi
+
+gi.require_version('Gtk', '4.0')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gio', '2.0')
+gi.require_version('GLib', '2.0')
+
+from gi.repository import GObject, Gtk, Gdk, Gio, GLib
+
+from .metrics import metrics
+from .power import PowerProfile
+
+# Constants
+DEBOUNCE_MS = 150  # quiet time after the last change event before reloading
+RELOADS = metrics.counter("css.reloads", "Stylesheet files reloaded")
+RESTYLE_MS = metrics.histogram("css.restyle_ms", "Reload to repaint", (5, 10, 20, 50, 100, 250, 500, 1000))
+IMPORT_RE = re.compile(r"""^\s*@import\s+(?:url\()?['"]([^'"]+)['"]\)?\s*;\s*$""", re.MULTILINE)
+
+
+class StyleSheetManager(GObject.Object):
+    """
+    Loads the stylesheets with one `Gtk.CssProvider` per file and hot reloads
+    only the file that changed.
+
+    The root stylesheet's `@import`s are expanded into separate providers,
+    added in import order, followed by the root's own rules and any extra
+    files that aren't imported. Change events are debounced per file and a
+    reload happens on `CHANGES_DONE_HINT` or after DEBOUNCE_MS of quiet, so
+    one save causes one restyle. Providers are reloaded in place rather than
+    removed and re-added.
+
+    The "restyle-time" property holds the milliseconds from the last reload
+    until the next painted frame, parse included.
+
+    Example usage:
+
+    ```python
+    stylesheets = StyleSheetManager("main.css", extra=["styles/audio.css"])
+    stylesheets.load()
+    stylesheets.watch(windows)
+    ```
+    """
+
+    __gproperties__ = {
+        'restyle-time': (
+            float, 'Restyle time', 'Milliseconds from the last reload to the next frame',
+            0.0, GLib.MAXDOUBLE, 0.0, GObject.ParamFlags.READABLE
+        ),
+        'reload-count': (
+            int, 'Reload count', 'Stylesheet reloads since startup',
+            0, GLib.MAXINT, 0, GObject.ParamFlags.READABLE
+        ),
+    }
+
+    def __init__(self, root: str = "main.css", extra: Optional[list[str]] = None,
+                 priority: int = Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION):
+        super().__init__()
+        self._root = root
+        self._extra = list(extra or [])
+        self._priority = priority
+        self._display = Gdk.Display.get_default()
+        self._providers: dict[str, Gtk.CssProvider] = {}  # path -> provider, in cascade order
+        self._monitors: dict[str, Gio.FileMonitor] = {}
+        self._debounce_ids: dict[str, int] = {}
+        self._windows = []
+        self._restyle_time = 0.0
+        self._reload_count = 0
+
+    def do_get_property(self, prop):
+        if prop.name == 'restyle-time':
+            return self._restyle_time
+        elif prop.name == 'reload-count':
+            return self._reload_count
+        raise AttributeError(f'Unknown property {prop.name}')
+
+    @property
+    def files(self) -> list[str]:
+        return list(self._providers)
+
+    def load(self) -> bool:
+        """Create and load the providers. Returns False if the root failed to load."""
+        imports, _rules = self._parse_root()
+        for path in imports + [self._root] + self._extra:
+            if path not in self._providers:
+                self._add_provider(path)
+        return self._root in self._providers
+
+    def watch(self, windows: list):
+        """Monitor every loaded file; `windows` are used to time restyles."""
+        self._windows = windows
+        for path in self._providers:
+            self._monitor(path)
+
+    # --- Providers ---
+
+    def _parse_root(self) -> tuple[list[str], str]:
+        """Return the root's import paths (relative to it) and its remaining rules."""
+        try:
+            with open(self._root) as f:
+                text = f.read()
+        except OSError as e:
+            print(f"Error reading {self._root}: {e}")
+            return [], ""
+        base = os.path.dirname(self._root)
+        imports = [os.path.normpath(os.path.join(base, path)) for path in IMPORT_RE.findall(text)]
+        return imports, IMPORT_RE.sub("", text)
+
+    def _add_provider(self, path: str):
+        provider = Gtk.CssProvider()
+        provider.connect("parsing-error", self._on_parsing_error, path)
+        if not self._load_into(provider, path):
+            return
+        self._providers[path] = provider
+        Gtk.StyleContext.add_provider_for_display(self._display, provider, self._priority)
+
+    def _remove_provider(self, path: str):
+        provider = self._providers.pop(path, None)
+        if provider is not None:
+            Gtk.StyleContext.remove_provider_for_display(self._display, provider)
+        monitor = self._monitors.pop(path, None)
+        if monitor is not None:
+            monitor.cancel()
+
+    def _load_into(self, provider: Gtk.CssProvider, path: str) -> bool:
+        try:
+            if path == self._root:
+                # The imports have providers of their own, only load the root's rules
+                provider.load_from_string(self._parse_root()[1])
+            else:
+                provider.load_from_path(path)
+        except GLib.Error as e:
+            print(f"Error loading CSS from {path}: {e}")
+            return False
+        return True
+
+    def _on_parsing_error(self, provider, section, error, path):
+        location = section.get_start_location()
+        print(f"CSS error in {path}:{location.lines + 1}: {error.message}")
+
+    # --- Hot reload ---
+
+    def _monitor(self, path: str):
+        if path in self._monitors:
+            return
+        monitor = Gio.File.new_for_path(path).monitor_file(Gio.FileMonitorFlags.NONE, None)
+        monitor.connect("changed", self._on_file_changed, path)
+        self._monitors[path] = monitor
+
+    def _on_file_changed(self, monitor, file, other_file, event_type, path):
+        if event_type == Gio.FileMonitorEvent.CHANGES_DONE_HINT:
+            self._cancel_debounce(path)
+            self._reload(path)
+        elif event_type in (Gio.FileMonitorEvent.CHANGED, Gio.FileMonitorEvent.CREATED):
+            # Editors that replace the file by rename never send CHANGES_DONE_HINT
+            self._cancel_debounce(path)
+            self._debounce_ids[path] = GLib.timeout_add(
+                PowerProfile.get_default().debounce(DEBOUNCE_MS), self._on_debounce_timeout, path
+            )
+
+    def _cancel_debounce(self, path: str):
+        source_id = self._debounce_ids.pop(path, None)
+        if source_id is not None:
+            GLib.source_remove(source_id)
+
+    def _on_debounce_timeout(self, path: str):
+        self._debounce_ids.pop(path, None)
+        self._reload(path)
+        return False
+
+    def _reload(self, path: str):
+        provider = self._providers.get(path)
+        if provider is None:
+            return
+        start = time.perf_counter()
+        rebuilt = path == self._root and self._sync_imports()
+        if not rebuilt and not self._load_into(provider, path):
+            return
+        self._reload_count += 1
+        RELOADS.inc()
+        self.notify('reload-count')
+        print(f"CSS reloaded from {path}")
+        self._measure_restyle(start)
+
+    def _sync_imports(self) -> bool:
+        """Follow @import lines added to or removed from the root. Returns True if rebuilt."""
+        imports, _rules = self._parse_root()
+        for path in list(self._providers):
+            if path not in imports and path != self._root and path not in self._extra:
+                self._remove_provider(path)
+        if any(path not in self._providers for path in imports):
+            # New imports must come before the root's rules, so rebuild in order
+            for path in list(self._providers):
+                self._remove_provider(path)
+            self.load()
+            self.watch(self._windows)
+            return True
+        return False
+
+    def _measure_restyle(self, start: float):
+        window = next((w for w in self._windows if w.get_mapped()), None)
+        frame_clock = window.get_frame_clock() if window else None
+        if frame_clock is None:
+            self._set_restyle_time((time.perf_counter() - start) * 1000)
+            return
+
+        def on_after_paint(clock):
+            clock.disconnect(handler)
+            self._set_restyle_time((time.perf_counter() - start) * 1000)
+
+        handler = frame_clock.connect("after-paint", on_after_paint)
+        window.queue_draw()
+
+    def _set_restyle_time(self, ms: float):
+        self._restyle_time = ms
+        RESTYLE_MS.observe(ms)
+        self.notify('restyle-time')
+        print(f"Restyle took {ms:.1f} ms")
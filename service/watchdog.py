@@ -0,0 +1,233 @@
+"""
+Main-loop stall watchdog.
+
+Enabled with `--watchdog` or `HYPRGTK4_WATCHDOG=1` (or a threshold in
+milliseconds instead of 1), or at runtime with `watchdog start [ms]` on the
+control socket. `watchdog` returns the report as JSON.
+"""
+import bisect
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Optional
+import gi
+
+gi.require_version('GLib', '2.0')
+
+from gi.repository import GLib
+from loguru import logger
+
+from .metrics import TrackedCallback
+
+WATCHDOG_ENV = "HYPRGTK4_WATCHDOG"
+WATCHDOG_FLAG = "--watchdog"
+DEFAULT_THRESHOLD_MS = 50
+HISTOGRAM_BOUNDS_MS = (1, 2, 4, 8, 16, 33, 50, 100, 250, 500, 1000)  # upper bounds; the last bucket is open
+MAX_STALLS = 50  # most recent stalls kept with their stacks
+STACK_DEPTH = 20
+
+
+class _HeartbeatSource(GLib.Source):
+    """
+    Never dispatches; GLib calls `check` right after the main context wakes
+    from poll and `prepare` before it polls again. The time in between is
+    one busy iteration. Costs no wakeups of its own.
+    """
+
+    def __init__(self, watchdog: 'Watchdog'):
+        super().__init__()
+        self.watchdog = watchdog
+
+    def prepare(self):
+        self.watchdog._iteration_done()
+        return False, -1
+
+    def check(self):
+        self.watchdog._iteration_started()
+        return False
+
+    def dispatch(self, callback, args):
+        return GLib.SOURCE_CONTINUE
+
+
+class Watchdog:
+    """
+    Finds what blocks the GTK main thread.
+
+    A heartbeat source times every main-loop iteration into a histogram. A
+    monitor thread polls the heartbeat, and when an iteration runs longer
+    than `threshold_ms` it captures the main thread's Python stack with
+    `sys._current_frames()`. The outermost frame below the main loop is the
+    callback GLib dispatched, which is what each stall is attributed to.
+
+    Example usage:
+
+    ```python
+    watchdog = Watchdog.get_default()
+    watchdog.start(16)
+    ...
+    print(watchdog.report())
+    ```
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_default(cls) -> 'Watchdog':
+        """Get the watchdog of the default main context."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def threshold_from_environment() -> Optional[float]:
+        """The threshold requested by `--watchdog` or the environment, or None if disabled."""
+        value = os.getenv(WATCHDOG_ENV)
+        if WATCHDOG_FLAG in sys.argv:
+            sys.argv.remove(WATCHDOG_FLAG)
+            value = value or "1"
+        if not value or value == "0":
+            return None
+        try:
+            return DEFAULT_THRESHOLD_MS if value == "1" else float(value)
+        except ValueError:
+            print(f"Invalid {WATCHDOG_ENV} value '{value}', using {DEFAULT_THRESHOLD_MS} ms")
+            return DEFAULT_THRESHOLD_MS
+
+    def __init__(self):
+        self.threshold_ms = DEFAULT_THRESHOLD_MS
+        self._source = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._main_thread_id = threading.main_thread().ident
+        self._busy_since = None  # monotonic seconds, set while an iteration runs
+        self._iteration = 0
+        self._sample = None  # (iteration, callback, stack) for the running stall
+        self.reset()
+
+    @property
+    def running(self) -> bool:
+        return self._source is not None
+
+    def reset(self):
+        """Forget the recorded iterations and stalls."""
+        self._histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self._callbacks: dict[str, list] = {}  # callback -> [count, total_ms, max_ms]
+        self._stalls = deque(maxlen=MAX_STALLS)
+        self._started_at = time.monotonic()
+
+    def start(self, threshold_ms: Optional[float] = None):
+        """Start watching the main context; stalls over `threshold_ms` are recorded."""
+        if threshold_ms is not None:
+            if threshold_ms <= 0:
+                raise ValueError("threshold must be positive")
+            self.threshold_ms = threshold_ms
+        if self.running:
+            return
+        self._source = _HeartbeatSource(self)
+        # Above every other source, so it is prepared and checked every iteration
+        self._source.set_priority(GLib.PRIORITY_HIGH - 1000)
+        self._source.attach(GLib.MainContext.default())
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._monitor, name="watchdog", daemon=True)
+        self._thread.start()
+        logger.info(f"[Watchdog] Watching the main loop for stalls over {self.threshold_ms:g} ms")
+
+    def stop(self):
+        if not self.running:
+            return
+        self._source.destroy()
+        self._source = None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._busy_since = None
+
+    # --- Main thread ---
+
+    def _iteration_started(self):
+        self._iteration += 1
+        self._busy_since = time.monotonic()
+
+    def _iteration_done(self):
+        started = self._busy_since
+        if started is None:
+            return
+        self._busy_since = None
+        duration_ms = (time.monotonic() - started) * 1000
+        self._histogram[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, duration_ms)] += 1
+        if duration_ms < self.threshold_ms:
+            return
+
+        sample, self._sample = self._sample, None
+        if sample is not None and sample[0] == self._iteration:
+            callback, stack = sample[1], sample[2]
+        else:
+            # Ended between two polls of the monitor thread
+            callback, stack = "<unknown>", []
+        entry = self._callbacks.setdefault(callback, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += duration_ms
+        entry[2] = max(entry[2], duration_ms)
+        self._stalls.append({
+            "time": time.time(),
+            "duration_ms": round(duration_ms, 1),
+            "callback": callback,
+            "stack": stack,
+        })
+        logger.warning(f"[Watchdog] Main loop blocked for {duration_ms:.0f} ms in {callback}")
+
+    # --- Monitor thread ---
+
+    def _monitor(self):
+        while not self._stop.wait(self.threshold_ms / 4000):
+            started, iteration = self._busy_since, self._iteration
+            if started is None or (self._sample is not None and self._sample[0] == iteration):
+                continue
+            if (time.monotonic() - started) * 1000 < self.threshold_ms:
+                continue
+            frame = sys._current_frames().get(self._main_thread_id)
+            if frame is not None:
+                self._sample = (iteration, *self._describe(frame))
+
+    @staticmethod
+    def _describe(frame) -> tuple[str, list[str]]:
+        """The dispatched callback and the innermost frames of `frame`'s stack."""
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        # The outermost frame entered the main loop (app.run); the next one is
+        # the callback GLib dispatched, unless the source tracker wrapped it
+        index = -2 if len(frames) > 1 else -1
+        if frames[index].f_code is TrackedCallback.__call__.__code__ and len(frames) > 2:
+            index -= 1
+        code = frames[index].f_code
+        callback = f"{code.co_qualname} ({os.path.relpath(code.co_filename)}:{code.co_firstlineno})"
+        stack = [
+            f"{os.path.relpath(entry.filename)}:{entry.lineno} {entry.name}"
+            for entry in traceback.extract_stack(frames[0], limit=STACK_DEPTH)
+        ]
+        return callback, stack
+
+    # --- Report ---
+
+    def report(self, stalls: int = 10) -> dict:
+        """Histogram, worst callbacks and the most recent `stalls` stalls."""
+        labels = [f"<{bound}ms" for bound in HISTOGRAM_BOUNDS_MS] + [f">={HISTOGRAM_BOUNDS_MS[-1]}ms"]
+        callbacks = sorted(self._callbacks.items(), key=lambda item: item[1][1], reverse=True)
+        return {
+            "running": self.running,
+            "threshold_ms": self.threshold_ms,
+            "seconds": round(time.monotonic() - self._started_at, 1),
+            "iterations": dict(zip(labels, self._histogram)),
+            "callbacks": [
+                {"callback": name, "stalls": count, "total_ms": round(total, 1), "max_ms": round(worst, 1)}
+                for name, (count, total, worst) in callbacks
+            ],
+            "stalls": list(self._stalls)[-stalls:] if stalls else [],
+        }
+
@@ -2,6 +2,7 @@ import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, Gdk, GObject, GLib
 import math
+from service.power import PowerProfile
 
 class CustomProgressBar(Gtk.Box):
     __gsignals__ = {
@@ -87,8 +88,8 @@ class CustomProgressBar(Gtk.Box):
         self._target_fraction = target_fraction
         self._animation_start_time = GLib.get_monotonic_time() / 1000
         
-        # Start animation loop (60 FPS)
-        self._animation_timeout_id = GLib.timeout_add(16, self._animate_step)
+        # Start animation loop (60 FPS, 30 FPS in the reduced power profile)
+        self._animation_timeout_id = GLib.timeout_add(PowerProfile.get_default().frame_interval, self._animate_step)
     
     def update_size(self):
         """Update the inner box width based on the current fraction."""
@@ -0,0 +1,58 @@
+import gi
+from typing import List
+
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk, Graphene
+
+
+class Sparkline(Gtk.Widget):
+    """A line graph of recent values, scaled to fill the widget and drawn in the CSS color"""
+
+    __gtype_name__ = 'Sparkline'
+
+    def __init__(self, line_width: float = 1.5, fill_alpha: float = 0.2, **kwargs):
+        super().__init__(**kwargs)
+        self._values: List[float] = []
+        self._line_width = line_width
+        self._fill_alpha = fill_alpha
+        self.set_size_request(120, 32)
+
+    def set_values(self, values: List[float]):
+        """Replace the plotted values, oldest first"""
+        self._values = list(values)
+        self.queue_draw()
+
+    def do_snapshot(self, snapshot: Gtk.Snapshot):
+        """Draw the values as a line over a translucent fill"""
+        width = self.get_width()
+        height = self.get_height()
+        values = self._values
+        if width <= 0 or height <= 0 or len(values) < 2:
+            return
+
+        low = min(values)
+        span = (max(values) - low) or 1.0
+        inset = self._line_width / 2
+        step = (width - 2 * inset) / (len(values) - 1)
+
+        def y(value):
+            return height - inset - (value - low) / span * (height - 2 * inset)
+
+        cairo_context = snapshot.append_cairo(
+            Graphene.Rect().init(0, 0, width, height)
+        )
+        color = self.get_color()
+
+        cairo_context.move_to(inset, y(values[0]))
+        for index, value in enumerate(values[1:], 1):
+            cairo_context.line_to(inset + index * step, y(value))
+        cairo_context.set_source_rgba(color.red, color.green, color.blue, color.alpha)
+        cairo_context.set_line_width(self._line_width)
+        cairo_context.stroke_preserve()
+
+        # Close the path along the bottom edge for the fill
+        cairo_context.line_to(width - inset, height)
+        cairo_context.line_to(inset, height)
+        cairo_context.close_path()
+        cairo_context.set_source_rgba(color.red, color.green, color.blue, color.alpha * self._fill_alpha)
+        cairo_context.fill()
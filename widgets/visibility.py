@@ -0,0 +1,70 @@
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk
+from service.metrics import metrics
+
+
+class VisibilityGated:
+    """
+    Mixin for widgets that only need to render while they are shown.
+
+    A widget is shown while it is mapped and, if it is a `Gtk.Stack` page,
+    while it is the stack's visible child (an outgoing page stays mapped
+    until its transition ends). Updates passed to `defer_update` run at once
+    while shown; while hidden only the latest update per key is kept, and all
+    of them are applied in one pass when the widget is shown again.
+
+    Call `gate_updates(name)` from `__init__`; `name` labels the
+    `ui.<name>.deferred` and `ui.<name>.skipped` counters.
+
+    ```python
+    class Page(VisibilityGated, Gtk.Box):
+        def __init__(self):
+            super().__init__()
+            self.gate_updates("page")
+            service.connect("changed", lambda s: self.defer_update("changed", self.refresh))
+    ```
+    """
+
+    def gate_updates(self, name):
+        self._pending_updates = {}  # key -> (function, args), in first-deferred order
+        self._gate_stack = None
+        self._updates_deferred = metrics.counter(f"ui.{name}.deferred", f"Updates to {name} held back while hidden")
+        self._updates_skipped = metrics.counter(f"ui.{name}.skipped", f"Updates to {name} replaced before being shown")
+        self.connect("map", self._on_gate_changed)
+
+    def is_shown(self):
+        if not self.get_mapped():
+            return False
+        parent = self.get_parent()
+        return not isinstance(parent, Gtk.Stack) or parent.get_visible_child() is self
+
+    def defer_update(self, key, function, *args):
+        """
+        Run `function(*args)` now if shown, otherwise when next shown unless
+        a later update with the same `key` replaces it. Returns False, so it
+        can be passed to `GLib.idle_add`.
+        """
+        if self.is_shown():
+            function(*args)
+            return False
+        if key in self._pending_updates:
+            self._updates_skipped.inc()
+        self._updates_deferred.inc()
+        self._pending_updates[key] = (function, args)
+        return False
+
+    def flush_updates(self):
+        """Apply every update held back while hidden"""
+        pending, self._pending_updates = self._pending_updates, {}
+        for function, args in pending.values():
+            function(*args)
+
+    def _on_gate_changed(self, *_args):
+        parent = self.get_parent()
+        if self._gate_stack is None and isinstance(parent, Gtk.Stack):
+            # Pages are added to their stack after construction, so follow it from the first map
+            self._gate_stack = parent
+            parent.connect("notify::visible-child", self._on_gate_changed)
+        if self._pending_updates and self.is_shown():
+            self.flush_updates()